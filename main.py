@@ -1,55 +1,353 @@
+import time
+
+# Taken before pygame is imported so --startup-profile covers the whole launch.
+STARTED_AT = time.perf_counter()
+
+import argparse
 import pygame
+from assets import Assets
 from game_ui import GameUi
+from renderer import DirtyRectRenderer
+from text_cache import TextCache
 from betting import BettingLogic
 from gamecontroller import GameController
-from enums import GameState
+from engine import BlackjackEngine
+from frame_scheduler import FrameScheduler
+from hit_testing import ClickRegistry
+from fonts import shared_registry
+from animation import CardAnimator
+from layout import Layout
+from paths import resource_path
+
+
+def engine_attribute(name):
+    return property(
+        lambda game: getattr(game.engine, name),
+        lambda game, value: setattr(game.engine, name, value),
+    )
 
 
 class Game:
-    def __init__(self):
-        pygame.init()
+    player_credits = engine_attribute("player_credits")
+    player_bet = engine_attribute("player_bet")
+    player_score = engine_attribute("player_score")
+    dealer_score = engine_attribute("dealer_score")
+    current_phase = engine_attribute("current_phase")
+
+    def __init__(
+        self,
+        engine=None,
+        fast_start=False,
+        startup_profile=None,
+        fonts=None,
+        seats=1,
+        system_fonts=False,
+    ):
+        self.fast_start = fast_start
+        self.startup_profile = startup_profile
+        if fast_start:
+            # Audio and joystick support are never used by the table.
+            pygame.display.init()
+            pygame.font.init()
+        else:
+            pygame.init()
         self.screen_width = 1600
         self.screen_height = 900
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-        self.clock = pygame.time.Clock()
+        self.layout = Layout(self.screen_width, self.screen_height)
+        self.screen = pygame.display.set_mode(
+            (self.screen_width, self.screen_height), pygame.RESIZABLE
+        )
+        self.scheduler = FrameScheduler(fps=60)
         self.running = True
-        self.player_credits = 5000
-        self.player_bet = 0
-        self.player_score = 0
-        self.dealer_score = 0
-        self.current_phase = GameState.BETTING
+        self.engine = engine
+        if self.engine is None and seats > 1:
+            from table import TableEngine
 
-        self.background_image = pygame.image.load("img/background.jpg")
+            self.engine = TableEngine(seats, player_credits=5000)
+        if self.engine is None:
+            self.engine = BlackjackEngine(player_credits=5000)
+
+        self.background_image = pygame.image.load(resource_path("img/background.jpg"))
         self.background_scaled = pygame.transform.scale(
             self.background_image, (self.screen_width, self.screen_height)
         )
 
+        self.fonts = fonts
+        if self.fonts is None:
+            self.fonts = shared_registry(use_system_fonts=system_fonts)
+        self.assets = Assets()
+        self.text_cache = TextCache()
+        self.click_registry = ClickRegistry()
+        self.animator = CardAnimator(self.scheduler)
         self.game_ui = GameUi(self)
         self.betting_logic = BettingLogic(self, self.game_ui.chip_rects)
-        self.game_controller = GameController(self, self.game_ui.button_rects)
+        if seats > 1:
+            from table_controller import TableController
+
+            self.game_controller = TableController(self, self.game_ui.button_rects)
+        else:
+            self.game_controller = GameController(self, self.game_ui.button_rects)
+        self.renderer = DirtyRectRenderer(self.screen)
+        self.instrumentation = None
+        self.profiler = None
+        self.profiler_overlay = None
+        self.last_action = None
+
+    def enable_instrumentation(self):
+        from instrumentation import Instrumentation
+
+        self.instrumentation = Instrumentation(self)
+        self.instrumentation.install()
+        return self.instrumentation
+
+    def enable_profiler(self, interval=0.001):
+        from profiler import ProfilerOverlay, SamplingProfiler
+
+        self.profiler = SamplingProfiler(self.scheduler.frame_time, interval)
+        self.profiler_overlay = ProfilerOverlay(self, self.profiler)
+        self.profiler.start()
+        return self.profiler
+
+    def resize(self, width, height):
+        if (width, height) == (self.screen_width, self.screen_height):
+            return
+
+        self.screen_width = width
+        self.screen_height = height
+        self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        self.layout = Layout(width, height)
+        self.background_scaled = pygame.transform.scale(
+            self.background_image, (width, height)
+        )
+        self.assets.clear_scaled()
+
+        self.game_ui.apply_layout()
+        self.betting_logic.register_chips()
+        self.game_controller.apply_layout()
+        self.renderer.screen = self.screen
+        self.renderer.invalidate_all()
+        self.scheduler.request_redraw()
 
     def close_game(self):
         self.running = False
 
+    def render(self):
+        self.animator.update(pygame.time.get_ticks())
+        self.game_ui.track_regions(self.renderer)
+        self.game_controller.track_regions(self.renderer)
+        draw_callbacks = [self.game_ui.draw, self.game_controller.draw]
+        if self.instrumentation is not None:
+            self.instrumentation.track_regions(self.renderer)
+            draw_callbacks.append(self.instrumentation.draw)
+        if self.profiler_overlay is not None:
+            self.profiler_overlay.track_regions(self.renderer)
+            draw_callbacks.append(self.profiler_overlay.draw)
+        return self.renderer.render(draw_callbacks)
+
+    def wait_for_event(self):
+        timeout = self.scheduler.wait_timeout(pygame.time.get_ticks())
+        if timeout is None:
+            return pygame.event.wait()
+        if timeout == 0:
+            return pygame.event.poll()
+        return pygame.event.wait(timeout)
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.close_game()
+        if event.type == pygame.VIDEORESIZE:
+            self.resize(event.w, event.h)
+        if event.type == pygame.WINDOWEXPOSED:
+            self.renderer.invalidate_all()
+            self.scheduler.request_redraw()
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            if self.instrumentation is not None:
+                self.instrumentation.toggle_overlay()
+                self.scheduler.request_redraw()
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            widget = self.click_registry.dispatch(event.pos, self.current_phase)
+            if widget is not None:
+                self.last_action = widget.name
+                self.scheduler.request_redraw()
+
     def run(self):
+        self.renderer.invalidate_all()
+        self.render()
+        self.scheduler.frame_done(pygame.time.get_ticks())
+        if self.startup_profile is not None:
+            self.startup_profile.mark("first frame")
+            print(self.startup_profile.report())
+
         while self.running:
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.close_game()
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    mouse_position = pygame.mouse.get_pos()
-                    self.betting_logic.check_chip_clicked(mouse_position)
-                    self.game_controller.check_buttons_clicked(mouse_position)
-                    self.game_ui.draw()
-                    self.game_controller.draw()
+            event = self.wait_for_event()
+            if self.profiler is not None:
+                self.profiler.begin_frame()
+            self.handle_event(event)
+            for event in pygame.event.get():
+                self.handle_event(event)
 
-                pygame.display.flip()
-                self.clock.tick(60)
+            now = pygame.time.get_ticks()
+            if self.scheduler.frame_due(now):
+                self.render()
+                self.scheduler.frame_done(now)
+            if self.profiler is not None:
+                self.profiler.end_frame(self.current_phase, self.last_action)
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Blackjack")
+    parser.add_argument("--connect", help="play on a table server at HOST:PORT")
+    parser.add_argument("--unix-socket", help="play on a table server socket")
+    parser.add_argument("--history", help="append every round to this hand log")
+    parser.add_argument("--replay", help="show the rounds of a hand log")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed")
+    parser.add_argument(
+        "--session", default="blackjack.db", help="sqlite file for saved credits"
+    )
+    parser.add_argument("--player", default="player", help="saved session name")
+    parser.add_argument(
+        "--no-session", action="store_true", help="start fresh and save nothing"
+    )
+    parser.add_argument(
+        "--instrument", action="store_true", help="time hot paths, F3 shows them"
+    )
+    parser.add_argument("--instrument-dump", help="write the timings to this file")
+    parser.add_argument(
+        "--profile", action="store_true", help="sample the main loop for stutters"
+    )
+    parser.add_argument(
+        "--profile-output",
+        default="profile.folded",
+        help="collapsed stacks for flamegraph.pl or speedscope",
+    )
+    parser.add_argument(
+        "--fast-start", action="store_true", help="skip audio and joystick setup"
+    )
+    parser.add_argument(
+        "--system-fonts",
+        action="store_true",
+        help="look fonts up in the system font directories",
+    )
+    parser.add_argument(
+        "--startup-profile", action="store_true", help="report time to first frame"
+    )
+    parser.add_argument(
+        "--seats",
+        type=int,
+        default=1,
+        choices=range(1, 8),
+        help="play up to 7 hands at once",
+    )
+    arguments = parser.parse_args(argv)
+    if arguments.speed <= 0:
+        parser.error("--speed must be greater than zero")
+    remote = arguments.connect or arguments.unix_socket
+    if arguments.seats > 1 and remote:
+        parser.error("--seats is only available on a local table")
+    if arguments.history and remote:
+        parser.error("--history is only available on a local table")
+    if arguments.history and arguments.seats > 1:
+        # Hand logs hold one seat's rounds in single-seat dealing order, which
+        # the replayer relies on to rebuild the shoe.
+        parser.error("--history can only record a single seat")
+    return arguments
+
+
+def create_engine(arguments, session=None):
+    if not arguments.connect and not arguments.unix_socket:
+        if session is None:
+            return None
+        player_credits = session.resume(5000)
+        if arguments.seats > 1:
+            from table import TableEngine
+
+            engine = TableEngine(arguments.seats, player_credits=player_credits)
+        else:
+            engine = BlackjackEngine(player_credits=player_credits)
+        engine.round_listeners.append(session)
+        return engine
+
+    from client import RemoteEngine
+
+    if arguments.unix_socket:
+        return RemoteEngine(unix_socket=arguments.unix_socket)
+    host, port = arguments.connect.rsplit(":", 1)
+    return RemoteEngine(host, int(port))
+
+
+def show_replay(arguments):
+    from hand_history import HandHistoryReader
+    from replay import print_report, render_replay, starting_credits
+
+    reader = HandHistoryReader(arguments.replay)
+    records = list(reader)
+    reader.close()
+    if not records:
+        print(f"no rounds to replay in {arguments.replay}")
+        return
+
+    game = Game(BlackjackEngine(player_credits=starting_credits(records)))
+    print_report(render_replay(game, records, arguments.speed))
 
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    arguments = parse_arguments()
+    startup_profile = None
+    if arguments.startup_profile:
+        from startup import StartupProfile
+
+        startup_profile = StartupProfile(STARTED_AT)
+        startup_profile.mark("imports")
+    if arguments.replay:
+        show_replay(arguments)
+        pygame.quit()
+        raise SystemExit
+
+    session = None
+    if not arguments.no_session and not (arguments.connect or arguments.unix_socket):
+        from persistence import SessionStore
+
+        session = SessionStore(arguments.session, arguments.player)
+
+    game = Game(
+        create_engine(arguments, session),
+        fast_start=arguments.fast_start,
+        startup_profile=startup_profile,
+        seats=arguments.seats,
+        system_fonts=arguments.system_fonts,
+    )
+    if startup_profile is not None:
+        startup_profile.mark("game setup")
+
+    history = None
+    if arguments.history:
+        from hand_history import HandHistoryWriter
+
+        history = HandHistoryWriter(arguments.history)
+        game.engine.round_listeners.append(history)
+
+    if arguments.instrument or arguments.instrument_dump:
+        game.enable_instrumentation()
+
+    if arguments.profile:
+        game.enable_profiler()
+
+    try:
+        game.run()
+
+        if arguments.instrument_dump:
+            game.instrumentation.dump(arguments.instrument_dump)
 
+        if game.profiler is not None:
+            game.profiler.stop()
+            game.profiler.write_collapsed(arguments.profile_output)
+            for slow_frame in list(game.profiler.slow_frames)[-20:]:
+                print("slow frame: " + slow_frame.describe())
+    finally:
+        # Buffered hand history and session rounds are flushed even when the
+        # loop dies, so an exception never loses logged rounds.
+        if history is not None:
+            history.close()
+        if session is not None:
+            session.close()
     pygame.quit()
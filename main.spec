@@ -3,14 +3,23 @@
 
 a = Analysis(
     ['main.py'],
-    pathex=[],
+    pathex=['src'],
     binaries=[],
-    datas=[],
+    datas=[
+        ('img/atlas.png', 'img'),
+        ('img/atlas.json', 'img'),
+        ('img/background.jpg', 'img'),
+        ('data/advisor.json', 'data'),
+        ('data/dealer_odds.json', 'data'),
+        ('fonts/LiberationSans-Regular.ttf', 'fonts'),
+        ('fonts/LiberationSans-Bold.ttf', 'fonts'),
+        ('fonts/OFL.txt', 'fonts'),
+    ],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['numpy', 'tkinter'],
     noarchive=False,
     optimize=0,
 )
@@ -19,16 +28,13 @@ pyz = PYZ(a.pure)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='main',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -36,3 +42,12 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='main',
+)
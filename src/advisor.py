@@ -0,0 +1,103 @@
+import json
+import os
+from dealer_odds import BUST, CARD_VALUE_ORDER, INFINITE_DECK, dealer_odds
+from paths import resource_path
+
+ADVISOR_TABLE = resource_path("data/advisor.json")
+UPCARDS = range(12)
+TOTALS = range(22)
+
+
+def stand_value(player_total, upcard):
+    results = dealer_odds(upcard)
+    value = results[BUST]
+    for result, probability in enumerate(results[:BUST]):
+        dealer_total = 17 + result
+        if player_total > dealer_total:
+            value += probability
+        elif player_total < dealer_total:
+            value -= probability
+    return value
+
+
+def hit_value(player_total, soft, upcard, card_chances, best):
+    value = 0.0
+    for card_value, chance in zip(CARD_VALUE_ORDER, card_chances):
+        new_total = player_total + card_value
+        soft_aces = soft + (card_value == 11)
+        while new_total > 21 and soft_aces:
+            new_total -= 10
+            soft_aces -= 1
+        if new_total > 21:
+            value -= chance
+        else:
+            value += chance * best_value(
+                new_total, int(soft_aces > 0), upcard, card_chances, best
+            )
+    return value
+
+
+def best_value(player_total, soft, upcard, card_chances, best):
+    key = (player_total, soft, upcard)
+    if key not in best:
+        best[key] = max(
+            stand_value(player_total, upcard),
+            hit_value(player_total, soft, upcard, card_chances, best),
+        )
+    return best[key]
+
+
+def build_tables():
+    card_chances = [count / sum(INFINITE_DECK) for count in INFINITE_DECK]
+    stand = [[0.0 for _ in UPCARDS] for _ in TOTALS]
+    hit = [[[0.0 for _ in UPCARDS] for _ in TOTALS] for _ in range(2)]
+    best = {}
+
+    for upcard in CARD_VALUE_ORDER:
+        for total in TOTALS:
+            stand[total][upcard] = stand_value(total, upcard)
+            for soft in (0, 1):
+                hit[soft][total][upcard] = hit_value(
+                    total, soft, upcard, card_chances, best
+                )
+    return {"stand": stand, "hit": hit}
+
+
+def save_tables(tables, path=ADVISOR_TABLE):
+    with open(path, "w") as table_file:
+        json.dump(tables, table_file)
+
+
+def load_tables(path=ADVISOR_TABLE):
+    if os.path.exists(path):
+        with open(path) as table_file:
+            return json.load(table_file)
+
+    tables = build_tables()
+    try:
+        save_tables(tables, path)
+    except OSError:
+        pass
+    return tables
+
+
+TABLES = load_tables()
+STAND = TABLES["stand"]
+HIT = TABLES["hit"]
+
+
+def expected_values(player_total, soft, upcard):
+    return HIT[int(soft)][player_total][upcard], STAND[player_total][upcard]
+
+
+def advise(player_total, soft, upcard):
+    if player_total > 21:
+        return None
+
+    hit_value, stand_value = expected_values(player_total, soft, upcard)
+    action = "hit" if hit_value > stand_value else "stand"
+    return action, hit_value, stand_value
+
+
+if __name__ == "__main__":
+    save_tables(build_tables())
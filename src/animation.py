@@ -0,0 +1,111 @@
+HIDDEN_CARD = "back_dark"
+SHOE_POSITION = (1400, 100)
+DEAL_DURATION = 300
+DEAL_STAGGER = 120
+FLIP_DURATION = 250
+
+
+def ease_out(progress):
+    return 1 - (1 - progress) ** 3
+
+
+class Tween:
+    __slots__ = ("start", "end", "duration", "elapsed")
+
+    def __init__(self, start, end, duration, delay=0):
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.elapsed = -delay
+
+    @property
+    def progress(self):
+        return min(1.0, max(0.0, self.elapsed / self.duration))
+
+    @property
+    def finished(self):
+        return self.elapsed >= self.duration
+
+    def advance(self, milliseconds):
+        self.elapsed += milliseconds
+
+    def value(self):
+        eased = ease_out(self.progress)
+        return tuple(
+            round(start + (end - start) * eased)
+            for start, end in zip(self.start, self.end)
+        )
+
+
+class CardAnimator:
+    def __init__(self, scheduler=None, shoe_position=SHOE_POSITION):
+        self.scheduler = scheduler
+        self.shoe_position = shoe_position
+        self.names = {}
+        self.moves = {}
+        self.flips = {}
+        self.last_update = None
+
+    @property
+    def active(self):
+        return bool(self.moves or self.flips)
+
+    def sync(self, cards):
+        # Cards are compared with what was on the table at the previous frame,
+        # so the engine never has to know that anything is being animated.
+        seen = set()
+        dealt = 0
+        for key, name, target in cards:
+            seen.add(key)
+            previous = self.names.get(key)
+            if previous == HIDDEN_CARD and name != HIDDEN_CARD:
+                self.flips[key] = Tween((0,), (1,), FLIP_DURATION)
+            elif previous != name:
+                self.moves[key] = Tween(
+                    self.shoe_position, target, DEAL_DURATION, DEAL_STAGGER * dealt
+                )
+                dealt += 1
+            elif key in self.moves:
+                self.moves[key].end = target
+            self.names[key] = name
+
+        for key in list(self.names):
+            if key not in seen:
+                del self.names[key]
+                self.moves.pop(key, None)
+                self.flips.pop(key, None)
+        self.notify_scheduler()
+
+    def update(self, now):
+        milliseconds = 0 if self.last_update is None else now - self.last_update
+        self.last_update = now
+        for tweens in (self.moves, self.flips):
+            for key in list(tweens):
+                tween = tweens[key]
+                tween.advance(milliseconds)
+                if tween.finished:
+                    del tweens[key]
+        self.notify_scheduler()
+
+    def finish(self):
+        self.moves.clear()
+        self.flips.clear()
+        self.notify_scheduler()
+
+    def notify_scheduler(self):
+        if self.scheduler is not None:
+            self.scheduler.set_animating(self.active)
+
+    def sprite(self, key, name, target):
+        move = self.moves.get(key)
+        position = move.value() if move is not None else target
+
+        # A flip shrinks the back of the card to nothing and then grows the
+        # face back out, which reads as a turn without needing 3D transforms.
+        flip = self.flips.get(key)
+        if flip is None:
+            return name, position, 1.0
+        progress = ease_out(flip.progress)
+        if progress < 0.5:
+            return HIDDEN_CARD, position, 1 - progress * 2
+        return name, position, progress * 2 - 1
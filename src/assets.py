@@ -0,0 +1,88 @@
+import json
+import os
+import pygame
+from cards import CARD_NAMES
+from paths import resource_path
+
+ATLAS_IMAGE = resource_path("img/atlas.png")
+ATLAS_INDEX = resource_path("img/atlas.json")
+
+
+class Assets:
+    CARD_SIZE = (146, 205)
+    CHIP_SIZE = (80, 80)
+    CARD_DIRECTORY = resource_path("img/playing-cards-master")
+    CHIP_DIRECTORY = resource_path("img/chips")
+    BACKS = ["back_dark", "back_light"]
+    CHIPS = ["one", "five", "ten", "twentyfive", "fifty", "onehundred"]
+
+    def __init__(self, atlas_image=ATLAS_IMAGE, atlas_index=ATLAS_INDEX):
+        self.atlas = None
+        self.cards = {}
+        self.chips = {}
+        self.scaled_images = {}
+
+        if os.path.exists(atlas_image) and os.path.exists(atlas_index):
+            self.load_atlas(atlas_image, atlas_index)
+        else:
+            self.load_cards()
+            self.load_chips()
+
+    @classmethod
+    def card_names(cls):
+        return CARD_NAMES + cls.BACKS
+
+    def load_atlas(self, atlas_image, atlas_index):
+        with open(atlas_index) as index_file:
+            index = json.load(index_file)
+
+        self.atlas = self.convert(pygame.image.load(atlas_image))
+
+        # Subsurfaces share pixels with the atlas, so slicing copies nothing.
+        for name, rect in index["cards"].items():
+            self.cards[name] = self.atlas.subsurface(pygame.Rect(rect))
+        for name, rect in index["chips"].items():
+            self.chips[name] = self.atlas.subsurface(pygame.Rect(rect))
+
+    def load_cards(self):
+        for name in self.card_names():
+            self.cards[name] = self.load_image(
+                f"{self.CARD_DIRECTORY}/{name}.png", self.CARD_SIZE
+            )
+
+    def load_chips(self):
+        for name in self.CHIPS:
+            self.chips[name] = self.load_image(
+                f"{self.CHIP_DIRECTORY}/{name}_chip.png", self.CHIP_SIZE
+            )
+
+    def load_image(self, path, size):
+        image = self.convert(pygame.image.load(path))
+        return pygame.transform.scale(image, size)
+
+    def convert(self, image):
+        if pygame.display.get_surface() is not None:
+            return image.convert_alpha()
+        return image
+
+    def card(self, name, size=None):
+        return self.scaled(self.cards[name], name, size)
+
+    def chip(self, name, size=None):
+        return self.scaled(self.chips[name], name, size)
+
+    def scaled(self, image, name, size):
+        if size is None or size == image.get_size():
+            return image
+
+        # Keyed by size first, so each resolution scales every image once and
+        # a resize can drop the old set in one go.
+        images = self.scaled_images.setdefault(size, {})
+        scaled_image = images.get(name)
+        if scaled_image is None:
+            scaled_image = pygame.transform.smoothscale(image, size)
+            images[name] = scaled_image
+        return scaled_image
+
+    def clear_scaled(self):
+        self.scaled_images.clear()
@@ -0,0 +1,60 @@
+import json
+import pygame
+from assets import Assets, ATLAS_IMAGE, ATLAS_INDEX
+
+CARD_COLUMNS = 14
+
+
+def atlas_sources():
+    sources = []
+    for name in Assets.card_names():
+        sources.append(
+            ("cards", name, f"{Assets.CARD_DIRECTORY}/{name}.png", Assets.CARD_SIZE)
+        )
+    for name in Assets.CHIPS:
+        sources.append(
+            (
+                "chips",
+                name,
+                f"{Assets.CHIP_DIRECTORY}/{name}_chip.png",
+                Assets.CHIP_SIZE,
+            )
+        )
+    return sources
+
+
+def build_atlas(image_path=ATLAS_IMAGE, index_path=ATLAS_INDEX):
+    card_width, card_height = Assets.CARD_SIZE
+    chip_width, chip_height = Assets.CHIP_SIZE
+    sources = atlas_sources()
+    card_count = sum(1 for source in sources if source[0] == "cards")
+    card_rows = -(-card_count // CARD_COLUMNS)
+
+    width = max(CARD_COLUMNS * card_width, len(Assets.CHIPS) * chip_width)
+    height = card_rows * card_height + chip_height
+    atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+    index = {"cards": {}, "chips": {}}
+
+    card_number = 0
+    chip_number = 0
+    for group, name, path, size in sources:
+        if group == "cards":
+            x = (card_number % CARD_COLUMNS) * card_width
+            y = (card_number // CARD_COLUMNS) * card_height
+            card_number += 1
+        else:
+            x = chip_number * chip_width
+            y = card_rows * card_height
+            chip_number += 1
+        image = pygame.transform.scale(pygame.image.load(path), size)
+        atlas.blit(image, (x, y))
+        index[group][name] = [x, y, size[0], size[1]]
+
+    pygame.image.save(atlas, image_path)
+    with open(index_path, "w") as index_file:
+        json.dump(index, index_file)
+    return index
+
+
+if __name__ == "__main__":
+    build_atlas()
@@ -0,0 +1,158 @@
+import numpy as np
+from cards import CARD_VALUES as CARD_VALUE_TABLE
+from enums import GameState
+
+OUTCOMES = [
+    GameState.BUSTED,
+    GameState.BLACKJACK,
+    GameState.DRAW,
+    GameState.DEALER_BLACKJACK,
+    GameState.DEALER_BUSTED,
+    GameState.PLAYER_WON,
+    GameState.DEALER_WON,
+]
+BUSTED = OUTCOMES.index(GameState.BUSTED)
+BLACKJACK = OUTCOMES.index(GameState.BLACKJACK)
+DRAW = OUTCOMES.index(GameState.DRAW)
+DEALER_BLACKJACK = OUTCOMES.index(GameState.DEALER_BLACKJACK)
+DEALER_BUSTED = OUTCOMES.index(GameState.DEALER_BUSTED)
+PLAYER_WON = OUTCOMES.index(GameState.PLAYER_WON)
+DEALER_WON = OUTCOMES.index(GameState.DEALER_WON)
+
+CARD_VALUES = np.array(CARD_VALUE_TABLE, dtype=np.int8)
+STREAM_WIDTH = 12
+
+
+def threshold_strategy(stand_on=17):
+    # Indexed as [player total, soft hand, dealer upcard value].
+    strategy = np.zeros((33, 2, 12), dtype=bool)
+    strategy[:stand_on] = True
+    return strategy
+
+
+def deal_streams(hands, rng, width=STREAM_WIDTH):
+    return CARD_VALUES[rng.integers(0, len(CARD_VALUES), size=(hands, width))]
+
+
+def payout_table(bet):
+    payouts = np.zeros(len(OUTCOMES), dtype=np.int64)
+    payouts[BUSTED] = -bet
+    payouts[BLACKJACK] = round(bet * 1.5)
+    payouts[DEALER_BLACKJACK] = -bet
+    payouts[DEALER_BUSTED] = bet
+    payouts[PLAYER_WON] = bet
+    payouts[DEALER_WON] = -bet
+    return payouts
+
+
+class CardStreams:
+    def __init__(self, streams, rng=None):
+        self.streams = np.asarray(streams, dtype=np.int8)
+        self.cursor = np.full(len(self.streams), 4, dtype=np.intp)
+        self.rng = rng
+
+    def draw(self, hands):
+        if len(hands) and self.cursor[hands].max() >= self.streams.shape[1]:
+            self.extend()
+        values = self.streams[hands, self.cursor[hands]]
+        self.cursor[hands] += 1
+        return values
+
+    def extend(self):
+        if self.rng is None:
+            raise ValueError("card streams ran out of cards")
+        extra = deal_streams(len(self.streams), self.rng)
+        self.streams = np.concatenate([self.streams, extra], axis=1)
+
+
+def reduce_aces(totals, soft_aces):
+    over = (totals > 21) & (soft_aces > 0)
+    while over.any():
+        totals[over] -= 10
+        soft_aces[over] -= 1
+        over = (totals > 21) & (soft_aces > 0)
+
+
+def simulate_hands(streams, bet=1, strategy=None, rng=None):
+    if strategy is None:
+        strategy = threshold_strategy()
+    cards = CardStreams(streams, rng)
+    values = cards.streams.astype(np.int16)
+    hands = len(values)
+
+    player_totals = values[:, 0] + values[:, 1]
+    player_aces = (values[:, 0] == 11).astype(np.int16) + (values[:, 1] == 11)
+    dealer_upcards = values[:, 2]
+    dealer_totals = values[:, 2] + values[:, 3]
+    dealer_aces = (values[:, 2] == 11).astype(np.int16) + (values[:, 3] == 11)
+    reduce_aces(player_totals, player_aces)
+    reduce_aces(dealer_totals, dealer_aces)
+
+    outcomes = np.full(hands, -1, dtype=np.int8)
+    dealer_naturals = dealer_totals == 21
+    player_naturals = player_totals == 21
+    outcomes[dealer_naturals & player_naturals] = DRAW
+    outcomes[dealer_naturals & ~player_naturals] = DEALER_BLACKJACK
+    outcomes[~dealer_naturals & player_naturals] = BLACKJACK
+
+    playing = np.flatnonzero(outcomes == -1)
+    while len(playing):
+        hits = strategy[
+            player_totals[playing],
+            (player_aces[playing] > 0).astype(np.intp),
+            dealer_upcards[playing],
+        ]
+        playing = playing[hits]
+        if not len(playing):
+            break
+        new_cards = cards.draw(playing)
+        player_totals[playing] += new_cards
+        player_aces[playing] += new_cards == 11
+        totals = player_totals[playing]
+        aces = player_aces[playing]
+        reduce_aces(totals, aces)
+        player_totals[playing] = totals
+        player_aces[playing] = aces
+        busted = totals > 21
+        outcomes[playing[busted]] = BUSTED
+        playing = playing[~busted]
+
+    standing = np.flatnonzero(outcomes == -1)
+    drawing = standing[dealer_totals[standing] < 17]
+    while len(drawing):
+        new_cards = cards.draw(drawing)
+        totals = dealer_totals[drawing] + new_cards
+        aces = dealer_aces[drawing] + (new_cards == 11)
+        reduce_aces(totals, aces)
+        dealer_totals[drawing] = totals
+        dealer_aces[drawing] = aces
+        drawing = drawing[totals < 17]
+
+    player_final = player_totals[standing]
+    dealer_final = dealer_totals[standing]
+    outcomes[standing] = np.select(
+        [
+            dealer_final > 21,
+            dealer_final > player_final,
+            dealer_final == player_final,
+        ],
+        [DEALER_BUSTED, DEALER_WON, DRAW],
+        PLAYER_WON,
+    )
+
+    return outcomes, payout_table(bet)[outcomes]
+
+
+def simulate_rounds(rounds, bet=1, strategy=None, seed=None, chunk_size=1_000_000):
+    rng = np.random.default_rng(seed)
+    histogram = np.zeros(len(OUTCOMES), dtype=np.int64)
+    net_credits = 0
+    while rounds > 0:
+        hands = min(rounds, chunk_size)
+        outcomes, deltas = simulate_hands(
+            deal_streams(hands, rng), bet=bet, strategy=strategy, rng=rng
+        )
+        histogram += np.bincount(outcomes, minlength=len(OUTCOMES))
+        net_credits += int(deltas.sum())
+        rounds -= hands
+    return histogram, net_credits
@@ -0,0 +1,150 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from cards import Cards
+from enums import GameState
+from hand import Hand
+
+FRAME_CARD_COUNTS = [2, 5, 10]
+DEFAULT_THRESHOLD = 0.10
+
+
+def create_game():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    from main import Game
+
+    return Game()
+
+
+def metric(value, unit, higher_is_better):
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def bench_hands(game, rounds=2000):
+    controller = game.game_controller
+    engine = game.engine
+    engine.cards = Cards(rng=random.Random(0))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if engine.player_credits < 10:
+            engine.player_credits = 5000
+        game.betting_logic.place_bet(10)
+        controller.deal_cards()
+        while game.current_phase == GameState.PLAYERS_HAND and engine.player_score < 17:
+            controller.handle_hit()
+        controller.handle_stand()
+        controller.reset_game()
+    elapsed = time.perf_counter() - start
+
+    return metric(rounds / elapsed, "hands/s", True)
+
+
+def bench_select_card(calls=200_000):
+    cards = Cards(rng=random.Random(0))
+    select_card = cards.select_card
+
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        select_card()
+    elapsed = time.perf_counter_ns() - start
+
+    return metric(elapsed / calls, "ns/call", False)
+
+
+def deal_fixed_hands(game, card_count):
+    engine = game.engine
+    engine.player_hand = Hand(range(card_count))
+    engine.dealer_hand = Hand(range(13, 13 + card_count))
+    engine.dealer_card_hidden = False
+    engine.current_phase = GameState.PLAYERS_HAND
+    game.game_ui.player_card_boxes = []
+    game.game_ui.dealer_card_boxes = []
+    game.game_controller.update_card_boxes()
+
+
+def bench_frame(game, card_count, frames=200):
+    deal_fixed_hands(game, card_count)
+    game_ui = game.game_ui
+    controller = game.game_controller
+    samples = []
+
+    for _ in range(frames):
+        start = time.perf_counter()
+        game_ui.draw()
+        controller.draw()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    game.engine.reset()
+    return {
+        "mean": metric(sum(samples) / len(samples), "ms", False),
+        "p99": metric(percentile(samples, 0.99), "ms", False),
+    }
+
+
+def run_benchmarks(game=None, rounds=2000, calls=200_000, frames=200):
+    if game is None:
+        game = create_game()
+
+    results = {
+        "hands_per_second": bench_hands(game, rounds),
+        "select_card": bench_select_card(calls),
+    }
+    for card_count in FRAME_CARD_COUNTS:
+        frame = bench_frame(game, card_count, frames)
+        results[f"frame_{card_count}_cards_mean"] = frame["mean"]
+        results[f"frame_{card_count}_cards_p99"] = frame["p99"]
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None or previous["value"] <= 0:
+            continue
+
+        change = (current["value"] - previous["value"]) / previous["value"]
+        if current["higher_is_better"]:
+            change = -change
+        if change > threshold:
+            regressions.append((name, previous["value"], current["value"], change))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Blackjack benchmarks")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against a previous JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--frames", type=int, default=200)
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(
+        rounds=arguments.rounds, calls=arguments.calls, frames=arguments.frames
+    )
+    print(json.dumps(results, indent=2))
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline:
+            regressions = compare(results, json.load(baseline), arguments.threshold)
+        for name, previous, current, change in regressions:
+            print(f"{name}: {previous:.4g} -> {current:.4g} ({change:+.1%} worse)")
+        if regressions:
+            raise SystemExit(1)
@@ -1,4 +1,3 @@
-from cards import Cards
 from enums import GameState
 
 
@@ -7,17 +6,23 @@ class BettingLogic:
         self.display = game.screen
         self.game = game
         self.chip_rects = chip_rects
-        self.cards = Cards()
 
-    def check_chip_clicked(self, mouse_position):
+        self.register_chips()
+
+    def register_chips(self):
         for rect in self.chip_rects:
-            if rect[0].collidepoint(mouse_position):
-                if self.game.current_phase == GameState.BETTING:
-                    bet_value = rect[1]
-                    self.game.player_bet += bet_value
-                    self.enough_credits_validation(bet_value)
-                    self.cards.select_card()
+            self.game.click_registry.register(
+                ("chip", rect[1]),
+                rect[0],
+                lambda bet_value=rect[1]: self.place_bet(bet_value),
+                phases=[GameState.BETTING],
+                group="chip",
+            )
+
+    def check_chip_clicked(self, mouse_position):
+        return self.game.click_registry.dispatch(
+            mouse_position, self.game.current_phase, group="chip"
+        )
 
-    def enough_credits_validation(self, bet_value):
-        if self.game.player_bet > self.game.player_credits:
-            self.game.player_bet -= bet_value
+    def place_bet(self, bet_value):
+        self.game.engine.place_bet(bet_value)
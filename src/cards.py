@@ -1,28 +1,32 @@
-import random
+from shoe import Shoe
+
+SUITS = ["clubs", "diamonds", "hearts", "spades"]
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+RANK_VALUES = [2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11]
+ACE = RANKS.index("A")
+
+# A card is a single int, suit * 13 + rank, these tables turn it back into
+# the image name and blackjack value without any string handling.
+CARD_NAMES = [f"{suit}_{rank}" for suit in SUITS for rank in RANKS]
+CARD_VALUES = [value for _ in SUITS for value in RANK_VALUES]
+CARD_RANKS = [rank for _ in SUITS for rank in range(len(RANKS))]
+CARD_SUITS = [suit for suit in range(len(SUITS)) for _ in RANKS]
+CARD_NUMBERS = {name: card for card, name in enumerate(CARD_NAMES)}
 
 
 class Cards:
-    def __init__(self):
-        # fmt: off
-        self.possible_cards = {
-            "clubs_2": 2, "clubs_3": 3, "clubs_4": 4, "clubs_5": 5,
-            "clubs_6": 6, "clubs_7": 7, "clubs_8": 8, "clubs_9": 9,
-            "clubs_10": 10, "clubs_J": 10, "clubs_Q": 10,
-            "clubs_K": 10, "clubs_A": 11,
-            "diamonds_2": 2, "diamonds_3": 3, "diamonds_4": 4, "diamonds_5": 5,
-            "diamonds_6": 6, "diamonds_7": 7, "diamonds_8": 8, "diamonds_9": 9,
-            "diamonds_10": 10, "diamonds_J": 10, "diamonds_Q": 10,
-            "diamonds_K": 10, "diamonds_A": 11,
-            "hearts_2": 2, "hearts_3": 3, "hearts_4": 4, "hearts_5": 5,
-            "hearts_6": 6, "hearts_7": 7, "hearts_8": 8, "hearts_9": 9,
-            "hearts_10": 10, "hearts_J": 10, "hearts_Q": 10,
-            "hearts_K": 10, "hearts_A": 11,
-            "spades_2": 2, "spades_3": 3, "spades_4": 4, "spades_5": 5,
-            "spades_6": 6, "spades_7": 7, "spades_8": 8, "spades_9": 9,
-            "spades_10": 10, "spades_J": 10, "spades_Q": 10,
-            "spades_K": 10, "spades_A": 11,
-        }
-        # fmt: on
+    def __init__(self, rng=None, shoe=None, decks=6):
+        self.possible_cards = dict(zip(CARD_NAMES, CARD_VALUES))
+        self.shoe = (
+            shoe if shoe is not None else Shoe(len(CARD_NAMES), decks=decks, rng=rng)
+        )
+
+    def draw(self):
+        return self.shoe.draw()
 
     def select_card(self):
-        return random.choice(list(self.possible_cards.items()))
+        card = self.shoe.draw()
+        return (CARD_NAMES[card], CARD_VALUES[card])
+
+    def shuffle_if_needed(self):
+        return self.shoe.shuffle_if_needed()
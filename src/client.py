@@ -0,0 +1,71 @@
+import json
+import socket
+from enums import GameState
+from hand import Hand
+
+
+class RemoteEngine:
+    def __init__(self, host="127.0.0.1", port=8765, unix_socket=None):
+        if unix_socket:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(unix_socket)
+        else:
+            self.socket = socket.create_connection((host, port))
+        self.stream = self.socket.makefile("rwb")
+        self.table_id = None
+
+        self.update(self.request({"action": "open"}))
+
+    def request(self, request):
+        self.stream.write(json.dumps(request).encode() + b"\n")
+        self.stream.flush()
+        return json.loads(self.stream.readline())
+
+    def action(self, action, **fields):
+        response = self.request({"action": action, "table": self.table_id, **fields})
+        if "phase" in response:
+            self.update(response)
+        return response["ok"]
+
+    def update(self, state):
+        self.table_id = state["table"]
+        self.current_phase = GameState[state["phase"]]
+        self.player_credits = state["player_credits"]
+        self.player_bet = state["player_bet"]
+        self.player_hand = Hand(state["player_cards"])
+        self.player_score = state["player_score"]
+        self.dealer_score = state["dealer_score"]
+        self.dealer_total_score = state["dealer_score"]
+        self.dealer_cards = state["dealer_cards"]
+        self.dealer_card_hidden = state["dealer_card_hidden"]
+
+    @property
+    def player_cards(self):
+        return self.player_hand.cards
+
+    @property
+    def aces_changed(self):
+        return self.player_hand.aces_changed
+
+    def place_bet(self, bet_value):
+        return self.action("bet", value=bet_value)
+
+    def deal(self):
+        return self.action("deal")
+
+    def hit(self):
+        return self.action("hit")
+
+    def stand(self):
+        return self.action("stand")
+
+    def reset(self):
+        return self.action("reset")
+
+    def stats(self):
+        return self.request({"action": "stats", "table": self.table_id})
+
+    def close(self):
+        self.request({"action": "close", "table": self.table_id})
+        self.stream.close()
+        self.socket.close()
@@ -0,0 +1,142 @@
+import json
+import os
+from functools import lru_cache
+from cards import CARD_VALUES
+from paths import resource_path
+
+DEALER_ODDS_TABLE = resource_path("data/dealer_odds.json")
+CARD_VALUE_ORDER = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+DEALER_RESULTS = ["17", "18", "19", "20", "21", "bust"]
+BUST = DEALER_RESULTS.index("bust")
+INFINITE_DECK = tuple(CARD_VALUES.count(value) for value in CARD_VALUE_ORDER)
+
+_loaded_table = None
+
+
+def composition_from_cards(cards):
+    counts = [0] * len(CARD_VALUE_ORDER)
+    for card in cards:
+        counts[CARD_VALUE_ORDER.index(CARD_VALUES[card])] += 1
+    return tuple(counts)
+
+
+def composition_from_shoe(shoe):
+    return composition_from_cards(shoe.cards[shoe.cursor :])
+
+
+def add_card(total, soft_aces, value):
+    total += value
+    if value == 11:
+        soft_aces += 1
+    if total > 21 and soft_aces:
+        total -= 10
+        soft_aces -= 1
+    return total, soft_aces
+
+
+@lru_cache(maxsize=65536)
+def dealer_results(total, soft_aces, composition, deplete):
+    # The dealer stands on every 17, soft or hard, like BlackjackEngine.stand.
+    if total >= 17:
+        results = [0.0] * len(DEALER_RESULTS)
+        results[BUST if total > 21 else total - 17] = 1.0
+        return tuple(results)
+
+    return draw_results(total, soft_aces, composition, deplete, excluded=None)
+
+
+def draw_results(total, soft_aces, composition, deplete, excluded):
+    remaining = sum(
+        count
+        for index, count in enumerate(composition)
+        if CARD_VALUE_ORDER[index] != excluded
+    )
+    results = [0.0] * len(DEALER_RESULTS)
+    for index, count in enumerate(composition):
+        value = CARD_VALUE_ORDER[index]
+        if count == 0 or value == excluded:
+            continue
+
+        next_composition = composition
+        if deplete:
+            next_composition = (
+                composition[:index] + (count - 1,) + composition[index + 1 :]
+            )
+        next_total, next_soft_aces = add_card(total, soft_aces, value)
+        next_results = dealer_results(
+            next_total, next_soft_aces, next_composition, deplete
+        )
+        probability = count / remaining
+        for result, result_probability in enumerate(next_results):
+            results[result] += probability * result_probability
+    return tuple(results)
+
+
+def dealer_distribution(upcard, composition=None, peek=True):
+    deplete = composition is not None
+    if composition is None:
+        composition = INFINITE_DECK
+    composition = tuple(composition)
+
+    index = CARD_VALUE_ORDER.index(upcard)
+    if deplete:
+        composition = (
+            composition[:index] + (composition[index] - 1,) + composition[index + 1 :]
+        )
+
+    # A dealer blackjack is settled when the cards are dealt, so once the
+    # player can act the hole card is known not to complete a blackjack.
+    excluded = None
+    if peek and upcard == 11:
+        excluded = 10
+    elif peek and upcard == 10:
+        excluded = 11
+
+    total, soft_aces = add_card(0, 0, upcard)
+    return draw_results(total, soft_aces, composition, deplete, excluded)
+
+
+def build_table(peek=True):
+    return {
+        upcard: dealer_distribution(upcard, peek=peek) for upcard in CARD_VALUE_ORDER
+    }
+
+
+def save_table(path=DEALER_ODDS_TABLE):
+    table = {
+        "results": DEALER_RESULTS,
+        "peek": {str(upcard): row for upcard, row in build_table(True).items()},
+        "no_peek": {str(upcard): row for upcard, row in build_table(False).items()},
+    }
+    with open(path, "w") as table_file:
+        json.dump(table, table_file, indent=1)
+
+
+def load_table(path=DEALER_ODDS_TABLE):
+    with open(path) as table_file:
+        table = json.load(table_file)
+    return {
+        mode: {int(upcard): tuple(row) for upcard, row in rows.items()}
+        for mode, rows in table.items()
+        if mode != "results"
+    }
+
+
+def infinite_deck_table():
+    global _loaded_table
+    if _loaded_table is None:
+        if os.path.exists(DEALER_ODDS_TABLE):
+            _loaded_table = load_table()
+        else:
+            _loaded_table = {"peek": build_table(True), "no_peek": build_table(False)}
+    return _loaded_table
+
+
+def dealer_odds(upcard, composition=None, peek=True):
+    if composition is None:
+        return infinite_deck_table()["peek" if peek else "no_peek"][upcard]
+    return dealer_distribution(upcard, composition, peek)
+
+
+if __name__ == "__main__":
+    save_table()
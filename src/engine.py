@@ -0,0 +1,210 @@
+from cards import Cards, CARD_VALUES
+from enums import GameState
+from hand import Hand
+
+END_GAME_PHASES = [
+    GameState.BUSTED,
+    GameState.BLACKJACK,
+    GameState.DRAW,
+    GameState.DEALER_BLACKJACK,
+    GameState.DEALER_BUSTED,
+    GameState.PLAYER_WON,
+    GameState.DEALER_WON,
+    GameState.ROUND_OVER,
+]
+
+
+class RoundResult:
+    __slots__ = (
+        "round_number",
+        "player_bet",
+        "credit_delta",
+        "player_credits",
+        "phase",
+        "player_cards",
+        "dealer_cards",
+        "actions",
+    )
+
+    def __init__(
+        self,
+        round_number,
+        player_bet,
+        credit_delta,
+        player_credits,
+        phase,
+        player_cards,
+        dealer_cards,
+        actions,
+    ):
+        self.round_number = round_number
+        self.player_bet = player_bet
+        self.credit_delta = credit_delta
+        self.player_credits = player_credits
+        self.phase = phase
+        self.player_cards = player_cards
+        self.dealer_cards = dealer_cards
+        self.actions = actions
+
+
+class BlackjackEngine:
+    def __init__(self, player_credits=5000, cards=None):
+        self.cards = cards if cards is not None else Cards()
+        self.player_credits = player_credits
+        self.player_bet = 0
+        self.current_phase = GameState.BETTING
+        self.round_listeners = []
+        self.round_number = 0
+        self.round_actions = []
+        self.round_start_credits = player_credits
+        self.clear_hands()
+
+    def clear_hands(self):
+        self.player_hand = Hand()
+        self.dealer_hand = Hand()
+        self.dealer_score = 0
+        self.dealer_card_hidden = False
+
+    @property
+    def player_cards(self):
+        return self.player_hand.cards
+
+    @property
+    def dealer_cards(self):
+        return self.dealer_hand.cards
+
+    @property
+    def player_score(self):
+        return self.player_hand.score
+
+    @player_score.setter
+    def player_score(self, score):
+        self.player_hand.score = score
+
+    @property
+    def aces_changed(self):
+        return self.player_hand.aces_changed
+
+    @aces_changed.setter
+    def aces_changed(self, aces_changed):
+        self.player_hand.aces_changed = aces_changed
+
+    @property
+    def dealer_total_score(self):
+        return self.dealer_hand.score
+
+    @dealer_total_score.setter
+    def dealer_total_score(self, score):
+        self.dealer_hand.score = score
+
+    def place_bet(self, bet_value):
+        if self.current_phase != GameState.BETTING:
+            return False
+        if self.player_bet + bet_value > self.player_credits:
+            return False
+
+        self.player_bet += bet_value
+        return True
+
+    def deal(self):
+        if self.current_phase != GameState.BETTING or self.player_bet <= 0:
+            return False
+
+        self.round_number += 1
+        self.round_start_credits = self.player_credits
+        self.round_actions = ["deal"]
+        self.deal_initial_cards()
+        self.settle_initial_hands()
+        if self.is_round_over():
+            self.finish_round()
+        return True
+
+    def deal_initial_cards(self):
+        self.player_hand = Hand()
+        self.dealer_hand = Hand()
+        self.player_hand.add(self.cards.draw())
+        self.player_hand.add(self.cards.draw())
+        self.dealer_hand.add(self.cards.draw())
+        self.dealer_hand.add(self.cards.draw())
+
+        self.dealer_card_hidden = True
+        self.dealer_score = CARD_VALUES[self.dealer_hand.cards[0]]
+        self.current_phase = GameState.PLAYERS_HAND
+
+    def settle_initial_hands(self):
+        if self.dealer_total_score == 21:
+            if self.player_score == 21:
+                self.current_phase = GameState.DRAW
+            else:
+                self.current_phase = GameState.DEALER_BLACKJACK
+                self.player_credits -= self.player_bet
+            self.reveal_dealer_card()
+        elif self.player_score == 21:
+            self.current_phase = GameState.BLACKJACK
+            self.player_credits += round(self.player_bet * 1.5)
+
+    def hit(self):
+        if self.current_phase != GameState.PLAYERS_HAND:
+            return False
+
+        self.round_actions.append("hit")
+        if self.player_hand.add(self.cards.draw()) > 21:
+            self.player_credits -= self.player_bet
+            self.current_phase = GameState.BUSTED
+            self.finish_round()
+        return True
+
+    def stand(self):
+        if self.current_phase != GameState.PLAYERS_HAND:
+            return False
+
+        self.round_actions.append("stand")
+        self.current_phase = GameState.DEALERS_HAND
+        self.reveal_dealer_card()
+
+        while self.dealer_score < 17:
+            self.dealer_hit()
+
+        if self.dealer_score > 21:
+            self.current_phase = GameState.DEALER_BUSTED
+            self.player_credits += self.player_bet
+        elif self.dealer_score > self.player_score:
+            self.current_phase = GameState.DEALER_WON
+            self.player_credits -= self.player_bet
+        elif self.dealer_score == self.player_score:
+            self.current_phase = GameState.DRAW
+        else:
+            self.current_phase = GameState.PLAYER_WON
+            self.player_credits += self.player_bet
+        self.finish_round()
+        return True
+
+    def dealer_hit(self):
+        self.dealer_score = self.dealer_hand.add(self.cards.draw())
+
+    def reveal_dealer_card(self):
+        self.dealer_card_hidden = False
+        self.dealer_score = self.dealer_total_score
+
+    def finish_round(self):
+        result = RoundResult(
+            self.round_number,
+            self.player_bet,
+            self.player_credits - self.round_start_credits,
+            self.player_credits,
+            self.current_phase,
+            list(self.player_cards),
+            list(self.dealer_cards),
+            list(self.round_actions),
+        )
+        for listener in self.round_listeners:
+            listener(result)
+
+    def reset(self):
+        self.cards.shuffle_if_needed()
+        self.clear_hands()
+        self.player_bet = 0
+        self.current_phase = GameState.BETTING
+
+    def is_round_over(self):
+        return self.current_phase in END_GAME_PHASES
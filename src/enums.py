@@ -12,3 +12,4 @@ class GameState(Enum):
     DEALER_BUSTED = "Dealer Busted"
     PLAYER_WON = "You Win"
     DEALER_WON = "Dealer Wins"
+    ROUND_OVER = "Round Over"
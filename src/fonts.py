@@ -0,0 +1,67 @@
+import pygame
+from paths import resource_path
+
+# Liberation Sans shares Arial's metrics, so every hard-coded label position
+# tuned for Arial lines up without a system font scan.
+BUNDLED_FONTS = {
+    ("arial", False): resource_path("fonts/LiberationSans-Regular.ttf"),
+    ("arial", True): resource_path("fonts/LiberationSans-Bold.ttf"),
+}
+DEFAULT_FAMILY = "arial"
+
+
+class FontRegistry:
+    def __init__(self, use_system_fonts=False):
+        self.use_system_fonts = use_system_fonts
+        self.paths = {}
+        self.fonts = {}
+
+    def register(self, family, path, bold=False):
+        self.paths[(family.lower(), bold)] = path
+
+    def get(self, family, size, bold=False, italic=False):
+        key = (family.lower(), size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.load(family, size, bold, italic)
+            self.fonts[key] = font
+        return font
+
+    def find(self, family, bold):
+        for key in [(family, bold), (family, False)]:
+            if key in self.paths:
+                return self.paths[key], key[1] != bold
+        return None, bold
+
+    def load(self, family, size, bold, italic):
+        family = family.lower()
+        path, embolden = self.find(family, bold)
+        if path is None and self.use_system_fonts:
+            return pygame.font.SysFont(family, size, bold=bold, italic=italic)
+        if path is None:
+            path, embolden = self.find(DEFAULT_FAMILY, bold)
+
+        # With nothing registered pygame's freesansbold.ttf is opened directly;
+        # it is bold already, so it is never emboldened a second time.
+        font = pygame.font.Font(path, size)
+        if path is not None:
+            font.set_bold(embolden)
+        font.set_italic(italic)
+        return font
+
+    def clear(self):
+        self.fonts.clear()
+
+
+SHARED_REGISTRIES = {}
+
+
+def shared_registry(use_system_fonts=False):
+    registry = SHARED_REGISTRIES.get(use_system_fonts)
+    if registry is None:
+        registry = FontRegistry(use_system_fonts)
+        if not use_system_fonts:
+            for (family, bold), path in BUNDLED_FONTS.items():
+                registry.register(family, path, bold)
+        SHARED_REGISTRIES[use_system_fonts] = registry
+    return registry
@@ -0,0 +1,29 @@
+class FrameScheduler:
+    def __init__(self, fps=60):
+        self.frame_time = 1000 / fps
+        self.redraw_requested = True
+        self.animating = False
+        self.next_frame_at = 0
+
+    def request_redraw(self):
+        self.redraw_requested = True
+
+    def set_animating(self, animating):
+        self.animating = animating
+
+    def wants_frame(self):
+        return self.redraw_requested or self.animating
+
+    def wait_timeout(self, now):
+        # None means nothing is pending and the loop can block until the next
+        # event arrives, which keeps an idle table at close to 0% CPU.
+        if not self.wants_frame():
+            return None
+        return max(0, int(self.next_frame_at - now))
+
+    def frame_due(self, now):
+        return self.wants_frame() and now >= self.next_frame_at
+
+    def frame_done(self, now):
+        self.redraw_requested = False
+        self.next_frame_at = now + self.frame_time
@@ -7,7 +7,7 @@ class GameUi:
         self.game = game
         self.box_width = 156
         self.box_height = 215
-        self.font = pygame.font.SysFont("Arial", 40, bold=True)
+        self.font = game.fonts.get("Arial", game.layout.font_size(40), bold=True)
         self.chip_rects = []
         self.button_rects = []
         self.player_card_boxes = []
@@ -19,6 +19,17 @@ class GameUi:
         self.add_initial_card_boxes()
         self.draw()
 
+    def apply_layout(self):
+        self.display = self.game.screen
+        self.font = self.game.fonts.get(
+            "Arial", self.game.layout.font_size(40), bold=True
+        )
+        # Cleared in place because BettingLogic and GameController share them.
+        self.chip_rects.clear()
+        self.button_rects.clear()
+        self.create_chip_rects()
+        self.create_button_rects()
+
     def draw(self):
         self.game.screen.blit(self.game.background_scaled, (0, 0))
 
@@ -38,92 +49,123 @@ class GameUi:
         self.player_card_boxes.append((595, 550))
         self.player_card_boxes.append((755, 550))
 
+    def card_box_rect(self, box):
+        return self.game.layout.rect((box[0], box[1], self.box_width, self.box_height))
+
     def draw_card_box(self, x, y):
+        scale = self.game.layout.scale
         self.card_box = pygame.draw.rect(
             self.display,
             "red",
-            (x, y, self.box_width, self.box_height),
-            5,
-            15,
+            self.card_box_rect((x, y)),
+            max(1, round(5 * scale)),
+            round(15 * scale),
         )
 
     def draw_chips(self):
-        self.one_chip = pygame.image.load("img/chips/one_chip.png")
-        self.one_chip = self.scale_chip(self.one_chip)
-        self.display.blit(self.one_chip, (20, 680))
-
-        self.five_chip = pygame.image.load("img/chips/five_chip.png")
-        self.five_chip = self.scale_chip(self.five_chip)
-        self.display.blit(self.five_chip, (110, 680))
-
-        self.ten_chip = pygame.image.load("img/chips/ten_chip.png")
-        self.ten_chip = self.scale_chip(self.ten_chip)
-        self.display.blit(self.ten_chip, (200, 680))
-
-        self.twentyfive_chip = pygame.image.load("img/chips/twentyfive_chip.png")
-        self.twentyfive_chip = self.scale_chip(self.twentyfive_chip)
-        self.display.blit(self.twentyfive_chip, (20, 770))
-
-        self.fifty_chip = pygame.image.load("img/chips/fifty_chip.png")
-        self.fifty_chip = self.scale_chip(self.fifty_chip)
-        self.display.blit(self.fifty_chip, (110, 770))
-
-        self.onehundred_chip = pygame.image.load("img/chips/onehundred_chip.png")
-        self.onehundred_chip = self.scale_chip(self.onehundred_chip)
-        self.display.blit(self.onehundred_chip, (200, 770))
+        assets = self.game.assets
+        layout = self.game.layout
+        size = layout.size(assets.CHIP_SIZE)
+        self.display.blit(assets.chip("one", size), layout.point((20, 680)))
+        self.display.blit(assets.chip("five", size), layout.point((110, 680)))
+        self.display.blit(assets.chip("ten", size), layout.point((200, 680)))
+        self.display.blit(assets.chip("twentyfive", size), layout.point((20, 770)))
+        self.display.blit(assets.chip("fifty", size), layout.point((110, 770)))
+        self.display.blit(assets.chip("onehundred", size), layout.point((200, 770)))
 
     def create_chip_rects(self):
-        self.one_chip_rect = pygame.Rect(20, 680, 80, 80)
+        self.one_chip_rect = self.game.layout.rect((20, 680, 80, 80))
         self.chip_rects.append((self.one_chip_rect, 1))
 
-        self.five_chip_rect = pygame.Rect(110, 680, 80, 80)
+        self.five_chip_rect = self.game.layout.rect((110, 680, 80, 80))
         self.chip_rects.append((self.five_chip_rect, 5))
 
-        self.ten_chip_rect = pygame.Rect(200, 680, 80, 80)
+        self.ten_chip_rect = self.game.layout.rect((200, 680, 80, 80))
         self.chip_rects.append((self.ten_chip_rect, 10))
 
-        self.twentyfive_chip_rect = pygame.Rect(20, 770, 80, 80)
+        self.twentyfive_chip_rect = self.game.layout.rect((20, 770, 80, 80))
         self.chip_rects.append((self.twentyfive_chip_rect, 25))
 
-        self.fifty_chip_rect = pygame.Rect(110, 770, 80, 80)
+        self.fifty_chip_rect = self.game.layout.rect((110, 770, 80, 80))
         self.chip_rects.append((self.fifty_chip_rect, 50))
 
-        self.onehundred_chip_rect = pygame.Rect(200, 770, 80, 80)
+        self.onehundred_chip_rect = self.game.layout.rect((200, 770, 80, 80))
         self.chip_rects.append((self.onehundred_chip_rect, 100))
 
-    def scale_chip(self, chip):
-        return pygame.transform.scale(chip, (80, 80))
-
     def draw_buttons(self):
-        pygame.draw.rect(self.display, "#FFD700", (500, 800, 150, 50), border_radius=15)
-        self.display.blit(self.font.render("Deal", True, (0, 0, 0)), (540, 800))
-        pygame.draw.rect(self.display, "#FFD700", (700, 800, 150, 50), border_radius=15)
-        self.display.blit(self.font.render("Hit", True, (0, 0, 0)), (755, 800))
-        pygame.draw.rect(self.display, "#FFD700", (900, 800, 150, 50), border_radius=15)
-        self.display.blit(self.font.render("Stand", True, (0, 0, 0)), (930, 800))
-
-    def create_button_rects(self):
-        self.deal_button_rect = pygame.Rect(500, 800, 150, 50)
-        self.button_rects.append((self.deal_button_rect, "deal"))
-        self.hit_button_rect = pygame.Rect(700, 800, 150, 50)
-        self.button_rects.append((self.hit_button_rect, "hit"))
-        self.stand_button_rect = pygame.Rect(900, 800, 150, 50)
-        self.button_rects.append((self.stand_button_rect, "stand"))
-
-    def draw_scores_and_bet(self):
-        self.display.blit(
-            self.font.render(f"Credits: {self.game.player_credits}", True, "white"),
-            (20, 20),
+        layout = self.game.layout
+        radius = round(15 * layout.scale)
+        pygame.draw.rect(
+            self.display,
+            "#FFD700",
+            layout.rect((500, 800, 150, 50)),
+            border_radius=radius,
         )
         self.display.blit(
-            self.font.render(f"Current Bet: {self.game.player_bet}", True, "white"),
-            (250, 20),
+            self.game.text_cache.render(self.font, "Deal", True, (0, 0, 0)),
+            layout.point((540, 800)),
+        )
+        pygame.draw.rect(
+            self.display,
+            "#FFD700",
+            layout.rect((700, 800, 150, 50)),
+            border_radius=radius,
         )
         self.display.blit(
-            self.font.render(f"Dealer Score: {self.game.dealer_score}", True, "white"),
-            (630, 40),
+            self.game.text_cache.render(self.font, "Hit", True, (0, 0, 0)),
+            layout.point((755, 800)),
+        )
+        pygame.draw.rect(
+            self.display,
+            "#FFD700",
+            layout.rect((900, 800, 150, 50)),
+            border_radius=radius,
         )
         self.display.blit(
-            self.font.render(f"Player Score: {self.game.player_score}", True, "white"),
-            (630, 490),
+            self.game.text_cache.render(self.font, "Stand", True, (0, 0, 0)),
+            layout.point((930, 800)),
         )
+
+    def create_button_rects(self):
+        self.deal_button_rect = self.game.layout.rect((500, 800, 150, 50))
+        self.button_rects.append((self.deal_button_rect, "deal"))
+        self.hit_button_rect = self.game.layout.rect((700, 800, 150, 50))
+        self.button_rects.append((self.hit_button_rect, "hit"))
+        self.stand_button_rect = self.game.layout.rect((900, 800, 150, 50))
+        self.button_rects.append((self.stand_button_rect, "stand"))
+
+    def score_and_bet_labels(self):
+        return [
+            ("credits", f"Credits: {self.game.player_credits}", (20, 20)),
+            ("bet", f"Current Bet: {self.game.player_bet}", (250, 20)),
+            ("dealer_score", f"Dealer Score: {self.game.dealer_score}", (630, 40)),
+            ("player_score", f"Player Score: {self.game.player_score}", (630, 490)),
+        ]
+
+    def draw_scores_and_bet(self):
+        for label in self.score_and_bet_labels():
+            self.display.blit(
+                self.game.text_cache.render(self.font, label[1], True, "white"),
+                self.game.layout.point(label[2]),
+            )
+
+    def label_rect(self, text, position):
+        surface = self.game.text_cache.render(self.font, text, True, "white")
+        return surface.get_rect(topleft=self.game.layout.point(position))
+
+    def track_regions(self, renderer):
+        for label in self.score_and_bet_labels():
+            renderer.track(label[0], label[1], self.label_rect(label[1], label[2]))
+
+        for index, box in enumerate(self.dealer_card_boxes):
+            renderer.track(
+                ("dealer_card_box", index),
+                box,
+                self.card_box_rect(box),
+            )
+        for index, box in enumerate(self.player_card_boxes):
+            renderer.track(
+                ("player_card_box", index),
+                box,
+                self.card_box_rect(box),
+            )
@@ -1,5 +1,6 @@
 import pygame
-from cards import Cards
+from cards import CARD_NAMES, CARD_VALUES
+from engine import END_GAME_PHASES
 from enums import GameState
 
 
@@ -7,210 +8,253 @@ class GameController:
     def __init__(self, game, button_rects):
 
         self.game = game
+        self.engine = game.engine
         self.display = game.screen
         self.button_rects = button_rects
-        self.cards = Cards()
-        self.player_cards = []
-        self.dealer_cards = []
-        self.busted_font = pygame.font.SysFont("Arial", 100, bold=True)
-        self.button_font = pygame.font.SysFont("Arial", 40, bold=True)
-        self.aces = ["clubs_A", "diamonds_A", "hearts_A", "spades_A"]
-        self.ace_count = 0
-        self.aces_changed = 0
-        self.dealer_ace_count = 0
-        self.dealer_aces_changed = 0
-        self.dealer_total_score = 0
-        self.dealer_card_two = ""
+        self.load_fonts()
+        self.end_game_phases = END_GAME_PHASES
+        self.advice = None
 
-    def check_buttons_clicked(self, mouse_position):
+        self.register_buttons()
 
-        for rect in self.button_rects:
-            if rect[0].collidepoint(mouse_position):
-                if rect[1] == "deal":
-                    self.deal_cards()
-                if rect[1] == "hit":
-                    self.handle_hit()
-                if rect[1] == "stand":
-                    self.handle_stand()
-                if rect[1] == "reset":
-                    self.reset_game()
+    def load_fonts(self):
+        layout = self.game.layout
+        fonts = self.game.fonts
+        self.busted_font = fonts.get("Arial", layout.font_size(100), bold=True)
+        self.button_font = fonts.get("Arial", layout.font_size(40), bold=True)
 
-    def deal_cards(self):
+    def apply_layout(self):
+        self.display = self.game.screen
+        self.load_fonts()
+        self.register_buttons()
 
-        if self.game.current_phase != GameState.BETTING or self.game.player_bet <= 0:
-            return
+    @property
+    def player_cards(self):
+        return [
+            (CARD_NAMES[card], (600 + 160 * index, 555))
+            for index, card in enumerate(self.engine.player_cards)
+        ]
 
-        self._deal_initial_cards()
-        self._handle_special_cases()
+    @property
+    def dealer_cards(self):
+        dealer_cards = []
+        for index, card in enumerate(self.engine.dealer_cards):
+            if index == 1 and self.engine.dealer_card_hidden:
+                name = "back_dark"
+            else:
+                name = CARD_NAMES[card]
+            dealer_cards.append((name, (600 + 160 * index, 100)))
+        return dealer_cards
 
-    def _deal_initial_cards(self):
+    @property
+    def dealer_total_score(self):
+        return self.engine.dealer_total_score
 
-        player_card_one = self.cards.select_card()
-        player_card_two = self.cards.select_card()
-        dealer_card_one = self.cards.select_card()
-        self.dealer_card_two = self.cards.select_card()
+    @dealer_total_score.setter
+    def dealer_total_score(self, score):
+        self.engine.dealer_total_score = score
 
-        self.player_cards.append((player_card_one[0], (600, 555)))
-        self.player_cards.append((player_card_two[0], (760, 555)))
-        self.dealer_cards.append((dealer_card_one[0], (600, 100)))
-        self.dealer_cards.append(("back_dark", (760, 100)))
+    @property
+    def aces_changed(self):
+        return self.engine.aces_changed
 
-        self._update_scores(player_card_one[1], player_card_two[1], dealer_card_one[1])
+    @aces_changed.setter
+    def aces_changed(self, aces_changed):
+        self.engine.aces_changed = aces_changed
 
-    def _update_scores(
-        self, player_card_one_score, player_card_two_score, dealer_card_one_score
-    ):
+    def register_buttons(self):
+        handlers = {
+            "deal": (self.deal_cards, [GameState.BETTING]),
+            "hit": (self.handle_hit, [GameState.PLAYERS_HAND]),
+            "stand": (self.handle_stand, [GameState.PLAYERS_HAND]),
+        }
+        for rect in self.button_rects:
+            handler, phases = handlers[rect[1]]
+            self.game.click_registry.register(
+                rect[1], rect[0], handler, phases=phases, group="button"
+            )
+
+        self.reset_button_rect = self.game.layout.rect((680, 430, 150, 50))
+        self.game.click_registry.register(
+            "reset",
+            self.reset_button_rect,
+            self.reset_game,
+            phases=self.end_game_phases,
+            group="button",
+        )
+
+    def check_buttons_clicked(self, mouse_position):
+        return self.game.click_registry.dispatch(
+            mouse_position, self.game.current_phase, group="button"
+        )
 
-        self.game.player_score += player_card_one_score + player_card_two_score
-        self.game.dealer_score += dealer_card_one_score
-        self.dealer_total_score += dealer_card_one_score + self.dealer_card_two[1]
+    def update_advice(self):
+        self.advice = None
+        if (
+            self.game.current_phase == GameState.PLAYERS_HAND
+            and self.engine.dealer_cards
+        ):
+            # The advisor loads its tables on import, which is left until the
+            # first hand is dealt so it stays off the startup path.
+            from advisor import advise
+
+            self.advice = advise(
+                self.engine.player_hand.score,
+                self.engine.player_hand.is_soft(),
+                CARD_VALUES[self.engine.dealer_cards[0]],
+            )
+
+    def advice_text(self):
+        if self.advice is None:
+            return None
+        action, hit_value, stand_value = self.advice
+        return (
+            f"Advice: {action.capitalize()} "
+            f"(Hit {hit_value:+.2f} / Stand {stand_value:+.2f})"
+        )
+
+    def deal_cards(self):
+        if self.engine.deal():
+            self.update_card_boxes()
+        self.update_advice()
 
-        self.game.current_phase = GameState.PLAYERS_HAND
+    def _deal_initial_cards(self):
+        self.engine.deal_initial_cards()
+        self.update_card_boxes()
 
     def _handle_special_cases(self):
+        self.engine.settle_initial_hands()
 
-        if self.game.player_score == 22:
-            self.game.player_score = 12
-            self.aces_changed = 1
-        elif self.dealer_total_score == 21:
-            if self.game.player_score == 21:
-                self.game.current_phase = GameState.DRAW
-            else:
-                self.game.current_phase = GameState.DEALER_BLACKJACK
-                self.game.player_credits -= self.game.player_bet
-            self.game.dealer_score = self.dealer_total_score
-            self.dealer_cards[1] = (self.dealer_card_two[0], (760, 100))
-        elif self.game.player_score == 21:
-            self.game.current_phase = GameState.BLACKJACK
-            self.game.player_credits += round(self.game.player_bet * 1.5)
+    def update_card_boxes(self):
+        game_ui = self.game.game_ui
+        for index in range(len(game_ui.player_card_boxes), len(self.player_cards)):
+            game_ui.player_card_boxes.append((595 + 160 * index, 550))
+        for index in range(len(game_ui.dealer_card_boxes), len(self.dealer_cards)):
+            game_ui.dealer_card_boxes.append((595 + 160 * index, 95))
 
     def draw(self):
         self.draw_all_cards()
-        if (
-            self.game.current_phase != GameState.PLAYERS_HAND
-            and self.game.current_phase != GameState.DEALERS_HAND
-            and self.game.current_phase != GameState.BETTING
-        ):
+        self.draw_advice()
+        if self.game.current_phase in self.end_game_phases:
             self.draw_end_game_ui()
 
+    def card_slots(self):
+        slots = [
+            (("player_card", index), card[0], card[1])
+            for index, card in enumerate(self.player_cards)
+        ]
+        slots += [
+            (("dealer_card", index), card[0], card[1])
+            for index, card in enumerate(self.dealer_cards)
+        ]
+        return slots
+
     def draw_all_cards(self):
-        for card in self.player_cards:
-            card_image = pygame.image.load(f"img/playing-cards-master/{card[0]}.png")
-            card_image = pygame.transform.scale(card_image, (146, 205))
-            self.display.blit(card_image, card[1])
-        for card in self.dealer_cards:
-            card_image = pygame.image.load(f"img/playing-cards-master/{card[0]}.png")
-            card_image = pygame.transform.scale(card_image, (146, 205))
-            self.display.blit(card_image, card[1])
+        animator = self.game.animator
+        for key, name, target in self.card_slots():
+            self.draw_card(*animator.sprite(key, name, target))
+
+    def draw_card(self, name, position, width_scale=1.0):
+        layout = self.game.layout
+        position = layout.point(position)
+        image = self.game.assets.card(name, layout.size(self.game.assets.CARD_SIZE))
+        if width_scale < 1.0:
+            width = max(1, round(image.get_width() * width_scale))
+            position = (position[0] + (image.get_width() - width) // 2, position[1])
+            image = pygame.transform.scale(image, (width, image.get_height()))
+        self.display.blit(image, position)
+
+    def draw_advice(self):
+        text = self.advice_text()
+        if text is not None:
+            self.display.blit(
+                self.game.text_cache.render(self.button_font, text, True, "white"),
+                self.game.layout.point((20, 80)),
+            )
+
+    def track_regions(self, renderer):
+        layout = self.game.layout
+        card_size = layout.size(self.game.assets.CARD_SIZE)
+        animator = self.game.animator
+        slots = self.card_slots()
+        animator.sync(slots)
+        for key, name, target in slots:
+            sprite = animator.sprite(key, name, target)
+            renderer.track(key, sprite, (layout.point(sprite[1]), card_size))
+
+        if self.game.current_phase in self.end_game_phases:
+            text = self.game.current_phase.value
+            text_rect = self.game.text_cache.render(
+                self.busted_font, text, True, "red"
+            ).get_rect(topleft=layout.point(self.end_game_text_position()))
+            renderer.track("end_game_banner", text, text_rect)
+            renderer.track("reset_button", True, self.reset_button_rect)
+
+        text = self.advice_text()
+        if text is not None:
+            text_rect = self.game.text_cache.render(
+                self.button_font, text, True, "white"
+            ).get_rect(topleft=layout.point((20, 80)))
+            renderer.track("advice", text, text_rect)
 
     def handle_hit(self):
-        if self.game.current_phase == GameState.PLAYERS_HAND:
-            new_card = self.cards.select_card()
-            x_coord_multiplier = len(self.player_cards) - 1
-            x_coord = 760 + (160 * x_coord_multiplier)
-            self.player_cards.append((new_card[0], (x_coord, 555)))
-            self.game.player_score += new_card[1]
-            self.game.game_ui.player_card_boxes.append((x_coord - 5, 550))
-        if (
-            self.game.player_score > 21
-            and self.game.current_phase == GameState.PLAYERS_HAND
-        ):
-            for card in self.player_cards:
-                if card[0] in self.aces:
-                    self.ace_count += 1
-            if self.ace_count > self.aces_changed:
-                self.game.player_score -= 10
-                self.aces_changed += 1
-                self.ace_count = 0
-            else:
-                self.game.player_credits -= self.game.player_bet
-                self.game.current_phase = GameState.BUSTED
+        self.engine.hit()
+        self.update_card_boxes()
+        self.update_advice()
 
     def handle_stand(self):
-        if self.game.current_phase == GameState.PLAYERS_HAND:
-            self.game.current_phase = GameState.DEALERS_HAND
-            self.dealer_cards[1] = (self.dealer_card_two[0], (760, 100))
-            self.game.dealer_score = self.dealer_total_score
-
-            while self.game.dealer_score < 17:
-                self.give_dealer_card()
-
-            if self.game.dealer_score > 21:
-                self.game.current_phase = GameState.DEALER_BUSTED
-                self.game.player_credits += self.game.player_bet
-            elif self.game.dealer_score > self.game.player_score:
-                self.game.current_phase = GameState.DEALER_WON
-                self.game.player_credits -= self.game.player_bet
-            elif self.game.dealer_score == self.game.player_score:
-                self.game.current_phase = GameState.DRAW
-            else:
-                self.game.current_phase = GameState.PLAYER_WON
-                self.game.player_credits += self.game.player_bet
+        self.engine.stand()
+        self.update_card_boxes()
+        self.update_advice()
 
     def give_dealer_card(self):
-        new_card = self.cards.select_card()
-        x_coord_multiplier = len(self.dealer_cards) - 1
-        x_coord = 760 + (160 * x_coord_multiplier)
-        self.dealer_cards.append((new_card[0], (x_coord, 100)))
-        self.game.dealer_score += new_card[1]
-        self.game.game_ui.dealer_card_boxes.append((x_coord - 5, 95))
-        if (
-            self.game.dealer_score > 21
-            and self.game.current_phase == GameState.DEALERS_HAND
-        ):
-            for card in self.dealer_cards:
-                if card[0] in self.aces:
-                    self.dealer_ace_count += 1
-            if self.dealer_ace_count > self.dealer_aces_changed:
-                self.game.dealer_score -= 10
-                self.dealer_aces_changed += 1
-                self.dealer_ace_count = 0
-            else:
-                self.game.player_credits -= self.game.player_bet
-                self.game.current_phase = GameState.BUSTED
+        self.engine.dealer_hit()
+        self.update_card_boxes()
 
-    def draw_end_game_ui(
-        self,
-    ):
+    def end_game_text_position(self):
         match self.game.current_phase:
             case GameState.BUSTED:
-                text_position = (620, 310)
+                return (620, 310)
             case GameState.BLACKJACK:
-                text_position = (560, 310)
+                return (560, 310)
             case GameState.DRAW:
-                text_position = (655, 310)
+                return (655, 310)
             case GameState.DEALER_BLACKJACK:
-                text_position = (430, 310)
+                return (430, 310)
             case GameState.PLAYER_WON:
-                text_position = (590, 310)
+                return (590, 310)
             case GameState.DEALER_WON:
-                text_position = (520, 310)
+                return (520, 310)
             case GameState.DEALER_BUSTED:
-                text_position = (480, 310)
+                return (480, 310)
+            case GameState.ROUND_OVER:
+                return (540, 310)
+
+    def draw_end_game_ui(
+        self,
+    ):
+        layout = self.game.layout
         self.display.blit(
-            self.busted_font.render(self.game.current_phase.value, True, "red"),
-            text_position,
+            self.game.text_cache.render(
+                self.busted_font, self.game.current_phase.value, True, "red"
+            ),
+            layout.point(self.end_game_text_position()),
         )
 
-        pygame.draw.rect(self.display, "#FFD700", (680, 430, 150, 50), border_radius=15)
-        self.display.blit(self.button_font.render("Reset", True, (0, 0, 0)), (710, 430))
-
-        if not any(rect[1] == "reset" for rect in self.button_rects):
-            self.reset_button_rect = pygame.Rect(680, 430, 150, 50)
-            self.button_rects.append((self.reset_button_rect, "reset"))
+        pygame.draw.rect(
+            self.display,
+            "#FFD700",
+            self.reset_button_rect,
+            border_radius=round(15 * layout.scale),
+        )
+        self.display.blit(
+            self.game.text_cache.render(self.button_font, "Reset", True, (0, 0, 0)),
+            layout.point((710, 430)),
+        )
 
     def reset_game(self):
-
-        self.player_cards = []
-        self.dealer_cards = []
-        self.game.player_bet = 0
-        self.game.player_score = 0
-        self.game.dealer_score = 0
-        self.dealer_total_score = 0
+        self.engine.reset()
         self.game.game_ui.player_card_boxes = []
         self.game.game_ui.dealer_card_boxes = []
         self.game.game_ui.add_initial_card_boxes()
-        self.game.current_phase = GameState.BETTING
-        self.ace_count = 0
-        self.aces_changed = 0
-        self.dealer_aces_changed = 0
+        self.update_advice()
@@ -0,0 +1,36 @@
+from cards import CARD_VALUES
+
+
+class Hand:
+    __slots__ = ("cards", "score", "ace_count", "aces_changed", "blackjack")
+
+    def __init__(self, cards=()):
+        self.cards = []
+        self.score = 0
+        self.ace_count = 0
+        self.aces_changed = 0
+        self.blackjack = False
+
+        for card in cards:
+            self.add(card)
+
+    def add(self, card):
+        value = CARD_VALUES[card]
+        self.cards.append(card)
+        self.score += value
+        if value == 11:
+            self.ace_count += 1
+        while self.score > 21 and self.ace_count > self.aces_changed:
+            self.score -= 10
+            self.aces_changed += 1
+        self.blackjack = len(self.cards) == 2 and self.score == 21
+        return self.score
+
+    def is_soft(self):
+        return self.ace_count > self.aces_changed
+
+    def is_busted(self):
+        return self.score > 21
+
+    def __len__(self):
+        return len(self.cards)
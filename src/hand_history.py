@@ -0,0 +1,157 @@
+import mmap
+import os
+import struct
+import time
+from enums import GameState
+
+# Every round is one fixed-width little-endian record, so record n always
+# starts at n * RECORD_SIZE and the file can be sliced without parsing it.
+RECORD_FORMAT = "<QqIiqBBBB24s24s24s4x"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+MAX_CARDS = 24
+MAX_ACTIONS = 24
+PHASES = list(GameState)
+ACTIONS = ["deal", "hit", "stand", "split"]
+
+
+def encode_round(result, timestamp_ms=None):
+    if timestamp_ms is None:
+        timestamp_ms = int(time.time() * 1000)
+    player_cards = bytes(result.player_cards[:MAX_CARDS])
+    dealer_cards = bytes(result.dealer_cards[:MAX_CARDS])
+    actions = bytes(ACTIONS.index(action) for action in result.actions[:MAX_ACTIONS])
+    return struct.pack(
+        RECORD_FORMAT,
+        result.round_number,
+        timestamp_ms,
+        result.player_bet,
+        result.credit_delta,
+        result.player_credits,
+        PHASES.index(result.phase),
+        len(player_cards),
+        len(dealer_cards),
+        len(actions),
+        player_cards,
+        dealer_cards,
+        actions,
+    )
+
+
+def decode_round(buffer, offset=0):
+    (
+        round_number,
+        timestamp_ms,
+        player_bet,
+        credit_delta,
+        player_credits,
+        phase,
+        player_card_count,
+        dealer_card_count,
+        action_count,
+        player_cards,
+        dealer_cards,
+        actions,
+    ) = struct.unpack_from(RECORD_FORMAT, buffer, offset)
+    return {
+        "round_number": round_number,
+        "timestamp_ms": timestamp_ms,
+        "player_bet": player_bet,
+        "credit_delta": credit_delta,
+        "player_credits": player_credits,
+        "phase": PHASES[phase],
+        "player_cards": list(player_cards[:player_card_count]),
+        "dealer_cards": list(dealer_cards[:dealer_card_count]),
+        "actions": [ACTIONS[action] for action in actions[:action_count]],
+    }
+
+
+def record_dtype():
+    import numpy as np
+
+    return np.dtype(
+        [
+            ("round_number", "<u8"),
+            ("timestamp_ms", "<i8"),
+            ("player_bet", "<u4"),
+            ("credit_delta", "<i4"),
+            ("player_credits", "<i8"),
+            ("phase", "u1"),
+            ("player_card_count", "u1"),
+            ("dealer_card_count", "u1"),
+            ("action_count", "u1"),
+            ("player_cards", "u1", (MAX_CARDS,)),
+            ("dealer_cards", "u1", (MAX_CARDS,)),
+            ("actions", "u1", (MAX_ACTIONS,)),
+            ("padding", "V4"),
+        ]
+    )
+
+
+class HandHistoryWriter:
+    def __init__(self, path, batch_size=256):
+        self.file = open(path, "ab")
+        self.batch_size = batch_size
+        self.buffer = bytearray()
+        self.pending = 0
+
+    def __call__(self, result):
+        self.record(result)
+
+    def record(self, result):
+        self.buffer += encode_round(result)
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.file.flush()
+            self.buffer = bytearray()
+            self.pending = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+class HandHistoryReader:
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        size = os.fstat(self.file.fileno()).st_size
+        self.count = size // RECORD_SIZE
+        self.map = None
+        if self.count:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return self.count
+
+    def record_view(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        start = index * RECORD_SIZE
+        return memoryview(self.map)[start : start + RECORD_SIZE]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return decode_round(self.map, index * RECORD_SIZE)
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield decode_round(self.map, index * RECORD_SIZE)
+
+    def as_array(self):
+        import numpy as np
+
+        if not self.count:
+            return np.zeros(0, dtype=record_dtype())
+        return np.frombuffer(self.map, dtype=record_dtype(), count=self.count)
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
@@ -0,0 +1,70 @@
+import pygame
+
+
+class ClickableWidget:
+    __slots__ = ("name", "rect", "handler", "phases", "group", "enabled")
+
+    def __init__(self, name, rect, handler, phases=None, group=None):
+        self.name = name
+        self.rect = pygame.Rect(rect)
+        self.handler = handler
+        self.phases = phases
+        self.group = group
+        self.enabled = True
+
+    def accepts(self, phase):
+        return self.enabled and (self.phases is None or phase in self.phases)
+
+
+class ClickRegistry:
+    def __init__(self, cell_size=100):
+        self.cell_size = cell_size
+        self.widgets = {}
+        self.cells = {}
+
+    def register(self, name, rect, handler, phases=None, group=None):
+        self.unregister(name)
+        widget = ClickableWidget(name, rect, handler, phases, group)
+        self.widgets[name] = widget
+        for cell in self.cells_for_rect(widget.rect):
+            self.cells.setdefault(cell, []).append(widget)
+        return widget
+
+    def unregister(self, name):
+        widget = self.widgets.pop(name, None)
+        if widget is None:
+            return
+        for cell in self.cells_for_rect(widget.rect):
+            self.cells[cell].remove(widget)
+            if not self.cells[cell]:
+                del self.cells[cell]
+
+    def set_enabled(self, name, enabled):
+        self.widgets[name].enabled = enabled
+
+    def cells_for_rect(self, rect):
+        first_column = rect.left // self.cell_size
+        last_column = (rect.right - 1) // self.cell_size
+        first_row = rect.top // self.cell_size
+        last_row = (rect.bottom - 1) // self.cell_size
+        return [
+            (column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        ]
+
+    def resolve(self, position, phase=None, group=None):
+        cell = (position[0] // self.cell_size, position[1] // self.cell_size)
+        # Widgets registered last are drawn on top, so they win overlaps.
+        for widget in reversed(self.cells.get(cell, ())):
+            if group is not None and widget.group != group:
+                continue
+            if widget.rect.collidepoint(position) and widget.accepts(phase):
+                return widget
+        return None
+
+    def dispatch(self, position, phase=None, group=None):
+        widget = self.resolve(position, phase, group)
+        if widget is not None:
+            widget.handler()
+        return widget
@@ -0,0 +1,175 @@
+import json
+import time
+from collections import Counter
+import pygame
+
+OVERLAY_WIDTH = 560
+OVERLAY_LINE_HEIGHT = 22
+
+
+class LatencyHistogram:
+    # Log-linear buckets as in HdrHistogram: every power of two is split into
+    # 32 linear steps and values are reported at their bucket's lower bound,
+    # so they read at most 1/32 (about 3%) low while the whole range from
+    # nanoseconds to seconds fits in a few hundred counters.
+    SUB_BUCKET_BITS = 6
+
+    def __init__(self):
+        self.counts = Counter()
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+
+    def bucket(self, value):
+        shift = max(0, value.bit_length() - self.SUB_BUCKET_BITS)
+        return (value >> shift) << shift
+
+    def record(self, value):
+        self.counts[self.bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, fraction):
+        if not self.count:
+            return 0
+        target = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= target:
+                return bucket
+        return self.maximum
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "mean_ns": self.mean,
+            "p50_ns": self.percentile(0.5),
+            "p99_ns": self.percentile(0.99),
+            "max_ns": self.maximum,
+            "buckets": {
+                str(bucket): self.counts[bucket] for bucket in sorted(self.counts)
+            },
+        }
+
+
+class Instrumentation:
+    def __init__(self, game):
+        self.game = game
+        self.histograms = {}
+        self.phase_counts = {}
+        self.wrapped = []
+        self.overlay_visible = False
+        self.font = game.fonts.get("Arial", 18)
+
+    def hooks(self):
+        game = self.game
+        return [
+            (game, "handle_event", "Game.handle_event"),
+            (game.game_ui, "draw", "GameUi.draw"),
+            (game.game_controller, "draw_all_cards", "GameController.draw_all_cards"),
+            (
+                game.game_controller,
+                "check_buttons_clicked",
+                "GameController.check_buttons_clicked",
+            ),
+            (
+                game.betting_logic,
+                "check_chip_clicked",
+                "BettingLogic.check_chip_clicked",
+            ),
+            (game.click_registry, "dispatch", "ClickRegistry.dispatch"),
+        ]
+
+    def install(self):
+        # Hooks shadow the bound methods on the instances only, so a game that
+        # never installs them runs the plain methods with no extra calls.
+        for target, attribute, name in self.hooks():
+            setattr(target, attribute, self.timed(name, getattr(target, attribute)))
+            self.wrapped.append((target, attribute))
+
+    def uninstall(self):
+        for target, attribute in self.wrapped:
+            delattr(target, attribute)
+        self.wrapped = []
+
+    def timed(self, name, function):
+        histogram = self.histograms.setdefault(name, LatencyHistogram())
+        phase_counts = self.phase_counts.setdefault(name, Counter())
+        game = self.game
+
+        def wrapper(*args, **kwargs):
+            phase = game.current_phase
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.record(time.perf_counter_ns() - start)
+                phase_counts[phase] += 1
+
+        return wrapper
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+    def overlay_lines(self):
+        lines = []
+        for name, histogram in self.histograms.items():
+            if not histogram.count:
+                continue
+            lines.append(
+                f"{name}: n={histogram.count} "
+                f"p50={histogram.percentile(0.5) / 1e6:.2f}ms "
+                f"p99={histogram.percentile(0.99) / 1e6:.2f}ms "
+                f"max={histogram.maximum / 1e6:.2f}ms"
+            )
+        phase_totals = Counter()
+        for phase_counts in self.phase_counts.values():
+            phase_totals.update(phase_counts)
+        for phase, count in phase_totals.most_common():
+            lines.append(f"{phase.name}: {count} calls")
+        return lines
+
+    def overlay_rect(self, lines):
+        height = OVERLAY_LINE_HEIGHT * len(lines) + 10
+        return pygame.Rect(
+            self.game.screen_width - OVERLAY_WIDTH - 20, 20, OVERLAY_WIDTH, height
+        )
+
+    def track_regions(self, renderer):
+        if self.overlay_visible:
+            lines = self.overlay_lines()
+            renderer.track("instrumentation", lines, self.overlay_rect(lines))
+
+    def draw(self):
+        if not self.overlay_visible:
+            return
+        lines = self.overlay_lines()
+        rect = self.overlay_rect(lines)
+        pygame.draw.rect(self.game.screen, (0, 0, 0), rect)
+        for index, line in enumerate(lines):
+            self.game.screen.blit(
+                self.font.render(line, True, "white"),
+                (rect.x + 5, rect.y + 5 + OVERLAY_LINE_HEIGHT * index),
+            )
+
+    def as_dict(self):
+        return {
+            "histograms": {
+                name: histogram.as_dict() for name, histogram in self.histograms.items()
+            },
+            "phase_counts": {
+                name: {phase.name: count for phase, count in phase_counts.items()}
+                for name, phase_counts in self.phase_counts.items()
+            },
+        }
+
+    def dump(self, path):
+        with open(path, "w") as output:
+            json.dump(self.as_dict(), output, indent=2)
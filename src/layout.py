@@ -0,0 +1,38 @@
+import pygame
+
+BASE_SIZE = (1600, 900)
+
+
+class Layout:
+    # Every position in the game is written for a 1600x900 table. The layout
+    # scales those coordinates uniformly and centres the table in the window,
+    # so other aspect ratios get a border of background instead of stretching.
+    def __init__(self, width=BASE_SIZE[0], height=BASE_SIZE[1]):
+        self.width = width
+        self.height = height
+        self.scale = min(width / BASE_SIZE[0], height / BASE_SIZE[1])
+        self.offset_x = round((width - BASE_SIZE[0] * self.scale) / 2)
+        self.offset_y = round((height - BASE_SIZE[1] * self.scale) / 2)
+
+    @property
+    def window_size(self):
+        return (self.width, self.height)
+
+    def point(self, position):
+        return (
+            self.offset_x + round(position[0] * self.scale),
+            self.offset_y + round(position[1] * self.scale),
+        )
+
+    def size(self, size):
+        return (
+            max(1, round(size[0] * self.scale)),
+            max(1, round(size[1] * self.scale)),
+        )
+
+    def rect(self, rect):
+        rect = pygame.Rect(rect)
+        return pygame.Rect(self.point(rect.topleft), self.size(rect.size))
+
+    def font_size(self, size):
+        return max(8, round(size * self.scale))
@@ -0,0 +1,154 @@
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from batch_simulator import (
+    OUTCOMES,
+    deal_streams,
+    simulate_hands,
+    threshold_strategy,
+)
+
+
+class RunningStats:
+    def __init__(self, count=0, mean=0.0, m2=0.0, minimum=None, maximum=None):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @classmethod
+    def from_array(cls, values):
+        if not len(values):
+            return cls()
+        mean = float(values.mean())
+        return cls(
+            count=len(values),
+            mean=mean,
+            m2=float(((values - mean) ** 2).sum()),
+            minimum=int(values.min()),
+            maximum=int(values.max()),
+        )
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+
+        # Chan et al. pairwise update, so partial results merge without
+        # keeping the individual rounds around.
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return RunningStats(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+            minimum=min(self.minimum, other.minimum),
+            maximum=max(self.maximum, other.maximum),
+        )
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+class SimulationResult:
+    def __init__(self, histogram=None, net_credits=0, stats=None):
+        self.histogram = (
+            histogram
+            if histogram is not None
+            else np.zeros(len(OUTCOMES), dtype=np.int64)
+        )
+        self.net_credits = net_credits
+        self.stats = stats if stats is not None else RunningStats()
+
+    def merge(self, other):
+        return SimulationResult(
+            self.histogram + other.histogram,
+            self.net_credits + other.net_credits,
+            self.stats.merge(other.stats),
+        )
+
+    def as_dict(self):
+        return {
+            "rounds": int(self.histogram.sum()),
+            "outcomes": {
+                state.value: int(count)
+                for state, count in zip(OUTCOMES, self.histogram)
+            },
+            "net_credits": self.net_credits,
+            "mean_delta": self.stats.mean,
+            "variance": self.stats.variance,
+            "min_delta": self.stats.minimum,
+            "max_delta": self.stats.maximum,
+        }
+
+
+def worker_rounds(rounds, workers):
+    return [rounds // workers + (index < rounds % workers) for index in range(workers)]
+
+
+def run_worker(rounds, seed_sequence, bet, stand_on, chunk_size):
+    rng = np.random.default_rng(seed_sequence)
+    strategy = threshold_strategy(stand_on)
+    result = SimulationResult()
+    while rounds > 0:
+        hands = min(rounds, chunk_size)
+        outcomes, deltas = simulate_hands(
+            deal_streams(hands, rng), bet=bet, strategy=strategy, rng=rng
+        )
+        result = result.merge(
+            SimulationResult(
+                np.bincount(outcomes, minlength=len(OUTCOMES)),
+                int(deltas.sum()),
+                RunningStats.from_array(deltas),
+            )
+        )
+        rounds -= hands
+    return result
+
+
+def run_simulation(
+    rounds, master_seed, workers=1, bet=1, stand_on=17, chunk_size=1_000_000
+):
+    seed_sequences = np.random.SeedSequence(master_seed).spawn(workers)
+    jobs = [
+        (worker_round_count, seed_sequence, bet, stand_on, chunk_size)
+        for worker_round_count, seed_sequence in zip(
+            worker_rounds(rounds, workers), seed_sequences
+        )
+    ]
+
+    if workers == 1:
+        results = [run_worker(*jobs[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_worker, *zip(*jobs)))
+
+    # Merge in worker order so the floating point reduction never depends on
+    # which process happened to finish first.
+    total = SimulationResult()
+    for result in results:
+        total = total.merge(result)
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo blackjack simulation")
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--bet", type=int, default=1)
+    parser.add_argument("--stand-on", type=int, default=17)
+    arguments = parser.parse_args()
+
+    result = run_simulation(
+        arguments.rounds,
+        arguments.seed,
+        workers=arguments.workers,
+        bet=arguments.bet,
+        stand_on=arguments.stand_on,
+    )
+    print(json.dumps(result.as_dict(), indent=2))
@@ -0,0 +1,13 @@
+import os
+import sys
+
+# Frozen builds unpack their data files next to the bundled modules; from a
+# checkout they live in the repository root above src/.
+if getattr(sys, "frozen", False):
+    BASE_DIRECTORY = sys._MEIPASS
+else:
+    BASE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resource_path(relative_path):
+    return os.path.join(BASE_DIRECTORY, relative_path)
@@ -0,0 +1,177 @@
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    player_credits INTEGER NOT NULL,
+    rounds INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS sessions_player ON sessions (player);
+CREATE TABLE IF NOT EXISTS rounds (
+    session_id INTEGER NOT NULL REFERENCES sessions (id),
+    round_number INTEGER NOT NULL,
+    player_bet INTEGER NOT NULL,
+    credit_delta INTEGER NOT NULL,
+    player_credits INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rounds_session ON rounds (session_id, round_number);
+"""
+SELECT_SESSION = "SELECT id, player_credits FROM sessions WHERE player = ?"
+INSERT_SESSION = (
+    "INSERT INTO sessions (player, player_credits, updated_at) VALUES (?, ?, ?)"
+)
+INSERT_ROUND = (
+    "INSERT INTO rounds (session_id, round_number, player_bet, credit_delta, "
+    "player_credits, phase, finished_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+SELECT_ROUNDS = (
+    "SELECT round_number, player_bet, credit_delta, player_credits, phase "
+    "FROM rounds WHERE session_id = ? ORDER BY round_number DESC LIMIT ?"
+)
+WRITE_ATTEMPTS = 3
+RETRY_DELAY = 0.1
+
+logger = logging.getLogger(__name__)
+
+RESTART_SESSION = "UPDATE sessions SET player_credits = ?, updated_at = ? WHERE id = ?"
+UPDATE_SESSION = (
+    "UPDATE sessions SET player_credits = ?, rounds = rounds + ?, updated_at = ? "
+    "WHERE id = ?"
+)
+
+
+def connect(path, timeout=5.0):
+    connection = sqlite3.connect(path, timeout=timeout)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class SessionStore:
+    def __init__(self, path, player="player", batch_size=64, timeout=5.0):
+        self.path = path
+        self.player = player
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.session_id = None
+        self.queue = queue.Queue()
+        self.writer_connection = None
+        self.dropped_rounds = 0
+        self.last_error = None
+
+        self.connection = connect(path, timeout)
+        self.connection.executescript(SCHEMA)
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+
+    def resume(self, default_credits=5000, minimum_credits=1):
+        row = self.connection.execute(SELECT_SESSION, (self.player,)).fetchone()
+        if row is not None:
+            self.session_id = row[0]
+            if row[1] >= minimum_credits:
+                return row[1]
+
+            # A broke player could never bet again, so the session restarts
+            # with the default stake, as every launch did before sessions.
+            with self.connection:
+                self.connection.execute(
+                    RESTART_SESSION, (default_credits, time.time(), self.session_id)
+                )
+            return default_credits
+
+        with self.connection:
+            cursor = self.connection.execute(
+                INSERT_SESSION, (self.player, default_credits, time.time())
+            )
+        self.session_id = cursor.lastrowid
+        return default_credits
+
+    def __call__(self, result):
+        self.record(result)
+
+    def record(self, result):
+        # Only the queue is touched on the caller's thread, the pygame loop
+        # never waits for sqlite.
+        self.queue.put(
+            (
+                self.session_id,
+                result.round_number,
+                result.player_bet,
+                result.credit_delta,
+                result.player_credits,
+                result.phase.name,
+                time.time(),
+            )
+        )
+
+    def write_loop(self):
+        while True:
+            rounds = [self.queue.get()]
+            while len(rounds) < self.batch_size:
+                try:
+                    rounds.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in rounds
+            rounds = [round_row for round_row in rounds if round_row is not None]
+            try:
+                if rounds:
+                    self.write_batch(rounds)
+            finally:
+                # flush() and close() wait on the queue, so every item is
+                # marked done even when its batch could not be written.
+                for _ in range(len(rounds) + stop):
+                    self.queue.task_done()
+            if stop:
+                if self.writer_connection is not None:
+                    self.writer_connection.close()
+                return
+
+    def write_batch(self, rounds):
+        for attempt in range(WRITE_ATTEMPTS):
+            try:
+                # The writer keeps its own connection; WAL lets the game
+                # thread read while a batch is being committed.
+                if self.writer_connection is None:
+                    self.writer_connection = connect(self.path, self.timeout)
+                self.write_rounds(self.writer_connection, rounds)
+                return True
+            except sqlite3.Error as error:
+                self.last_error = error
+                time.sleep(RETRY_DELAY * (attempt + 1))
+
+        self.dropped_rounds += len(rounds)
+        logger.warning("dropped %d rounds: %s", len(rounds), self.last_error)
+        return False
+
+    def write_rounds(self, connection, rounds):
+        last_round = rounds[-1]
+        with connection:
+            connection.executemany(INSERT_ROUND, rounds)
+            connection.execute(
+                UPDATE_SESSION,
+                (last_round[4], len(rounds), last_round[6], last_round[0]),
+            )
+
+    def round_summaries(self, limit=100):
+        self.flush()
+        return self.connection.execute(
+            SELECT_ROUNDS, (self.session_id, limit)
+        ).fetchall()
+
+    def flush(self):
+        self.queue.join()
+
+    def close(self):
+        self.queue.put(None)
+        self.writer.join()
+        self.connection.close()
@@ -0,0 +1,152 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+import pygame
+
+OVERLAY_WIDTH = 460
+OVERLAY_LINE_HEIGHT = 22
+MAX_SLOW_FRAMES = 200
+
+
+def collapse_stack(frame):
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class SlowFrame:
+    __slots__ = ("duration_ms", "phase", "last_action", "stacks")
+
+    def __init__(self, duration_ms, phase, last_action, stacks):
+        self.duration_ms = duration_ms
+        self.phase = phase
+        self.last_action = last_action
+        self.stacks = stacks
+
+    def describe(self):
+        text = f"{self.duration_ms:.1f} ms in {self.phase.name}"
+        if isinstance(self.last_action, tuple):
+            text += " after " + " ".join(str(part) for part in self.last_action)
+        elif self.last_action is not None:
+            text += f" after {self.last_action}"
+        if self.stacks:
+            text += f" at {self.stacks.most_common(1)[0][0].rsplit(';', 1)[-1]}"
+        return text
+
+
+class SamplingProfiler:
+    def __init__(
+        self,
+        budget_ms=1000 / 60,
+        interval=0.001,
+        thread_id=None,
+        max_slow_frames=MAX_SLOW_FRAMES,
+    ):
+        self.budget_ms = budget_ms
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks = Counter()
+        self.frame_stacks = Counter()
+        # Only the most recent slow frames are kept so a long session does not
+        # hold on to every stack it ever sampled.
+        self.slow_frames = deque(maxlen=max_slow_frames)
+        self.slow_frame_count = 0
+        self.frames = 0
+        self.last_frame_ms = 0.0
+        self.in_frame = False
+        self.frame_started = 0.0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.sampler = threading.Thread(target=self.sample_loop, daemon=True)
+
+    def start(self):
+        self.sampler.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.sampler.is_alive():
+            self.sampler.join()
+
+    def sample_loop(self):
+        # Samples are only taken while a frame is being processed; the time the
+        # main loop spends blocked waiting for events is not interesting.
+        while not self.stopped.wait(self.interval):
+            if not self.in_frame:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = collapse_stack(frame)
+            with self.lock:
+                self.frame_stacks[stack] += 1
+
+    def begin_frame(self):
+        self.frame_started = time.perf_counter()
+        self.in_frame = True
+
+    def end_frame(self, phase, last_action=None):
+        self.in_frame = False
+        self.frames += 1
+        self.last_frame_ms = (time.perf_counter() - self.frame_started) * 1000
+        with self.lock:
+            frame_stacks = self.frame_stacks
+            self.frame_stacks = Counter()
+        self.stacks.update(frame_stacks)
+
+        if self.last_frame_ms > self.budget_ms:
+            self.slow_frame_count += 1
+            self.slow_frames.append(
+                SlowFrame(self.last_frame_ms, phase, last_action, frame_stacks)
+            )
+
+    def collapsed_stacks(self):
+        return [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+
+    def write_collapsed(self, path):
+        with open(path, "w") as output:
+            for line in self.collapsed_stacks():
+                output.write(line + "\n")
+
+    def overlay_lines(self):
+        lines = [
+            f"frame {self.last_frame_ms:.1f} ms (budget {self.budget_ms:.1f})",
+            f"slow frames: {self.slow_frame_count} of {self.frames}",
+        ]
+        if self.slow_frames:
+            lines.append("last: " + self.slow_frames[-1].describe())
+        return lines
+
+
+class ProfilerOverlay:
+    def __init__(self, game, profiler):
+        self.game = game
+        self.profiler = profiler
+        self.font = game.fonts.get("Arial", 18)
+
+    def overlay_rect(self, lines):
+        height = OVERLAY_LINE_HEIGHT * len(lines) + 10
+        return pygame.Rect(
+            self.game.screen_width - OVERLAY_WIDTH - 20,
+            self.game.screen_height - height - 20,
+            OVERLAY_WIDTH,
+            height,
+        )
+
+    def track_regions(self, renderer):
+        lines = self.profiler.overlay_lines()
+        renderer.track("profiler", lines, self.overlay_rect(lines))
+
+    def draw(self):
+        lines = self.profiler.overlay_lines()
+        rect = self.overlay_rect(lines)
+        pygame.draw.rect(self.game.screen, (0, 0, 0), rect)
+        for index, line in enumerate(lines):
+            self.game.screen.blit(
+                self.font.render(line, True, "white"),
+                (rect.x + 5, rect.y + 5 + OVERLAY_LINE_HEIGHT * index),
+            )
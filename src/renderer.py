@@ -0,0 +1,74 @@
+import pygame
+
+_MISSING = object()
+
+
+class DirtyRectRenderer:
+    def __init__(self, screen):
+        self.screen = screen
+        self.regions = {}
+        self.tracked_keys = set()
+        self.dirty_rects = []
+        self.full_redraw = True
+
+    def track(self, key, value, rect):
+        rect = pygame.Rect(rect)
+        self.tracked_keys.add(key)
+        previous_value, previous_rect = self.regions.get(key, (_MISSING, None))
+        if previous_value == value and previous_rect == rect:
+            return
+
+        if previous_rect is not None:
+            self.dirty_rects.append(previous_rect)
+        self.dirty_rects.append(rect)
+        self.regions[key] = (value, rect)
+
+    def invalidate(self, rect):
+        self.dirty_rects.append(pygame.Rect(rect))
+
+    def invalidate_all(self):
+        self.full_redraw = True
+
+    def collect_dirty_rects(self):
+        # Regions that were not tracked this frame have disappeared from the
+        # table, so the area they covered has to be repainted as well.
+        for key in list(self.regions):
+            if key not in self.tracked_keys:
+                self.dirty_rects.append(self.regions.pop(key)[1])
+        self.tracked_keys = set()
+
+        if self.full_redraw:
+            dirty_rects = [self.screen.get_rect()]
+        else:
+            dirty_rects = self.merge_rects(self.dirty_rects)
+
+        self.dirty_rects = []
+        self.full_redraw = False
+        return dirty_rects
+
+    def merge_rects(self, rects):
+        merged = []
+        for rect in rects:
+            rect = rect.clip(self.screen.get_rect())
+            if rect.width == 0 or rect.height == 0:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def render(self, draw_callbacks):
+        dirty_rects = self.collect_dirty_rects()
+        if not dirty_rects:
+            return dirty_rects
+
+        for rect in dirty_rects:
+            self.screen.set_clip(rect)
+            for draw in draw_callbacks:
+                draw()
+        self.screen.set_clip(None)
+
+        pygame.display.update(dirty_rects)
+        return dirty_rects
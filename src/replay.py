@@ -0,0 +1,188 @@
+import argparse
+import random
+import time
+from cards import Cards
+from engine import BlackjackEngine
+from enums import GameState
+
+
+class ScriptedCards:
+    def __init__(self, cards=()):
+        self.cards = list(cards)
+        self.position = 0
+
+    def draw(self):
+        card = self.cards[self.position]
+        self.position += 1
+        return card
+
+    def remaining(self):
+        return len(self.cards) - self.position
+
+    def shuffle_if_needed(self):
+        return False
+
+
+def round_card_sequence(record):
+    # The engine draws two player cards, two dealer cards, then every player
+    # hit and finally the dealer's own draws, so that order rebuilds the shoe.
+    player_cards = record["player_cards"]
+    dealer_cards = record["dealer_cards"]
+    return player_cards[:2] + dealer_cards[:2] + player_cards[2:] + dealer_cards[2:]
+
+
+def starting_credits(records, default=5000):
+    if not records:
+        return default
+    first = records[0]
+    return first["player_credits"] - first["credit_delta"]
+
+
+class ReplayReport:
+    def __init__(self):
+        self.rounds = 0
+        self.actions = 0
+        self.mismatches = []
+        self.elapsed = 0.0
+
+    @property
+    def ok(self):
+        return not self.mismatches
+
+    @property
+    def rounds_per_second(self):
+        return self.rounds / self.elapsed if self.elapsed > 0 else 0.0
+
+    def check(self, round_number, field, expected, actual):
+        if expected is not None and expected != actual:
+            self.mismatches.append((round_number, field, expected, actual))
+
+
+def engine_actions(engine):
+    return {
+        "bet": engine.place_bet,
+        "deal": engine.deal,
+        "hit": engine.hit,
+        "stand": engine.stand,
+        "reset": engine.reset,
+    }
+
+
+def replay_rounds(rounds, engine, actions=None, scripted_cards=True, on_action=None):
+    if actions is None:
+        actions = engine_actions(engine)
+    # Hand logs only keep each round's final phase, so a logged replay checks
+    # where every round ends but not the transitions between its actions;
+    # rounds carrying a "phases" list are checked after every action.
+    report = ReplayReport()
+    start = time.perf_counter()
+    logged_round = None
+
+    for round_number, replay_round in enumerate(rounds, start=1):
+        if engine.current_phase != GameState.BETTING:
+            actions["reset"]()
+        # Every launch appends to the log and numbers its rounds from 1 again,
+        # so a falling round number starts over from that run's balance.
+        previous_round = logged_round
+        logged_round = replay_round.get("round_number")
+        if previous_round is not None and logged_round is not None:
+            if logged_round <= previous_round:
+                engine.player_credits = starting_credits([replay_round])
+        if scripted_cards:
+            engine.cards = ScriptedCards(round_card_sequence(replay_round))
+
+        actions["bet"](replay_round["player_bet"])
+        expected_phases = replay_round.get("phases")
+        try:
+            for index, action in enumerate(replay_round["actions"]):
+                actions[action]()
+                report.actions += 1
+                if on_action is not None:
+                    on_action(engine, action)
+                if expected_phases is not None:
+                    report.check(
+                        round_number,
+                        f"phase after {action}",
+                        expected_phases[index],
+                        engine.current_phase,
+                    )
+        except IndexError:
+            report.check(round_number, "cards", "recorded cards", "ran out")
+            report.rounds += 1
+            continue
+
+        report.check(
+            round_number, "phase", replay_round.get("phase"), engine.current_phase
+        )
+        report.check(
+            round_number,
+            "player_credits",
+            replay_round.get("player_credits"),
+            engine.player_credits,
+        )
+        if scripted_cards:
+            report.check(round_number, "unused cards", 0, engine.cards.remaining())
+        report.rounds += 1
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def replay_history(records, on_action=None):
+    engine = BlackjackEngine(player_credits=starting_credits(records))
+    return replay_rounds(records, engine, on_action=on_action)
+
+
+def replay_seeded(rounds, seed, player_credits=5000, decks=6):
+    engine = BlackjackEngine(
+        player_credits=player_credits, cards=Cards(rng=random.Random(seed), decks=decks)
+    )
+    return replay_rounds(rounds, engine, scripted_cards=False)
+
+
+def render_replay(game, records, speed=1.0, action_delay=500):
+    import pygame
+
+    if speed <= 0:
+        raise ValueError("replay speed must be greater than zero")
+
+    controller = game.game_controller
+    actions = {
+        "bet": game.betting_logic.place_bet,
+        "deal": controller.deal_cards,
+        "hit": controller.handle_hit,
+        "stand": controller.handle_stand,
+        "reset": controller.reset_game,
+    }
+
+    def show(engine, action):
+        pygame.event.pump()
+        game.render()
+        pygame.time.wait(int(action_delay / speed))
+
+    game.renderer.invalidate_all()
+    return replay_rounds(records, game.engine, actions=actions, on_action=show)
+
+
+def print_report(report):
+    if report.rounds == 0:
+        print("no rounds to replay")
+        return
+    print(
+        f"{report.rounds} rounds, {report.actions} actions, "
+        f"{report.rounds_per_second:.0f} rounds/s, {len(report.mismatches)} mismatches"
+    )
+    for mismatch in report.mismatches[:20]:
+        print("round {}: {} expected {!r}, got {!r}".format(*mismatch))
+
+
+if __name__ == "__main__":
+    from hand_history import HandHistoryReader
+
+    parser = argparse.ArgumentParser(description="Replay a hand history log")
+    parser.add_argument("history")
+    arguments = parser.parse_args()
+
+    reader = HandHistoryReader(arguments.history)
+    print_report(replay_history(list(reader)))
+    reader.close()
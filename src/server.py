@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from cards import Cards
+from engine import BlackjackEngine
+
+
+def table_state(engine):
+    dealer_cards = list(engine.dealer_cards)
+    if engine.dealer_card_hidden:
+        dealer_cards[1] = None
+
+    return {
+        "phase": engine.current_phase.name,
+        "player_credits": engine.player_credits,
+        "player_bet": engine.player_bet,
+        "player_score": engine.player_score,
+        "dealer_score": engine.dealer_score,
+        "player_cards": list(engine.player_cards),
+        "dealer_cards": dealer_cards,
+        "dealer_card_hidden": engine.dealer_card_hidden,
+    }
+
+
+class Table:
+    def __init__(self, table_id, engine, latency_samples=1024):
+        self.table_id = table_id
+        self.engine = engine
+        self.opened_at = time.perf_counter()
+        self.actions = 0
+        self.latencies = deque(maxlen=latency_samples)
+
+    def record_latency(self, seconds):
+        self.actions += 1
+        self.latencies.append(seconds)
+
+    def stats(self):
+        elapsed = time.perf_counter() - self.opened_at
+        return {
+            "table": self.table_id,
+            "actions": self.actions,
+            "actions_per_second": self.actions / elapsed if elapsed > 0 else 0.0,
+            "p99_ms": percentile(self.latencies, 0.99) * 1000,
+        }
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class TableServer:
+    def __init__(self, player_credits=5000, decks=6):
+        self.player_credits = player_credits
+        self.decks = decks
+        self.tables = {}
+        self.next_table_id = 1
+        self.started_at = time.perf_counter()
+
+    def open_table(self):
+        table_id = self.next_table_id
+        self.next_table_id += 1
+        engine = BlackjackEngine(
+            player_credits=self.player_credits, cards=Cards(decks=self.decks)
+        )
+        self.tables[table_id] = Table(table_id, engine)
+        return table_id
+
+    def close_table(self, table_id):
+        return self.tables.pop(table_id, None) is not None
+
+    def handle_request(self, request, owned_tables=None):
+        # owned_tables holds the ids opened over one connection; other
+        # connections' tables are treated as unknown. In-process callers pass
+        # None and may use every table.
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be a JSON object"}
+
+        action = request.get("action")
+        if action == "open":
+            table_id = self.open_table()
+            if owned_tables is not None:
+                owned_tables.add(table_id)
+            return {"ok": True, "table": table_id, **table_state(self.engine(table_id))}
+        if action == "stats":
+            return {"ok": True, **self.stats(request.get("table"))}
+
+        table = self.tables.get(request.get("table"))
+        if table is None or (
+            owned_tables is not None and table.table_id not in owned_tables
+        ):
+            return {"ok": False, "error": "unknown table"}
+
+        start = time.perf_counter()
+        engine = table.engine
+        if action == "close":
+            self.close_table(table.table_id)
+            if owned_tables is not None:
+                owned_tables.discard(table.table_id)
+            return {"ok": True, "table": table.table_id}
+        if action == "bet":
+            value = request.get("value")
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                return {"ok": False, "error": "bet must be a positive integer"}
+            accepted = engine.place_bet(value)
+        elif action == "deal":
+            accepted = engine.deal()
+        elif action == "hit":
+            accepted = engine.hit()
+        elif action == "stand":
+            accepted = engine.stand()
+        elif action == "reset":
+            # Resetting mid-round would walk away from a losing hand for free.
+            accepted = engine.is_round_over()
+            if accepted:
+                engine.reset()
+        elif action == "state":
+            accepted = True
+        else:
+            return {"ok": False, "error": f"unknown action {action!r}"}
+
+        response = {"ok": accepted, "table": table.table_id, **table_state(engine)}
+        table.record_latency(time.perf_counter() - start)
+        return response
+
+    def engine(self, table_id):
+        return self.tables[table_id].engine
+
+    def stats(self, table_id=None):
+        if table_id is not None:
+            table = self.tables.get(table_id)
+            return table.stats() if table is not None else {}
+
+        elapsed = time.perf_counter() - self.started_at
+        actions = sum(table.actions for table in self.tables.values())
+        latencies = [
+            latency for table in self.tables.values() for latency in table.latencies
+        ]
+        table_p99s = [table.stats()["p99_ms"] for table in self.tables.values()]
+        return {
+            "tables": len(self.tables),
+            "actions": actions,
+            "actions_per_second": actions / elapsed if elapsed > 0 else 0.0,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+            "worst_table_p99_ms": max(table_p99s, default=0.0),
+        }
+
+    async def handle_client(self, reader, writer):
+        # Tables belong to the connection that opened them and are closed when
+        # it goes away, so dropped clients cannot leak engines.
+        open_tables = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = self.handle_request(json.loads(line), open_tables)
+                except (ValueError, TypeError, OverflowError) as error:
+                    response = {"ok": False, "error": str(error)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionResetError:
+            pass
+        finally:
+            for table_id in open_tables:
+                self.close_table(table_id)
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8765):
+        return await asyncio.start_server(self.handle_client, host, port)
+
+    async def start_unix(self, path):
+        return await asyncio.start_unix_server(self.handle_client, path)
+
+
+async def serve(host, port, unix_socket=None):
+    table_server = TableServer()
+    if unix_socket:
+        server = await table_server.start_unix(unix_socket)
+    else:
+        server = await table_server.start(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Blackjack table server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket")
+    arguments = parser.parse_args()
+
+    asyncio.run(serve(arguments.host, arguments.port, arguments.unix_socket))
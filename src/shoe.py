@@ -0,0 +1,40 @@
+import random
+from array import array
+
+
+class Shoe:
+    def __init__(self, card_count=52, decks=6, penetration=0.75, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+        self.decks = decks
+        self.cards = array("B", range(card_count)) * decks
+        self.cut_card = int(len(self.cards) * penetration)
+        self.cursor = 0
+        self.shuffle_count = 0
+
+        self.shuffle()
+
+    def shuffle(self):
+        self.rng.shuffle(self.cards)
+        self.cursor = 0
+        self.shuffle_count += 1
+
+    def draw(self):
+        if self.cursor >= len(self.cards):
+            self.shuffle()
+        card = self.cards[self.cursor]
+        self.cursor += 1
+        return card
+
+    def cut_card_reached(self):
+        return self.cursor >= self.cut_card
+
+    def shuffle_if_needed(self):
+        # The cut card only ends the shoe between rounds, a round in progress
+        # keeps drawing from the remaining cards.
+        if self.cut_card_reached():
+            self.shuffle()
+            return True
+        return False
+
+    def remaining(self):
+        return len(self.cards) - self.cursor
@@ -0,0 +1,24 @@
+import time
+
+
+class StartupProfile:
+    def __init__(self, started_at=None):
+        if started_at is None:
+            started_at = time.perf_counter()
+        self.marks = [("start", started_at)]
+
+    def mark(self, name):
+        self.marks.append((name, time.perf_counter()))
+
+    def elapsed_ms(self, name=None):
+        end = self.marks[-1][1]
+        if name is not None:
+            end = dict(self.marks)[name]
+        return (end - self.marks[0][1]) * 1000
+
+    def report(self):
+        lines = []
+        for (_, previous), (name, at) in zip(self.marks, self.marks[1:]):
+            lines.append(f"{name}: +{(at - previous) * 1000:.1f} ms")
+        lines.append(f"time to first frame: {self.elapsed_ms():.1f} ms")
+        return "\n".join(lines)
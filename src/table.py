@@ -0,0 +1,360 @@
+from array import array
+from cards import Cards, CARD_RANKS, CARD_VALUES
+from engine import END_GAME_PHASES, RoundResult
+from enums import GameState
+from hand import Hand
+
+MAX_SEATS = 7
+MAX_SPLITS = 3
+
+HAND_PLAYING = 0
+HAND_STOOD = 1
+HAND_DONE = 2
+NO_OUTCOME = -1
+
+
+class TableEngine:
+    def __init__(
+        self, seats=MAX_SEATS, player_credits=5000, cards=None, max_splits=MAX_SPLITS
+    ):
+        if not 1 <= seats <= MAX_SEATS:
+            raise ValueError(f"a table has between 1 and {MAX_SEATS} seats")
+
+        self.cards = cards if cards is not None else Cards()
+        self.seats = seats
+        self.max_splits = max_splits
+        self.player_credits = player_credits
+        self.seat_bets = array("q", [0] * seats)
+        self.selected_seat = 0
+        self.current_phase = GameState.BETTING
+        self.round_listeners = []
+        self.round_number = 0
+        self.changed_seats = set(range(seats))
+        self.clear_hands()
+
+    def clear_hands(self):
+        # Hands are stored column-wise: index n of every array describes hand n.
+        # A split inserts a new hand straight after the one it came from, so
+        # walking the arrays in order is also the order the hands are played.
+        self.hand_seats = array("B")
+        self.hand_bets = array("q")
+        self.hand_scores = array("B")
+        self.hand_soft_aces = array("B")
+        self.hand_status = array("B")
+        self.hand_outcomes = array("b")
+        self.hand_deltas = array("q")
+        self.hand_from_split = array("B")
+        self.hand_cards = []
+        self.hand_actions = []
+        self.active_hand = -1
+        self.dealer_hand = Hand()
+        self.dealer_score = 0
+        self.dealer_card_hidden = False
+
+    @property
+    def hand_count(self):
+        return len(self.hand_seats)
+
+    @property
+    def focus_hand(self):
+        if self.active_hand >= 0:
+            return self.active_hand
+        return self.hand_count - 1
+
+    @property
+    def player_cards(self):
+        if self.focus_hand < 0:
+            return []
+        return list(self.hand_cards[self.focus_hand])
+
+    @property
+    def player_hand(self):
+        return Hand(self.player_cards)
+
+    @property
+    def player_score(self):
+        if self.focus_hand < 0:
+            return 0
+        return self.hand_scores[self.focus_hand]
+
+    @property
+    def player_bet(self):
+        if self.current_phase == GameState.BETTING:
+            return sum(self.seat_bets)
+        return sum(self.hand_bets)
+
+    @property
+    def dealer_cards(self):
+        return self.dealer_hand.cards
+
+    @property
+    def dealer_total_score(self):
+        return self.dealer_hand.score
+
+    def seat_hands(self, seat):
+        return [
+            hand for hand in range(self.hand_count) if self.hand_seats[hand] == seat
+        ]
+
+    def committed_credits(self):
+        return sum(
+            bet
+            for bet, outcome in zip(self.hand_bets, self.hand_outcomes)
+            if outcome == NO_OUTCOME
+        )
+
+    def select_seat(self, seat):
+        if self.current_phase != GameState.BETTING or not 0 <= seat < self.seats:
+            return False
+
+        self.changed_seats.update((self.selected_seat, seat))
+        self.selected_seat = seat
+        return True
+
+    def place_bet(self, bet_value, seat=None):
+        if seat is None:
+            seat = self.selected_seat
+        if self.current_phase != GameState.BETTING or not 0 <= seat < self.seats:
+            return False
+        if sum(self.seat_bets) + bet_value > self.player_credits:
+            return False
+
+        self.seat_bets[seat] += bet_value
+        self.changed_seats.add(seat)
+        return True
+
+    def add_hand(self, seat, bet, position=None, from_split=False):
+        if position is None:
+            position = self.hand_count
+        self.hand_seats.insert(position, seat)
+        self.hand_bets.insert(position, bet)
+        self.hand_scores.insert(position, 0)
+        self.hand_soft_aces.insert(position, 0)
+        self.hand_status.insert(position, HAND_PLAYING)
+        self.hand_outcomes.insert(position, NO_OUTCOME)
+        self.hand_deltas.insert(position, 0)
+        self.hand_from_split.insert(position, from_split)
+        self.hand_cards.insert(position, array("B"))
+        self.hand_actions.insert(position, ["deal"])
+        self.changed_seats.add(seat)
+        return position
+
+    def add_card(self, hand, card):
+        self.hand_cards[hand].append(card)
+        score = self.hand_scores[hand] + CARD_VALUES[card]
+        soft_aces = self.hand_soft_aces[hand] + (CARD_VALUES[card] == 11)
+        while score > 21 and soft_aces:
+            score -= 10
+            soft_aces -= 1
+        self.hand_scores[hand] = score
+        self.hand_soft_aces[hand] = soft_aces
+        self.changed_seats.add(self.hand_seats[hand])
+        return score
+
+    def is_blackjack(self, hand):
+        return (
+            not self.hand_from_split[hand]
+            and len(self.hand_cards[hand]) == 2
+            and self.hand_scores[hand] == 21
+        )
+
+    def settle_hand(self, hand, phase, delta):
+        self.hand_status[hand] = HAND_DONE
+        self.hand_outcomes[hand] = END_GAME_PHASES.index(phase)
+        self.hand_deltas[hand] = delta
+        self.player_credits += delta
+        self.changed_seats.add(self.hand_seats[hand])
+
+    def deal(self):
+        if self.current_phase != GameState.BETTING or sum(self.seat_bets) <= 0:
+            return False
+
+        self.round_number += 1
+        self.clear_hands()
+        for seat in range(self.seats):
+            if self.seat_bets[seat] > 0:
+                self.add_hand(seat, self.seat_bets[seat])
+
+        for _ in range(2):
+            for hand in range(self.hand_count):
+                self.add_card(hand, self.cards.draw())
+            self.dealer_hand.add(self.cards.draw())
+
+        self.dealer_card_hidden = True
+        self.dealer_score = CARD_VALUES[self.dealer_hand.cards[0]]
+        self.current_phase = GameState.PLAYERS_HAND
+        self.settle_initial_hands()
+        return True
+
+    def settle_initial_hands(self):
+        if self.dealer_total_score == 21:
+            self.reveal_dealer_card()
+            for hand in range(self.hand_count):
+                if self.is_blackjack(hand):
+                    self.settle_hand(hand, GameState.DRAW, 0)
+                else:
+                    self.settle_hand(
+                        hand, GameState.DEALER_BLACKJACK, -self.hand_bets[hand]
+                    )
+            self.finish_round()
+            return
+
+        for hand in range(self.hand_count):
+            if self.is_blackjack(hand):
+                self.settle_hand(
+                    hand, GameState.BLACKJACK, round(self.hand_bets[hand] * 1.5)
+                )
+        self.next_hand()
+
+    def next_hand(self):
+        for hand in range(self.active_hand + 1, self.hand_count):
+            if self.hand_status[hand] == HAND_PLAYING:
+                self.set_active_hand(hand)
+                return
+
+        self.set_active_hand(-1)
+        if HAND_STOOD in self.hand_status:
+            self.play_dealer()
+        else:
+            self.reveal_dealer_card()
+            self.finish_round()
+
+    def set_active_hand(self, hand):
+        for changed in (self.active_hand, hand):
+            if changed >= 0:
+                self.changed_seats.add(self.hand_seats[changed])
+        self.active_hand = hand
+
+    def hit(self):
+        if self.current_phase != GameState.PLAYERS_HAND:
+            return False
+
+        hand = self.active_hand
+        self.hand_actions[hand].append("hit")
+        if self.add_card(hand, self.cards.draw()) > 21:
+            self.settle_hand(hand, GameState.BUSTED, -self.hand_bets[hand])
+            self.next_hand()
+        return True
+
+    def stand(self):
+        if self.current_phase != GameState.PLAYERS_HAND:
+            return False
+
+        hand = self.active_hand
+        self.hand_actions[hand].append("stand")
+        self.hand_status[hand] = HAND_STOOD
+        self.next_hand()
+        return True
+
+    def can_split(self):
+        if self.current_phase != GameState.PLAYERS_HAND:
+            return False
+
+        hand = self.active_hand
+        cards = self.hand_cards[hand]
+        return (
+            len(cards) == 2
+            and CARD_RANKS[cards[0]] == CARD_RANKS[cards[1]]
+            and len(self.seat_hands(self.hand_seats[hand])) <= self.max_splits
+            and self.committed_credits() + self.hand_bets[hand] <= self.player_credits
+        )
+
+    def split(self):
+        if not self.can_split():
+            return False
+
+        hand = self.active_hand
+        first_card, second_card = self.hand_cards[hand]
+        new_hand = self.add_hand(
+            self.hand_seats[hand],
+            self.hand_bets[hand],
+            position=hand + 1,
+            from_split=True,
+        )
+        self.hand_actions[hand].append("split")
+        self.hand_actions[new_hand] = list(self.hand_actions[hand])
+        self.hand_from_split[hand] = True
+        self.hand_cards[hand] = array("B")
+        self.hand_scores[hand] = 0
+        self.hand_soft_aces[hand] = 0
+        self.add_card(hand, first_card)
+        self.add_card(new_hand, second_card)
+        self.add_card(hand, self.cards.draw())
+        self.add_card(new_hand, self.cards.draw())
+
+        # Split aces get one card each and no further decisions.
+        if CARD_VALUES[first_card] == 11:
+            self.hand_status[hand] = HAND_STOOD
+            self.hand_status[new_hand] = HAND_STOOD
+            self.next_hand()
+        return True
+
+    def play_dealer(self):
+        self.current_phase = GameState.DEALERS_HAND
+        self.reveal_dealer_card()
+        while self.dealer_score < 17:
+            self.dealer_hit()
+        self.settle_standing_hands()
+
+    def settle_standing_hands(self):
+        # One pass over the columns settles every seat against the same dealer
+        # total, however many seats and split hands are on the table.
+        dealer_score = self.dealer_score
+        for hand in range(self.hand_count):
+            if self.hand_status[hand] != HAND_STOOD:
+                continue
+            score = self.hand_scores[hand]
+            bet = self.hand_bets[hand]
+            if dealer_score > 21:
+                self.settle_hand(hand, GameState.DEALER_BUSTED, bet)
+            elif dealer_score > score:
+                self.settle_hand(hand, GameState.DEALER_WON, -bet)
+            elif dealer_score == score:
+                self.settle_hand(hand, GameState.DRAW, 0)
+            else:
+                self.settle_hand(hand, GameState.PLAYER_WON, bet)
+        self.finish_round()
+
+    def dealer_hit(self):
+        self.dealer_score = self.dealer_hand.add(self.cards.draw())
+
+    def reveal_dealer_card(self):
+        self.dealer_card_hidden = False
+        self.dealer_score = self.dealer_total_score
+
+    def hand_phase(self, hand):
+        return END_GAME_PHASES[self.hand_outcomes[hand]]
+
+    def finish_round(self):
+        self.set_active_hand(-1)
+        if self.hand_count == 1:
+            self.current_phase = self.hand_phase(0)
+        else:
+            self.current_phase = GameState.ROUND_OVER
+
+        credits = self.player_credits - sum(self.hand_deltas)
+        for hand in range(self.hand_count):
+            credits += self.hand_deltas[hand]
+            result = RoundResult(
+                self.round_number,
+                self.hand_bets[hand],
+                self.hand_deltas[hand],
+                credits,
+                self.hand_phase(hand),
+                list(self.hand_cards[hand]),
+                list(self.dealer_cards),
+                list(self.hand_actions[hand]),
+            )
+            for listener in self.round_listeners:
+                listener(result)
+
+    def reset(self):
+        self.cards.shuffle_if_needed()
+        self.clear_hands()
+        for seat in range(self.seats):
+            self.seat_bets[seat] = 0
+        self.changed_seats.update(range(self.seats))
+        self.current_phase = GameState.BETTING
+
+    def is_round_over(self):
+        return self.current_phase in END_GAME_PHASES
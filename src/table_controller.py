@@ -0,0 +1,212 @@
+import pygame
+from cards import CARD_NAMES
+from engine import END_GAME_PHASES
+from enums import GameState
+from gamecontroller import GameController
+from table import NO_OUTCOME
+
+SEAT_LEFT = 310
+SEAT_WIDTH = 185
+SEAT_TOP = 540
+SEAT_BOTTOM = 795
+HAND_TOP = 568
+HAND_STEP = 42
+CARD_FAN = 22
+SEAT_CARD_SIZE = (73, 102)
+SPLIT_BUTTON = (1100, 800, 150, 50)
+WINNING_PHASES = [GameState.BLACKJACK, GameState.DEALER_BUSTED, GameState.PLAYER_WON]
+
+
+def fit_step(count, step, size, room):
+    # Long hands and extra splits squeeze their spacing instead of spilling
+    # out of the seat region the dirty-rect renderer repaints.
+    if count < 2:
+        return step
+    return min(step, (room - size) / (count - 1))
+
+
+def outcome_colour(outcome):
+    phase = END_GAME_PHASES[outcome]
+    if phase in WINNING_PHASES:
+        return "#32CD32"
+    if phase == GameState.DRAW:
+        return "white"
+    return "red"
+
+
+class TableController(GameController):
+    def __init__(self, game, button_rects):
+        self.seat_snapshots = [None] * game.engine.seats
+        self.snapshot_phase = None
+        super().__init__(game, button_rects)
+        self.game.game_ui.player_card_boxes = []
+
+    def load_fonts(self):
+        super().load_fonts()
+        self.seat_font = self.game.fonts.get(
+            "Arial", self.game.layout.font_size(24), bold=True
+        )
+
+    @property
+    def player_cards(self):
+        # Seats are drawn in their own row, so the single-hand slots stay empty.
+        return []
+
+    def register_buttons(self):
+        super().register_buttons()
+        registry = self.game.click_registry
+        layout = self.game.layout
+        self.split_button_rect = layout.rect(SPLIT_BUTTON)
+        registry.register(
+            "split",
+            self.split_button_rect,
+            self.handle_split,
+            phases=[GameState.PLAYERS_HAND],
+            group="button",
+        )
+        for seat in range(self.engine.seats):
+            registry.register(
+                ("seat", seat),
+                layout.rect(self.seat_rect(seat)),
+                lambda seat=seat: self.engine.select_seat(seat),
+                phases=[GameState.BETTING],
+                group="seat",
+            )
+
+    def seat_rect(self, seat):
+        left = SEAT_LEFT + SEAT_WIDTH * seat - 5
+        return (left, SEAT_TOP - 5, SEAT_WIDTH - 5, SEAT_BOTTOM - SEAT_TOP)
+
+    def hand_positions(self, seat, hands):
+        seat_left, seat_top, seat_width, seat_height = self.seat_rect(seat)
+        left = SEAT_LEFT + SEAT_WIDTH * seat
+        hand_step = fit_step(
+            len(hands), HAND_STEP, SEAT_CARD_SIZE[1], seat_top + seat_height - HAND_TOP
+        )
+        positions = []
+        for index, cards in enumerate(hands):
+            card_fan = fit_step(
+                len(cards), CARD_FAN, SEAT_CARD_SIZE[0], seat_left + seat_width - left
+            )
+            top = HAND_TOP + hand_step * index
+            positions.append(
+                [(left + card_fan * card, top) for card in range(len(cards))]
+            )
+        return positions
+
+    def handle_split(self):
+        self.engine.split()
+        self.update_advice()
+
+    def reset_game(self):
+        super().reset_game()
+        self.game.game_ui.player_card_boxes = []
+
+    def seat_snapshot(self, seat):
+        engine = self.engine
+        hands = engine.seat_hands(seat)
+        return (
+            engine.seat_bets[seat],
+            seat == engine.selected_seat and engine.current_phase == GameState.BETTING,
+            tuple(
+                (
+                    tuple(engine.hand_cards[hand]),
+                    engine.hand_outcomes[hand],
+                    hand == engine.active_hand,
+                )
+                for hand in hands
+            ),
+            sum(engine.hand_deltas[hand] for hand in hands),
+        )
+
+    def refresh_seats(self):
+        # Only seats the engine reported as changed are rebuilt; the renderer
+        # then repaints just the seats whose snapshot differs from last frame.
+        engine = self.engine
+        changed = engine.changed_seats
+        if self.snapshot_phase != engine.current_phase:
+            self.snapshot_phase = engine.current_phase
+            changed = range(engine.seats)
+        for seat in changed:
+            self.seat_snapshots[seat] = self.seat_snapshot(seat)
+        engine.changed_seats = set()
+
+    def track_regions(self, renderer):
+        super().track_regions(renderer)
+        self.refresh_seats()
+        layout = self.game.layout
+        for seat, snapshot in enumerate(self.seat_snapshots):
+            renderer.track(("seat", seat), snapshot, layout.rect(self.seat_rect(seat)))
+
+    def draw(self):
+        super().draw()
+        self.draw_seats()
+        self.draw_split_button()
+
+    def draw_seats(self):
+        self.refresh_seats()
+        clip = self.display.get_clip()
+        for seat, snapshot in enumerate(self.seat_snapshots):
+            rect = self.game.layout.rect(self.seat_rect(seat))
+            if clip.colliderect(rect):
+                self.draw_seat(seat, snapshot, rect)
+
+    def draw_seat(self, seat, snapshot, rect):
+        bet, selected, hands, delta = snapshot
+        layout = self.game.layout
+        if selected:
+            pygame.draw.rect(
+                self.display,
+                "#FFD700",
+                rect,
+                max(1, round(3 * layout.scale)),
+                round(10 * layout.scale),
+            )
+
+        settled = hands and all(hand[1] != NO_OUTCOME for hand in hands)
+        text = f"Seat {seat + 1}: {delta:+d}" if settled else f"Seat {seat + 1}: {bet}"
+        left = SEAT_LEFT + SEAT_WIDTH * seat
+        self.display.blit(
+            self.game.text_cache.render(self.seat_font, text, True, "white"),
+            layout.point((left, SEAT_TOP)),
+        )
+
+        card_size = layout.size(SEAT_CARD_SIZE)
+        positions = self.hand_positions(seat, [hand[0] for hand in hands])
+        for (cards, outcome, active), card_positions in zip(hands, positions):
+            for card, position in zip(cards, card_positions):
+                self.display.blit(
+                    self.game.assets.card(CARD_NAMES[card], card_size),
+                    layout.point(position),
+                )
+
+            if not cards:
+                continue
+            if active:
+                colour = "#FFD700"
+            elif outcome != NO_OUTCOME:
+                colour = outcome_colour(outcome)
+            else:
+                continue
+            (left, top), (right, _) = card_positions[0], card_positions[-1]
+            width = right + SEAT_CARD_SIZE[0] - left
+            pygame.draw.rect(
+                self.display,
+                colour,
+                layout.rect((left, top, width, SEAT_CARD_SIZE[1])),
+                max(1, round(3 * layout.scale)),
+                round(6 * layout.scale),
+            )
+
+    def draw_split_button(self):
+        layout = self.game.layout
+        pygame.draw.rect(
+            self.display,
+            "#FFD700",
+            self.split_button_rect,
+            border_radius=round(15 * layout.scale),
+        )
+        self.display.blit(
+            self.game.text_cache.render(self.button_font, "Split", True, (0, 0, 0)),
+            layout.point((1130, 800)),
+        )
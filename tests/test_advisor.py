@@ -0,0 +1,53 @@
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from advisor import HIT, STAND, advise, best_value, build_tables, hit_value, stand_value
+
+
+@pytest.mark.parametrize(
+    "player_total, soft, upcard, expected_action",
+    [
+        (16, False, 10, "hit"),
+        (16, False, 6, "stand"),
+        (12, False, 2, "hit"),
+        (12, False, 4, "stand"),
+        (17, False, 11, "stand"),
+        (17, True, 7, "hit"),
+        (19, True, 10, "stand"),
+        (11, False, 10, "hit"),
+    ],
+)
+def test_advice_matches_basic_strategy(player_total, soft, upcard, expected_action):
+    assert advise(player_total, soft, upcard)[0] == expected_action
+
+
+def test_twenty_one_always_stands():
+    for upcard in range(2, 12):
+        assert advise(21, False, upcard)[0] == "stand"
+
+
+def test_busted_hand_has_no_advice():
+    assert advise(22, False, 10) is None
+
+
+def test_standing_on_twenty_against_six_is_a_big_favourite():
+    assert stand_value(20, 6) > 0.6
+
+
+def test_tables_on_disk_match_a_fresh_build():
+    tables = build_tables()
+
+    assert STAND == tables["stand"]
+    assert HIT == tables["hit"]
+
+
+def test_soft_twenty_one_drawing_an_ace_makes_a_hard_twelve():
+    only_aces = [0.0] * 9 + [1.0]
+
+    for upcard in range(2, 12):
+        assert hit_value(21, 1, upcard, only_aces, {}) == best_value(
+            12, 0, upcard, only_aces, {}
+        )
@@ -0,0 +1,118 @@
+import sys
+import os
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+from animation import (
+    DEAL_DURATION,
+    DEAL_STAGGER,
+    FLIP_DURATION,
+    HIDDEN_CARD,
+    SHOE_POSITION,
+    CardAnimator,
+    Tween,
+)
+from frame_scheduler import FrameScheduler
+
+
+@pytest.fixture
+def setup_animator():
+    scheduler = FrameScheduler()
+    animator = CardAnimator(scheduler)
+    animator.update(0)
+
+    return scheduler, animator
+
+
+def test_tween_interpolates_between_start_and_end():
+    tween = Tween((0, 0), (100, 200), 100)
+
+    assert tween.value() == (0, 0)
+    tween.advance(100)
+    assert tween.value() == (100, 200)
+    assert tween.finished
+
+
+def test_tween_waits_for_its_delay():
+    tween = Tween((0, 0), (100, 0), 100, delay=50)
+
+    tween.advance(50)
+
+    assert tween.value() == (0, 0)
+    assert not tween.finished
+
+
+def test_new_cards_fly_in_from_the_shoe(setup_animator):
+    scheduler, animator = setup_animator
+
+    animator.sync(
+        [("a", "ace_of_spades", (600, 555)), ("b", "2_of_hearts", (760, 555))]
+    )
+
+    assert animator.sprite("a", "ace_of_spades", (600, 555))[1] == SHOE_POSITION
+    assert scheduler.animating
+    animator.update(DEAL_DURATION)
+    assert animator.sprite("a", "ace_of_spades", (600, 555))[1] == (600, 555)
+    assert animator.sprite("b", "2_of_hearts", (760, 555))[1] != (760, 555)
+    animator.update(DEAL_DURATION + DEAL_STAGGER)
+    assert animator.sprite("b", "2_of_hearts", (760, 555))[1] == (760, 555)
+    assert not scheduler.animating
+
+
+def test_hole_card_flips_when_revealed(setup_animator):
+    scheduler, animator = setup_animator
+    animator.sync([("hole", HIDDEN_CARD, (760, 100))])
+    animator.update(DEAL_DURATION)
+
+    animator.sync([("hole", "king_of_clubs", (760, 100))])
+
+    name, position, width_scale = animator.sprite("hole", "king_of_clubs", (760, 100))
+    assert (name, position, width_scale) == (HIDDEN_CARD, (760, 100), 1.0)
+    animator.update(DEAL_DURATION + FLIP_DURATION * 0.9)
+    name, position, width_scale = animator.sprite("hole", "king_of_clubs", (760, 100))
+    assert name == "king_of_clubs" and width_scale < 1.0
+    animator.update(DEAL_DURATION + FLIP_DURATION)
+    assert animator.sprite("hole", "king_of_clubs", (760, 100))[2] == 1.0
+
+
+def test_removed_cards_stop_animating(setup_animator):
+    scheduler, animator = setup_animator
+    animator.sync([("a", "ace_of_spades", (600, 555))])
+
+    animator.sync([])
+
+    assert not animator.active
+    assert not scheduler.animating
+
+
+def test_game_state_does_not_wait_for_animations():
+    pygame.init()
+    game = Game()
+    game.betting_logic.place_bet(10)
+
+    game.game_controller.deal_cards()
+    game.render()
+
+    assert len(game.engine.player_cards) == 2
+    assert game.animator.active
+    assert game.scheduler.animating
+
+
+def test_only_moving_cards_are_repainted():
+    pygame.init()
+    game = Game()
+    game.render()
+    game.betting_logic.place_bet(10)
+    game.game_controller.deal_cards()
+    game.render()
+
+    game.animator.last_update -= DEAL_DURATION // 2
+    dirty_rects = game.render()
+
+    assert dirty_rects
+    assert all(rect.width < game.screen_width for rect in dirty_rects)
+    assert not any(rect.collidepoint((20, 20)) for rect in dirty_rects)
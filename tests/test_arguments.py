@@ -0,0 +1,38 @@
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import parse_arguments
+
+
+def test_defaults_play_a_single_local_seat():
+    arguments = parse_arguments([])
+
+    assert arguments.seats == 1
+    assert arguments.history is None
+    assert not arguments.system_fonts
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--connect", "localhost:8765", "--history", "hands.bin"],
+        ["--unix-socket", "/tmp/table.sock", "--history", "hands.bin"],
+        ["--connect", "localhost:8765", "--seats", "3"],
+        ["--seats", "3", "--history", "hands.bin"],
+        ["--replay", "hands.bin", "--speed", "0"],
+        ["--replay", "hands.bin", "--speed", "-2"],
+    ],
+)
+def test_unsupported_combinations_are_rejected(argv):
+    with pytest.raises(SystemExit):
+        parse_arguments(argv)
+
+
+def test_history_is_allowed_on_a_local_table():
+    arguments = parse_arguments(["--history", "hands.bin"])
+
+    assert arguments.history == "hands.bin"
@@ -0,0 +1,59 @@
+import sys
+import os
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+from cards import Cards
+
+
+@pytest.fixture
+def setup_assets():
+    pygame.init()
+
+    game = Game()
+
+    return game.assets
+
+
+def test_every_card_is_preloaded_at_card_size(setup_assets):
+    assets = setup_assets
+
+    for name in list(Cards().possible_cards) + ["back_dark", "back_light"]:
+        assert assets.card(name).get_size() == (146, 205)
+
+
+def test_every_chip_is_preloaded_at_chip_size(setup_assets):
+    assets = setup_assets
+
+    assert len(assets.chips) == 6
+    for chip in assets.chips.values():
+        assert chip.get_size() == (80, 80)
+
+
+def test_assets_are_served_from_cache(setup_assets):
+    assets = setup_assets
+
+    assert assets.card("hearts_A") is assets.card("hearts_A")
+    assert assets.chip("one") is assets.chip("one")
+
+
+def test_atlas_regions_are_subsurfaces_of_one_image(setup_assets):
+    assets = setup_assets
+
+    assert assets.atlas is not None
+    assert assets.card("clubs_2").get_parent() is assets.atlas
+    assert assets.chip("onehundred").get_parent() is assets.atlas
+
+
+def test_assets_load_from_any_working_directory(tmp_path, monkeypatch):
+    pygame.init()
+    monkeypatch.chdir(tmp_path)
+
+    game = Game()
+
+    assert game.assets.atlas is not None
+    assert len(game.assets.chips) == 6
@@ -0,0 +1,72 @@
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+np = pytest.importorskip("numpy")
+
+from batch_simulator import (
+    BUSTED,
+    OUTCOMES,
+    deal_streams,
+    simulate_hands,
+    simulate_rounds,
+    threshold_strategy,
+)
+from cards import RANK_VALUES
+from engine import BlackjackEngine
+
+
+def card_for_value(value):
+    return RANK_VALUES.index(value)
+
+
+class StreamCards:
+    def __init__(self, values):
+        self.values = iter(int(value) for value in values)
+
+    def draw(self):
+        value = next(self.values)
+        return card_for_value(value)
+
+
+def play_with_engine(stream, stand_on):
+    engine = BlackjackEngine(player_credits=1000, cards=StreamCards(stream))
+    engine.place_bet(10)
+    engine.deal()
+    while engine.player_score < stand_on and engine.hit():
+        pass
+    engine.stand()
+    return engine.current_phase, engine.player_credits - 1000
+
+
+@pytest.mark.parametrize("stand_on", [12, 17, 19])
+def test_batch_outcomes_match_engine(stand_on):
+    streams = deal_streams(2000, np.random.default_rng(stand_on))
+
+    outcomes, deltas = simulate_hands(
+        streams, bet=10, strategy=threshold_strategy(stand_on)
+    )
+
+    for index, stream in enumerate(streams):
+        phase, delta = play_with_engine(stream, stand_on)
+        assert OUTCOMES[outcomes[index]] == phase
+        assert deltas[index] == delta
+
+
+def test_standing_on_everything_never_busts():
+    streams = deal_streams(10000, np.random.default_rng(1))
+
+    outcomes, _ = simulate_hands(streams, strategy=threshold_strategy(0))
+
+    assert BUSTED not in outcomes
+
+
+def test_simulate_rounds_is_reproducible_and_chunked():
+    first = simulate_rounds(25000, seed=7, chunk_size=10000)
+    second = simulate_rounds(25000, seed=7, chunk_size=10000)
+
+    assert first[0].sum() == 25000
+    assert (first[0] == second[0]).all()
+    assert first[1] == second[1]
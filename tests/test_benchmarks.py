@@ -0,0 +1,66 @@
+import sys
+import os
+import json
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+from benchmarks import FRAME_CARD_COUNTS, compare, metric, run_benchmarks
+
+
+@pytest.fixture
+def setup_game():
+    pygame.init()
+
+    game = Game()
+
+    return game
+
+
+def test_results_are_json_serialisable(setup_game):
+    game = setup_game
+
+    results = run_benchmarks(game, rounds=20, calls=100, frames=3)
+
+    assert json.loads(json.dumps(results)) == results
+    assert results["hands_per_second"]["value"] > 0
+    assert results["select_card"]["unit"] == "ns/call"
+    for card_count in FRAME_CARD_COUNTS:
+        assert results[f"frame_{card_count}_cards_mean"]["value"] > 0
+
+
+def test_frame_benchmark_leaves_the_table_ready_to_bet(setup_game):
+    game = setup_game
+
+    run_benchmarks(game, rounds=5, calls=10, frames=1)
+
+    assert game.player_bet == 0
+    assert game.engine.player_cards == []
+
+
+def test_compare_flags_slower_results_beyond_threshold():
+    baseline = {
+        "hands_per_second": metric(1000.0, "hands/s", True),
+        "frame": metric(2.0, "ms", False),
+    }
+    results = {
+        "hands_per_second": metric(850.0, "hands/s", True),
+        "frame": metric(2.1, "ms", False),
+    }
+
+    regressions = compare(results, baseline, threshold=0.10)
+
+    assert [regression[0] for regression in regressions] == ["hands_per_second"]
+
+
+def test_compare_ignores_improvements_and_new_metrics():
+    baseline = {"frame": metric(2.0, "ms", False)}
+    results = {
+        "frame": metric(1.0, "ms", False),
+        "new": metric(5.0, "ms", False),
+    }
+
+    assert compare(results, baseline) == []
@@ -0,0 +1,51 @@
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from dealer_odds import (
+    BUST,
+    CARD_VALUE_ORDER,
+    INFINITE_DECK,
+    build_table,
+    dealer_distribution,
+    dealer_odds,
+    load_table,
+    save_table,
+)
+
+
+@pytest.mark.parametrize("upcard", CARD_VALUE_ORDER)
+def test_distribution_adds_up_to_one(upcard):
+    assert sum(dealer_odds(upcard)) == pytest.approx(1.0)
+    assert sum(dealer_odds(upcard, INFINITE_DECK)) == pytest.approx(1.0)
+
+
+def test_dealer_busts_most_with_a_six_showing():
+    bust_chances = {upcard: dealer_odds(upcard)[BUST] for upcard in CARD_VALUE_ORDER}
+
+    assert max(bust_chances, key=bust_chances.get) == 6
+    assert bust_chances[6] == pytest.approx(0.4232, abs=0.0001)
+
+
+def test_peeked_ace_never_ends_on_blackjack_with_ten():
+    no_peek = dealer_distribution(11, peek=False)
+    peek = dealer_distribution(11, peek=True)
+
+    assert peek[4] < no_peek[4]
+
+
+def test_remaining_shoe_changes_the_odds():
+    tens_removed = list(INFINITE_DECK)
+    tens_removed[CARD_VALUE_ORDER.index(10)] = 0
+
+    assert dealer_odds(6, tens_removed)[BUST] < dealer_odds(6)[BUST]
+
+
+def test_saved_table_loads_back(tmp_path):
+    path = tmp_path / "dealer_odds.json"
+
+    save_table(path)
+
+    assert load_table(path)["peek"] == pytest.approx(build_table(True))
@@ -0,0 +1,143 @@
+import sys
+import os
+import subprocess
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from cards import RANK_VALUES
+from engine import BlackjackEngine
+from enums import GameState
+
+
+def card_for_value(value):
+    return RANK_VALUES.index(value)
+
+
+class StackedCards:
+    def __init__(self, values):
+        self.values = list(values)
+
+    def draw(self):
+        value = self.values.pop(0)
+        return card_for_value(value)
+
+    def shuffle_if_needed(self):
+        return False
+
+
+@pytest.fixture
+def setup_engine():
+    def create_engine(*values):
+        engine = BlackjackEngine(player_credits=100, cards=StackedCards(values))
+        engine.place_bet(10)
+        return engine
+
+    return create_engine
+
+
+def test_engine_does_not_import_pygame():
+    src_path = os.path.join(os.path.dirname(__file__), "../src")
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, engine; print('pygame' in sys.modules)"],
+        cwd=src_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_bet_above_credits_is_refused(setup_engine):
+    engine = setup_engine()
+
+    assert engine.place_bet(95) is False
+    assert engine.player_bet == 10
+
+
+def test_two_aces_count_as_twelve(setup_engine):
+    engine = setup_engine(11, 11, 10, 7)
+
+    engine.deal()
+
+    assert engine.player_score == 12
+    assert engine.current_phase == GameState.PLAYERS_HAND
+
+
+def test_two_aces_still_lose_to_dealer_blackjack(setup_engine):
+    engine = setup_engine(11, 11, 11, 10)
+
+    engine.deal()
+
+    assert engine.current_phase == GameState.DEALER_BLACKJACK
+    assert engine.player_credits == 90
+
+
+def test_soft_hand_does_not_bust(setup_engine):
+    engine = setup_engine(11, 5, 10, 7, 9, 10)
+
+    engine.deal()
+    engine.hit()
+
+    assert engine.player_score == 15
+    assert engine.current_phase == GameState.PLAYERS_HAND
+
+    engine.hit()
+
+    assert engine.current_phase == GameState.BUSTED
+    assert engine.player_credits == 90
+
+
+def test_dealer_draws_to_seventeen(setup_engine):
+    engine = setup_engine(10, 9, 10, 2, 3, 2)
+
+    engine.deal()
+    engine.stand()
+
+    assert engine.dealer_score == 17
+    assert engine.current_phase == GameState.PLAYER_WON
+    assert engine.player_credits == 110
+
+
+def test_dealer_bust_pays_player(setup_engine):
+    engine = setup_engine(10, 9, 10, 6, 10)
+
+    engine.deal()
+    engine.stand()
+
+    assert engine.current_phase == GameState.DEALER_BUSTED
+    assert engine.player_credits == 110
+
+
+def test_dealer_soft_ace_is_reduced(setup_engine):
+    engine = setup_engine(10, 9, 11, 5, 10, 3)
+
+    engine.deal()
+    engine.stand()
+
+    assert engine.dealer_score == 19
+    assert engine.current_phase == GameState.DRAW
+    assert engine.player_credits == 100
+
+
+def test_player_blackjack_pays_three_to_two(setup_engine):
+    engine = setup_engine(11, 10, 9, 7)
+
+    engine.deal()
+
+    assert engine.current_phase == GameState.BLACKJACK
+    assert engine.player_credits == 115
+    assert engine.dealer_card_hidden is True
+
+
+def test_reset_keeps_credits(setup_engine):
+    engine = setup_engine(10, 9, 10, 8)
+
+    engine.deal()
+    engine.stand()
+    engine.reset()
+
+    assert engine.current_phase == GameState.BETTING
+    assert engine.player_cards == []
+    assert engine.player_bet == 0
+    assert engine.player_credits == 110
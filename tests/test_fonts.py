@@ -0,0 +1,113 @@
+import sys
+import os
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+from fonts import BUNDLED_FONTS, FontRegistry, shared_registry
+
+
+@pytest.fixture
+def setup_registry():
+    pygame.font.init()
+
+    registry = FontRegistry(use_system_fonts=False)
+
+    return registry
+
+
+def test_each_font_is_resolved_once(setup_registry):
+    registry = setup_registry
+
+    first = registry.get("Arial", 40, bold=True)
+    second = registry.get("arial", 40, bold=True)
+
+    assert first is second
+    assert len(registry.fonts) == 1
+
+
+def test_size_and_style_are_part_of_the_key(setup_registry):
+    registry = setup_registry
+
+    fonts = {
+        registry.get("Arial", 40),
+        registry.get("Arial", 40, bold=True),
+        registry.get("Arial", 100, bold=True),
+        registry.get("Arial", 40, italic=True),
+    }
+
+    assert len(fonts) == 4
+
+
+def test_unknown_families_fall_back_to_the_bundled_font(setup_registry):
+    registry = setup_registry
+
+    font = registry.get("Some Missing Family", 40)
+
+    assert font.get_height() == pygame.font.Font(None, 40).get_height()
+
+
+def test_registered_font_files_are_used(setup_registry):
+    registry = setup_registry
+    path = os.path.join(
+        os.path.dirname(pygame.__file__), pygame.font.get_default_font()
+    )
+    registry.register("Table", path)
+
+    font = registry.get("Table", 30, bold=True)
+
+    assert font.get_bold()
+
+
+def test_system_fonts_are_opt_in():
+    pygame.init()
+
+    assert not FontRegistry().use_system_fonts
+    assert not Game().fonts.use_system_fonts
+    assert Game(system_fonts=True).fonts.use_system_fonts
+
+
+def test_shared_registry_draws_arial_with_the_bundled_font():
+    pygame.font.init()
+    registry = shared_registry()
+
+    label = registry.get("Arial", 40, bold=True)
+    overlay = registry.get("Arial", 18)
+
+    assert label.size("Deal") == pygame.font.Font(
+        BUNDLED_FONTS[("arial", True)], 40
+    ).size("Deal")
+    assert label.size("Deal")[0] > 80
+    assert overlay.size("Deal") == pygame.font.Font(
+        BUNDLED_FONTS[("arial", False)], 18
+    ).size("Deal")
+    assert registry.get("Some Missing Family", 40, bold=True).size(
+        "Deal"
+    ) == label.size("Deal")
+
+
+def test_shared_registry_is_process_wide():
+    assert shared_registry() is shared_registry()
+    assert shared_registry(False) is not shared_registry(True)
+
+
+def test_games_share_fonts():
+    pygame.init()
+
+    first = Game()
+    second = Game()
+
+    assert first.game_ui.font is second.game_ui.font
+    assert first.game_controller.button_font is first.game_ui.font
+
+
+def test_registry_can_be_injected(setup_registry):
+    registry = setup_registry
+
+    game = Game(fonts=registry)
+
+    assert game.fonts is registry
+    assert game.game_controller.busted_font is registry.get("Arial", 100, bold=True)
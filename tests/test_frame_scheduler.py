@@ -0,0 +1,44 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from frame_scheduler import FrameScheduler
+
+
+def test_first_frame_is_due_immediately():
+    scheduler = FrameScheduler(fps=60)
+
+    assert scheduler.wait_timeout(0) == 0
+    assert scheduler.frame_due(0)
+
+
+def test_idle_loop_blocks_until_next_event():
+    scheduler = FrameScheduler(fps=60)
+    scheduler.frame_done(0)
+
+    assert scheduler.wait_timeout(100) is None
+    assert not scheduler.frame_due(100)
+
+
+def test_redraw_waits_for_next_frame_slot():
+    scheduler = FrameScheduler(fps=50)
+    scheduler.frame_done(1000)
+    scheduler.request_redraw()
+
+    assert scheduler.wait_timeout(1005) == 15
+    assert not scheduler.frame_due(1005)
+    assert scheduler.frame_due(1020)
+
+
+def test_animation_keeps_frames_coming():
+    scheduler = FrameScheduler(fps=50)
+    scheduler.set_animating(True)
+    scheduler.frame_done(0)
+
+    assert scheduler.wait_timeout(0) == 20
+    assert scheduler.frame_due(20)
+
+    scheduler.set_animating(False)
+    scheduler.frame_done(20)
+    assert scheduler.wait_timeout(30) is None
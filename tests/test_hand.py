@@ -0,0 +1,48 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from cards import CARD_NAMES, CARD_NUMBERS, CARD_RANKS, CARD_SUITS, CARD_VALUES
+from hand import Hand
+
+
+def test_card_numbers_round_trip_through_lookup_tables():
+    assert len(CARD_NAMES) == 52
+    for card, name in enumerate(CARD_NAMES):
+        assert CARD_NUMBERS[name] == card
+        assert CARD_SUITS[card] * 13 + CARD_RANKS[card] == card
+
+    assert CARD_VALUES[CARD_NUMBERS["hearts_A"]] == 11
+    assert CARD_VALUES[CARD_NUMBERS["spades_K"]] == 10
+
+
+def test_hand_tracks_soft_aces_incrementally():
+    hand = Hand([CARD_NUMBERS["clubs_A"], CARD_NUMBERS["hearts_6"]])
+
+    assert hand.score == 17
+    assert hand.is_soft()
+
+    hand.add(CARD_NUMBERS["spades_9"])
+
+    assert hand.score == 16
+    assert not hand.is_soft()
+    assert not hand.is_busted()
+
+
+def test_two_aces_are_twelve():
+    hand = Hand([CARD_NUMBERS["clubs_A"], CARD_NUMBERS["hearts_A"]])
+
+    assert hand.score == 12
+    assert hand.aces_changed == 1
+
+
+def test_blackjack_flag_only_for_first_two_cards():
+    blackjack = Hand([CARD_NUMBERS["clubs_A"], CARD_NUMBERS["hearts_K"]])
+    three_card_twenty_one = Hand(
+        [CARD_NUMBERS["clubs_7"], CARD_NUMBERS["hearts_7"], CARD_NUMBERS["spades_7"]]
+    )
+
+    assert blackjack.blackjack
+    assert three_card_twenty_one.score == 21
+    assert not three_card_twenty_one.blackjack
@@ -0,0 +1,103 @@
+import sys
+import os
+import random
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from cards import Cards
+from engine import BlackjackEngine
+from enums import GameState
+from hand_history import RECORD_SIZE, HandHistoryReader, HandHistoryWriter
+
+
+def play_rounds(engine, rounds):
+    for _ in range(rounds):
+        engine.place_bet(10)
+        engine.deal()
+        while (
+            engine.current_phase == GameState.PLAYERS_HAND and engine.player_score < 15
+        ):
+            engine.hit()
+        engine.stand()
+        engine.reset()
+
+
+@pytest.fixture
+def setup_history(tmp_path):
+    path = tmp_path / "hands.bin"
+    engine = BlackjackEngine(player_credits=10000, cards=Cards(rng=random.Random(3)))
+    results = []
+    writer = HandHistoryWriter(path, batch_size=8)
+    engine.round_listeners.append(results.append)
+    engine.round_listeners.append(writer)
+
+    return path, engine, results, writer
+
+
+def test_every_round_is_written_as_one_record(setup_history):
+    path, engine, results, writer = setup_history
+
+    play_rounds(engine, 20)
+    writer.close()
+
+    assert os.path.getsize(path) == 20 * RECORD_SIZE
+    reader = HandHistoryReader(path)
+    assert len(reader) == 20
+    for record, result in zip(reader, results):
+        assert record["round_number"] == result.round_number
+        assert record["phase"] == result.phase
+        assert record["credit_delta"] == result.credit_delta
+        assert record["player_cards"] == result.player_cards
+        assert record["dealer_cards"] == result.dealer_cards
+        assert record["actions"] == result.actions
+    reader.close()
+
+
+def test_writes_are_batched(setup_history):
+    path, engine, results, writer = setup_history
+
+    play_rounds(engine, 5)
+    assert os.path.getsize(path) == 0
+
+    play_rounds(engine, 3)
+    assert os.path.getsize(path) == 8 * RECORD_SIZE
+    writer.close()
+
+
+def test_credit_deltas_add_up_to_bankroll_change(setup_history):
+    path, engine, results, writer = setup_history
+
+    play_rounds(engine, 50)
+    writer.close()
+
+    assert (
+        sum(result.credit_delta for result in results) == engine.player_credits - 10000
+    )
+
+
+def test_reader_exposes_records_as_numpy_array(setup_history):
+    np = pytest.importorskip("numpy")
+    path, engine, results, writer = setup_history
+
+    play_rounds(engine, 12)
+    writer.close()
+
+    reader = HandHistoryReader(path)
+    records = reader.as_array()
+    assert len(records) == 12
+    assert records["credit_delta"].sum() == engine.player_credits - 10000
+    assert list(records["round_number"]) == list(range(1, 13))
+    assert len(reader.record_view(3)) == RECORD_SIZE
+    del records
+
+
+def test_empty_log_has_no_records(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    reader = HandHistoryReader(path)
+
+    assert len(reader) == 0
+    assert list(reader) == []
+    reader.close()
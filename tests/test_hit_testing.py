@@ -0,0 +1,77 @@
+import sys
+import os
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from enums import GameState
+from hit_testing import ClickRegistry
+from main import Game
+
+
+@pytest.fixture
+def setup_registry():
+    clicks = []
+    registry = ClickRegistry(cell_size=100)
+    registry.register(
+        "deal",
+        (500, 800, 150, 50),
+        lambda: clicks.append("deal"),
+        phases=[GameState.BETTING],
+    )
+    registry.register("wide", (0, 0, 350, 250), lambda: clicks.append("wide"))
+
+    return registry, clicks
+
+
+def test_position_resolves_to_widget_spanning_several_cells(setup_registry):
+    registry, clicks = setup_registry
+
+    assert registry.resolve((340, 240)).name == "wide"
+    assert registry.resolve((640, 849), GameState.BETTING).name == "deal"
+    assert registry.resolve((650, 850), GameState.BETTING) is None
+
+
+def test_widget_ignores_clicks_outside_its_phases(setup_registry):
+    registry, clicks = setup_registry
+
+    assert registry.dispatch((520, 820), GameState.PLAYERS_HAND) is None
+    assert clicks == []
+
+    registry.dispatch((520, 820), GameState.BETTING)
+    assert clicks == ["deal"]
+
+
+def test_disabled_widget_is_skipped(setup_registry):
+    registry, clicks = setup_registry
+
+    registry.set_enabled("wide", False)
+    registry.dispatch((10, 10))
+
+    assert clicks == []
+
+
+def test_registering_same_name_replaces_widget(setup_registry):
+    registry, clicks = setup_registry
+
+    registry.register("wide", (900, 0, 10, 10), lambda: clicks.append("moved"))
+
+    assert registry.resolve((10, 10)) is None
+    registry.dispatch((905, 5))
+    assert clicks == ["moved"]
+
+
+def test_reset_button_only_clickable_after_round():
+    pygame.init()
+    game = Game()
+    game.player_bet = 50
+
+    assert game.click_registry.dispatch((700, 450), game.current_phase) is None
+    assert game.player_bet == 50
+
+    game.current_phase = GameState.DEALER_WON
+    assert game.click_registry.dispatch((700, 450), game.current_phase).name == "reset"
+    assert game.player_bet == 0
+    assert game.current_phase == GameState.BETTING
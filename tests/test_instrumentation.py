@@ -0,0 +1,97 @@
+import sys
+import os
+import json
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+from enums import GameState
+from instrumentation import LatencyHistogram
+
+
+@pytest.fixture
+def setup_game():
+    pygame.init()
+
+    game = Game()
+
+    return game
+
+
+def test_histogram_buckets_keep_small_relative_error():
+    histogram = LatencyHistogram()
+
+    for value in [1, 31, 1_000, 123_456, 9_876_543]:
+        assert 0 <= value - histogram.bucket(value) <= value / 32
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value * 1000)
+
+    assert histogram.count == 100
+    assert histogram.maximum == 100_000
+    assert histogram.percentile(0.5) == pytest.approx(50_000, rel=0.05)
+    assert histogram.percentile(0.99) == pytest.approx(99_000, rel=0.05)
+
+
+def test_methods_are_untouched_until_installed(setup_game):
+    game = setup_game
+
+    assert "draw" not in vars(game.game_ui)
+    assert game.instrumentation is None
+
+
+def test_installed_hooks_time_calls_per_phase(setup_game):
+    game = setup_game
+    instrumentation = game.enable_instrumentation()
+
+    game.render()
+    game.betting_logic.check_chip_clicked((30, 690))
+    game.game_controller.check_buttons_clicked((550, 820))
+
+    draws = instrumentation.histograms["GameUi.draw"]
+    assert draws.count == 1
+    assert instrumentation.phase_counts["GameUi.draw"][GameState.BETTING] == 1
+    assert instrumentation.histograms["BettingLogic.check_chip_clicked"].count == 1
+    assert game.player_bet == 1
+
+
+def test_uninstall_restores_plain_methods(setup_game):
+    game = setup_game
+    instrumentation = game.enable_instrumentation()
+
+    instrumentation.uninstall()
+
+    assert "draw" not in vars(game.game_ui)
+    assert "handle_event" not in vars(game)
+
+
+def test_overlay_is_toggled_by_f3(setup_game):
+    game = setup_game
+    instrumentation = game.enable_instrumentation()
+    game.render()
+
+    game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3))
+    game.render()
+
+    assert instrumentation.overlay_visible
+    assert "instrumentation" in game.renderer.regions
+    assert any("GameUi.draw" in line for line in instrumentation.overlay_lines())
+
+
+def test_dump_writes_json(setup_game, tmp_path):
+    game = setup_game
+    instrumentation = game.enable_instrumentation()
+    game.render()
+    path = tmp_path / "timings.json"
+
+    instrumentation.dump(path)
+
+    data = json.loads(path.read_text())
+    assert data["histograms"]["GameUi.draw"]["count"] == 1
+    assert data["phase_counts"]["GameUi.draw"] == {"BETTING": 1}
@@ -0,0 +1,88 @@
+import sys
+import os
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+from layout import Layout
+
+
+@pytest.fixture
+def setup_game():
+    pygame.init()
+
+    game = Game()
+
+    yield game
+    game.resize(1600, 900)
+
+
+def test_base_resolution_keeps_original_coordinates():
+    layout = Layout(1600, 900)
+
+    assert layout.point((600, 555)) == (600, 555)
+    assert layout.rect((680, 430, 150, 50)) == pygame.Rect(680, 430, 150, 50)
+    assert layout.font_size(40) == 40
+
+
+def test_smaller_window_scales_positions_and_sizes():
+    layout = Layout(800, 450)
+
+    assert layout.point((600, 556)) == (300, 278)
+    assert layout.size((146, 205)) == (73, 102)
+    assert layout.font_size(40) == 20
+
+
+def test_other_aspect_ratios_are_centred():
+    layout = Layout(1600, 1200)
+
+    assert layout.scale == 1
+    assert layout.point((0, 0)) == (0, 150)
+
+
+def test_resize_moves_click_targets(setup_game):
+    game = setup_game
+
+    game.resize(800, 450)
+    game.handle_event(
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(15, 345))
+    )
+
+    assert game.player_bet == 1
+    assert game.game_ui.one_chip_rect == pygame.Rect(10, 340, 40, 40)
+    assert game.game_controller.reset_button_rect == pygame.Rect(340, 215, 75, 25)
+
+
+def test_resize_event_rebuilds_the_screen(setup_game):
+    game = setup_game
+
+    game.handle_event(pygame.event.Event(pygame.VIDEORESIZE, w=1280, h=720))
+
+    assert game.screen.get_size() == (1280, 720)
+    assert game.background_scaled.get_size() == (1280, 720)
+    assert game.render() == [pygame.Rect(0, 0, 1280, 720)]
+
+
+def test_cards_are_scaled_once_per_resolution(setup_game):
+    game = setup_game
+    game.resize(800, 450)
+    size = game.layout.size(game.assets.CARD_SIZE)
+
+    first = game.assets.card("back_dark", size)
+    second = game.assets.card("back_dark", size)
+
+    assert first is second
+    assert first.get_size() == (73, 102)
+    assert list(game.assets.scaled_images) == [size]
+
+
+def test_base_resolution_uses_the_original_images(setup_game):
+    game = setup_game
+
+    image = game.assets.card("back_dark", game.layout.size(game.assets.CARD_SIZE))
+
+    assert image is game.assets.card("back_dark")
+    assert game.assets.scaled_images == {}
@@ -0,0 +1,43 @@
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+np = pytest.importorskip("numpy")
+
+from monte_carlo import RunningStats, run_simulation, worker_rounds
+
+
+def test_rounds_are_split_over_all_workers():
+    assert worker_rounds(10, 3) == [4, 3, 3]
+    assert sum(worker_rounds(1001, 8)) == 1001
+
+
+def test_merged_stats_match_stats_over_all_values():
+    values = np.random.default_rng(0).integers(-1, 3, size=1000)
+
+    merged = RunningStats.from_array(values[:300]).merge(
+        RunningStats.from_array(values[300:])
+    )
+
+    assert merged.count == 1000
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.variance == pytest.approx(values.var(ddof=1))
+    assert merged.minimum == values.min()
+    assert merged.maximum == values.max()
+
+
+def test_same_seed_and_workers_give_identical_results():
+    first = run_simulation(20000, master_seed=42, workers=2, chunk_size=5000)
+    second = run_simulation(20000, master_seed=42, workers=2, chunk_size=5000)
+
+    assert first.as_dict() == second.as_dict()
+    assert first.histogram.sum() == 20000
+
+
+def test_different_seeds_give_different_results():
+    first = run_simulation(20000, master_seed=1, workers=1)
+    second = run_simulation(20000, master_seed=2, workers=1)
+
+    assert first.as_dict() != second.as_dict()
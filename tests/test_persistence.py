@@ -0,0 +1,142 @@
+import sys
+import os
+import random
+import sqlite3
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from cards import Cards
+from engine import BlackjackEngine
+from enums import GameState
+from persistence import SessionStore
+
+
+def play_rounds(engine, rounds):
+    for _ in range(rounds):
+        engine.place_bet(10)
+        engine.deal()
+        engine.stand()
+        engine.reset()
+
+
+@pytest.fixture
+def setup_store(tmp_path):
+    path = tmp_path / "sessions.db"
+    store = SessionStore(path, player="alice", batch_size=4)
+    yield path, store
+    if store.writer.is_alive():
+        store.close()
+
+
+def test_new_session_starts_with_default_credits(setup_store):
+    path, store = setup_store
+
+    assert store.resume(default_credits=5000) == 5000
+    assert store.session_id is not None
+
+
+def test_broke_session_restarts_with_default_credits(setup_store):
+    path, store = setup_store
+    store.resume(5000)
+    with store.connection:
+        store.connection.execute("UPDATE sessions SET player_credits = 0")
+    store.close()
+
+    resumed = SessionStore(path, player="alice")
+    assert resumed.resume(5000) == 5000
+    resumed.close()
+
+    again = SessionStore(path, player="alice")
+    assert again.resume(1000) == 5000
+    again.close()
+
+
+def test_database_uses_wal_mode(setup_store):
+    path, store = setup_store
+
+    mode = store.connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert mode == "wal"
+
+
+def test_rounds_are_written_and_credits_resume(setup_store):
+    path, store = setup_store
+    engine = BlackjackEngine(
+        player_credits=store.resume(5000), cards=Cards(rng=random.Random(5))
+    )
+    engine.round_listeners.append(store)
+
+    play_rounds(engine, 10)
+    summaries = store.round_summaries()
+    store.close()
+
+    assert [summary[0] for summary in summaries] == list(range(10, 0, -1))
+    assert summaries[0][3] == engine.player_credits
+    assert all(GameState[summary[4]] for summary in summaries)
+
+    resumed = SessionStore(path, player="alice")
+    assert resumed.resume(5000) == engine.player_credits
+    resumed.close()
+
+
+def test_session_counts_rounds(setup_store):
+    path, store = setup_store
+    engine = BlackjackEngine(player_credits=store.resume(5000))
+    engine.round_listeners.append(store)
+
+    play_rounds(engine, 7)
+    store.close()
+
+    connection = sqlite3.connect(path)
+    rounds = connection.execute(
+        "SELECT rounds FROM sessions WHERE player = 'alice'"
+    ).fetchone()[0]
+    connection.close()
+    assert rounds == 7
+
+
+def test_players_have_separate_sessions(setup_store):
+    path, store = setup_store
+    engine = BlackjackEngine(player_credits=store.resume(5000))
+    engine.round_listeners.append(store)
+    play_rounds(engine, 3)
+    store.flush()
+
+    other = SessionStore(path, player="bob")
+
+    assert other.resume(1234) == 1234
+    assert other.session_id != store.session_id
+    other.close()
+
+
+def test_resume_uses_the_player_index(setup_store):
+    path, store = setup_store
+
+    plan = store.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT id, player_credits FROM sessions WHERE player = ?",
+        ("alice",),
+    ).fetchall()
+
+    assert "sessions_player" in " ".join(str(row) for row in plan)
+
+
+def test_locked_database_drops_the_batch_without_stopping_the_writer(tmp_path):
+    path = tmp_path / "locked.db"
+    store = SessionStore(path, player="alice", timeout=0.01)
+    engine = BlackjackEngine(player_credits=store.resume(5000))
+    engine.round_listeners.append(store)
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN EXCLUSIVE")
+
+    play_rounds(engine, 1)
+    store.flush()
+    other.execute("ROLLBACK")
+    other.close()
+    play_rounds(engine, 1)
+    summaries = store.round_summaries()
+    store.close()
+
+    assert store.dropped_rounds == 1
+    assert isinstance(store.last_error, sqlite3.OperationalError)
+    assert [summary[0] for summary in summaries] == [2]
@@ -0,0 +1,104 @@
+import sys
+import os
+import time
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+from enums import GameState
+from profiler import SamplingProfiler, collapse_stack
+
+
+@pytest.fixture
+def setup_profiler():
+    profiler = SamplingProfiler(budget_ms=5, interval=0.0005)
+    profiler.start()
+    yield profiler
+    profiler.stop()
+
+
+def busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_collapse_stack_is_root_first():
+    stack = collapse_stack(sys._getframe())
+
+    assert stack.endswith("test_profiler.py:test_collapse_stack_is_root_first")
+    assert ";" in stack
+
+
+def test_samples_are_taken_inside_frames(setup_profiler):
+    profiler = setup_profiler
+
+    profiler.begin_frame()
+    busy_wait(0.05)
+    profiler.end_frame(GameState.PLAYERS_HAND, "hit")
+
+    assert profiler.frames == 1
+    assert any("busy_wait" in stack for stack in profiler.stacks)
+
+
+def test_slow_frames_record_phase_and_action(setup_profiler):
+    profiler = setup_profiler
+
+    profiler.begin_frame()
+    profiler.end_frame(GameState.BETTING)
+    profiler.begin_frame()
+    busy_wait(0.02)
+    profiler.end_frame(GameState.PLAYERS_HAND, ("chip", 5))
+
+    assert len(profiler.slow_frames) == 1
+    slow_frame = profiler.slow_frames[0]
+    assert slow_frame.phase == GameState.PLAYERS_HAND
+    assert "after chip 5" in slow_frame.describe()
+
+
+def test_collapsed_stacks_are_written_in_flamegraph_format(setup_profiler, tmp_path):
+    profiler = setup_profiler
+    profiler.begin_frame()
+    busy_wait(0.02)
+    profiler.end_frame(GameState.BETTING)
+    path = tmp_path / "profile.folded"
+
+    profiler.write_collapsed(path)
+
+    for line in path.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) > 0
+
+
+def test_game_tracks_last_action_and_draws_overlay():
+    pygame.init()
+    game = Game()
+    profiler = game.enable_profiler()
+
+    game.handle_event(
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(30, 690))
+    )
+    game.render()
+    profiler.stop()
+
+    assert game.last_action == ("chip", 1)
+    assert "profiler" in game.renderer.regions
+
+
+def test_only_recent_slow_frames_are_kept():
+    profiler = SamplingProfiler(budget_ms=-1, max_slow_frames=3)
+
+    for action in range(5):
+        profiler.begin_frame()
+        profiler.end_frame(GameState.BETTING, ("chip", action))
+
+    assert profiler.slow_frame_count == 5
+    assert [frame.last_action for frame in profiler.slow_frames] == [
+        ("chip", 2),
+        ("chip", 3),
+        ("chip", 4),
+    ]
+    assert profiler.overlay_lines()[1] == "slow frames: 5 of 5"
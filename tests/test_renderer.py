@@ -0,0 +1,73 @@
+import sys
+import os
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+
+
+@pytest.fixture
+def setup_game():
+    pygame.init()
+
+    game = Game()
+    game.renderer.invalidate_all()
+    game.render()
+
+    return game
+
+
+def test_first_render_repaints_whole_screen(setup_game):
+    game = setup_game
+
+    game.renderer.invalidate_all()
+
+    assert game.render() == [game.screen.get_rect()]
+
+
+def test_nothing_is_repainted_when_nothing_changed(setup_game):
+    game = setup_game
+
+    assert game.render() == []
+
+
+def test_only_changed_label_is_repainted(setup_game):
+    game = setup_game
+
+    game.player_bet = 25
+    dirty_rects = game.render()
+
+    assert len(dirty_rects) == 1
+    assert dirty_rects[0].collidepoint((250, 20))
+    assert not dirty_rects[0].collidepoint((20, 20))
+
+
+def test_new_card_slot_is_repainted(setup_game):
+    game = setup_game
+
+    game.player_bet = 1
+    game.render()
+    game.game_controller.deal_cards()
+    game.render()
+    game.animator.finish()
+    dirty_rects = game.render()
+
+    assert any(rect.collidepoint((600, 555)) for rect in dirty_rects)
+    assert any(rect.collidepoint((600, 100)) for rect in dirty_rects)
+
+
+def test_removed_regions_are_repainted(setup_game):
+    game = setup_game
+
+    game.player_bet = 1
+    game.game_controller.deal_cards()
+    game.render()
+    game.animator.finish()
+    game.render()
+    game.game_controller.reset_game()
+    dirty_rects = game.render()
+
+    assert any(rect.collidepoint((600, 555)) for rect in dirty_rects)
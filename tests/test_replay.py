@@ -0,0 +1,145 @@
+import sys
+import os
+import random
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from cards import Cards
+from engine import BlackjackEngine
+from enums import GameState
+from hand_history import HandHistoryReader, HandHistoryWriter
+from main import Game
+from replay import (
+    print_report,
+    render_replay,
+    replay_history,
+    replay_seeded,
+    starting_credits,
+)
+
+
+def play_rounds(engine, rounds, stand_on=15):
+    for _ in range(rounds):
+        engine.place_bet(10)
+        engine.deal()
+        while engine.current_phase == GameState.PLAYERS_HAND and (
+            engine.player_score < stand_on
+        ):
+            engine.hit()
+        engine.stand()
+        engine.reset()
+
+
+@pytest.fixture
+def setup_records(tmp_path):
+    path = tmp_path / "hands.bin"
+    engine = BlackjackEngine(player_credits=1000, cards=Cards(rng=random.Random(9)))
+    writer = HandHistoryWriter(path)
+    engine.round_listeners.append(writer)
+    play_rounds(engine, 40)
+    writer.close()
+
+    reader = HandHistoryReader(path)
+    records = list(reader)
+    reader.close()
+
+    return records, engine
+
+
+def test_logged_rounds_replay_to_same_credits(setup_records):
+    records, engine = setup_records
+
+    report = replay_history(records)
+
+    assert report.ok
+    assert report.rounds == 40
+    assert starting_credits(records) == 1000
+
+
+def test_tampered_round_is_reported(setup_records):
+    records, engine = setup_records
+
+    records[5]["player_credits"] += 10
+    records[7]["dealer_cards"] = records[7]["dealer_cards"][:2]
+    report = replay_history(records)
+
+    assert not report.ok
+    assert report.mismatches[0][:2] == (6, "player_credits")
+
+
+def test_seeded_rounds_replay_with_phase_transitions():
+    rounds = []
+    engine = BlackjackEngine(player_credits=500, cards=Cards(rng=random.Random(4)))
+
+    def record(result):
+        rounds.append(
+            {
+                "player_bet": result.player_bet,
+                "actions": result.actions,
+                "phase": result.phase,
+                "player_credits": result.player_credits,
+            }
+        )
+
+    engine.round_listeners.append(record)
+    play_rounds(engine, 30)
+
+    assert replay_seeded(rounds, seed=4, player_credits=500).ok
+    assert not replay_seeded(rounds, seed=5, player_credits=500).ok
+
+
+def test_replay_renders_through_game_ui(setup_records):
+    records, engine = setup_records
+    pygame.init()
+    game = Game(BlackjackEngine(player_credits=starting_credits(records)))
+
+    report = render_replay(game, records[:3], speed=1000)
+
+    assert report.ok
+    assert game.player_credits == records[2]["player_credits"]
+
+
+def test_empty_log_reports_no_rounds(tmp_path, capsys):
+    path = tmp_path / "empty.bin"
+    HandHistoryWriter(path).close()
+    reader = HandHistoryReader(path)
+    records = list(reader)
+    reader.close()
+
+    report = replay_history(records)
+    print_report(report)
+
+    assert report.rounds == 0
+    assert "no rounds" in capsys.readouterr().out
+
+
+def test_render_replay_rejects_non_positive_speed(setup_records):
+    records, engine = setup_records
+    pygame.init()
+    game = Game()
+
+    with pytest.raises(ValueError):
+        render_replay(game, records[:1], speed=0)
+
+
+def test_log_appended_by_two_runs_replays_cleanly(tmp_path):
+    path = tmp_path / "hands.bin"
+    for seed, player_credits in [(9, 1000), (4, 5000)]:
+        engine = BlackjackEngine(
+            player_credits=player_credits, cards=Cards(rng=random.Random(seed))
+        )
+        writer = HandHistoryWriter(path)
+        engine.round_listeners.append(writer)
+        play_rounds(engine, 10)
+        writer.close()
+    reader = HandHistoryReader(path)
+    records = list(reader)
+    reader.close()
+
+    report = replay_history(records)
+
+    assert report.rounds == 20
+    assert report.ok, report.mismatches
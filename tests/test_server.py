@@ -0,0 +1,228 @@
+import sys
+import os
+import asyncio
+import json
+import threading
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from client import RemoteEngine
+from enums import GameState
+from server import TableServer
+
+
+@pytest.fixture
+def setup_server():
+    return TableServer(player_credits=100)
+
+
+def test_tables_keep_separate_state(setup_server):
+    server = setup_server
+
+    first = server.handle_request({"action": "open"})["table"]
+    second = server.handle_request({"action": "open"})["table"]
+    server.handle_request({"action": "bet", "table": first, "value": 25})
+
+    assert (
+        server.handle_request({"action": "state", "table": first})["player_bet"] == 25
+    )
+    assert (
+        server.handle_request({"action": "state", "table": second})["player_bet"] == 0
+    )
+
+
+def test_hole_card_is_not_sent_to_client(setup_server):
+    server = setup_server
+
+    table = server.handle_request({"action": "open"})["table"]
+    server.handle_request({"action": "bet", "table": table, "value": 10})
+    state = server.handle_request({"action": "deal", "table": table})
+
+    if state["dealer_card_hidden"]:
+        assert state["dealer_cards"][1] is None
+    else:
+        assert state["dealer_cards"][1] is not None
+
+
+def test_unknown_table_and_action_are_reported(setup_server):
+    server = setup_server
+
+    assert server.handle_request({"action": "hit", "table": 99})["ok"] is False
+    table = server.handle_request({"action": "open"})["table"]
+    assert server.handle_request({"action": "split", "table": table})["ok"] is False
+
+
+def test_stats_report_actions_and_latency(setup_server):
+    server = setup_server
+
+    table = server.handle_request({"action": "open"})["table"]
+    for _ in range(10):
+        server.handle_request({"action": "state", "table": table})
+
+    stats = server.handle_request({"action": "stats"})
+    table_stats = server.handle_request({"action": "stats", "table": table})
+
+    assert stats["tables"] == 1
+    assert stats["actions"] == 10
+    assert table_stats["actions"] == 10
+    assert table_stats["p99_ms"] >= 0
+
+
+def test_newline_json_protocol_over_tcp(setup_server):
+    server = setup_server
+
+    async def play():
+        tcp_server = await server.start("127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        responses = []
+        for request in [
+            {"action": "open"},
+            {"action": "bet", "table": 1, "value": 5},
+            {"action": "deal", "table": 1},
+            "not json",
+        ]:
+            line = request if isinstance(request, str) else json.dumps(request)
+            writer.write(line.encode() + b"\n")
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return responses
+
+    responses = asyncio.run(play())
+
+    assert responses[0]["table"] == 1
+    assert responses[1]["player_bet"] == 5
+    assert responses[2]["phase"] != GameState.BETTING.name
+    assert responses[3]["ok"] is False
+
+
+def test_non_object_requests_are_rejected(setup_server):
+    server = setup_server
+
+    response = server.handle_request([1])
+
+    assert response == {"ok": False, "error": "request must be a JSON object"}
+
+
+def test_dropped_clients_close_their_tables(setup_server):
+    server = setup_server
+
+    async def connect_and_drop():
+        tcp_server = await server.start("127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        for _ in range(3):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for line in [b'{"action": "open"}\n', b"[1]\n"]:
+                writer.write(line)
+                await writer.drain()
+                await reader.readline()
+            writer.close()
+            await writer.wait_closed()
+        await asyncio.sleep(0.05)
+        tcp_server.close()
+        await tcp_server.wait_closed()
+
+    asyncio.run(connect_and_drop())
+
+    assert server.tables == {}
+
+
+def test_reset_is_refused_until_the_round_is_over(setup_server):
+    server = setup_server
+    table = server.handle_request({"action": "open"})["table"]
+    server.handle_request({"action": "bet", "table": table, "value": 100})
+    server.handle_request({"action": "deal", "table": table})
+    engine = server.engine(table)
+    engine.current_phase = GameState.PLAYERS_HAND
+
+    response = server.handle_request({"action": "reset", "table": table})
+
+    assert response["ok"] is False
+    assert response["phase"] == "PLAYERS_HAND"
+    engine.stand()
+    assert server.handle_request({"action": "reset", "table": table})["ok"] is True
+
+
+@pytest.mark.parametrize("value", [0, -50, 2.5, "10", True, None, float("inf")])
+def test_bets_must_be_positive_integers(setup_server, value):
+    server = setup_server
+    table = server.handle_request({"action": "open"})["table"]
+
+    response = server.handle_request({"action": "bet", "table": table, "value": value})
+
+    assert response["ok"] is False
+    assert server.engine(table).player_bet == 0
+
+
+def test_connections_only_use_their_own_tables(setup_server):
+    server = setup_server
+    first, second = set(), set()
+    table = server.handle_request({"action": "open"}, first)["table"]
+
+    for action in ["hit", "reset", "state", "close"]:
+        response = server.handle_request({"action": action, "table": table}, second)
+        assert response == {"ok": False, "error": "unknown table"}
+    assert server.handle_request({"action": "close", "table": table}, first)["ok"]
+    assert first == set()
+    assert server.tables == {}
+
+
+def test_infinite_bet_keeps_the_connection_open(setup_server):
+    server = setup_server
+
+    async def send_infinity():
+        tcp_server = await server.start("127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = []
+        for line in [
+            b'{"action": "open"}\n',
+            b'{"action": "bet", "table": 1, "value": Infinity}\n',
+            b'{"action": "state", "table": 1}\n',
+        ]:
+            writer.write(line)
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        await writer.wait_closed()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        return responses
+
+    opened, bet, state = asyncio.run(send_infinity())
+
+    assert bet["ok"] is False
+    assert state["ok"] is True
+
+
+def test_remote_engine_plays_against_server(setup_server):
+    server = setup_server
+    loop = asyncio.new_event_loop()
+    tcp_server = loop.run_until_complete(server.start("127.0.0.1", 0))
+    port = tcp_server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    try:
+        engine = RemoteEngine("127.0.0.1", port)
+        assert engine.place_bet(10)
+        assert engine.deal()
+        if engine.current_phase == GameState.PLAYERS_HAND:
+            engine.stand()
+        assert engine.current_phase != GameState.PLAYERS_HAND
+        assert engine.player_credits in (90, 100, 110, 115)
+        engine.reset()
+        assert engine.current_phase == GameState.BETTING
+        engine.close()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        tcp_server.close()
+        loop.run_until_complete(tcp_server.wait_closed())
+        loop.close()
@@ -0,0 +1,51 @@
+import sys
+import os
+import random
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from cards import Cards
+from shoe import Shoe
+
+
+def test_shoe_holds_every_card_once_per_deck():
+    shoe = Shoe(decks=6, rng=random.Random(1))
+
+    drawn = Counter(shoe.draw() for _ in range(52 * 6))
+
+    assert len(drawn) == 52
+    assert set(drawn.values()) == {6}
+
+
+def test_cut_card_triggers_reshuffle_between_rounds():
+    shoe = Shoe(decks=1, penetration=0.5, rng=random.Random(1))
+
+    for _ in range(25):
+        shoe.draw()
+    assert shoe.shuffle_if_needed() is False
+
+    shoe.draw()
+    assert shoe.cut_card_reached()
+    assert shoe.shuffle_if_needed() is True
+    assert shoe.remaining() == 52
+
+
+def test_empty_shoe_reshuffles_when_drawing():
+    shoe = Shoe(decks=1, rng=random.Random(1))
+
+    for _ in range(52):
+        shoe.draw()
+    shoe.draw()
+
+    assert shoe.shuffle_count == 2
+    assert shoe.remaining() == 51
+
+
+def test_same_rng_seed_deals_same_cards():
+    first = Cards(rng=random.Random(5))
+    second = Cards(rng=random.Random(5))
+
+    assert [first.select_card() for _ in range(20)] == [
+        second.select_card() for _ in range(20)
+    ]
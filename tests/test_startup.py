@@ -0,0 +1,60 @@
+import sys
+import os
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+from startup import StartupProfile
+
+
+@pytest.fixture
+def setup_fast_game():
+    game = Game(fast_start=True, startup_profile=StartupProfile())
+
+    return game
+
+
+def test_fast_start_only_uses_the_bundled_font(setup_fast_game):
+    game = setup_fast_game
+
+    assert not game.fonts.use_system_fonts
+
+
+def test_fast_start_game_is_playable(setup_fast_game):
+    game = setup_fast_game
+
+    game.betting_logic.place_bet(10)
+    game.game_controller.deal_cards()
+    game.render()
+
+    assert len(game.game_controller.player_cards) == 2
+
+
+def test_first_frame_is_reported(setup_fast_game, capsys):
+    game = setup_fast_game
+    game.startup_profile.mark("game setup")
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    game.run()
+
+    assert [mark[0] for mark in game.startup_profile.marks] == [
+        "start",
+        "game setup",
+        "first frame",
+    ]
+    assert "time to first frame" in capsys.readouterr().out
+
+
+def test_startup_profile_reports_each_step():
+    profile = StartupProfile(started_at=0.0)
+    profile.marks += [("imports", 0.1), ("first frame", 0.25)]
+
+    assert profile.elapsed_ms("imports") == pytest.approx(100)
+    assert profile.report().splitlines() == [
+        "imports: +100.0 ms",
+        "first frame: +150.0 ms",
+        "time to first frame: 250.0 ms",
+    ]
@@ -0,0 +1,259 @@
+import sys
+import os
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main import Game
+from cards import RANK_VALUES
+from enums import GameState
+from replay import ScriptedCards
+from table import TableEngine
+from table_controller import TableController
+
+
+def card_for_value(value):
+    return RANK_VALUES.index(value)
+
+
+def stacked_cards(values):
+    return ScriptedCards(card_for_value(value) for value in values)
+
+
+@pytest.fixture
+def setup_table():
+    def create_table(seats, *values, bets=None):
+        table = TableEngine(seats, player_credits=1000, cards=stacked_cards(values))
+        for seat, bet in enumerate(bets or [10] * seats):
+            table.place_bet(bet, seat=seat)
+        return table
+
+    return create_table
+
+
+def hand_values(table, hand):
+    return [RANK_VALUES[card % 13] for card in table.hand_cards[hand]]
+
+
+def test_seat_count_is_limited():
+    with pytest.raises(ValueError):
+        TableEngine(8)
+    with pytest.raises(ValueError):
+        TableEngine(0)
+
+
+def test_bets_go_to_the_selected_seat(setup_table):
+    table = setup_table(3, bets=[0, 0, 0])
+
+    table.select_seat(2)
+    table.place_bet(25)
+
+    assert list(table.seat_bets) == [0, 0, 25]
+    assert table.player_bet == 25
+    assert not table.place_bet(1000, seat=0)
+
+
+def test_cards_are_dealt_round_robin(setup_table):
+    table = setup_table(2, 2, 3, 10, 4, 5, 7)
+
+    table.deal()
+
+    assert hand_values(table, 0) == [2, 4]
+    assert hand_values(table, 1) == [3, 5]
+    assert table.dealer_score == 10
+    assert table.dealer_card_hidden
+    assert table.active_hand == 0
+
+
+def test_seats_without_bets_sit_out(setup_table):
+    table = setup_table(3, 2, 3, 10, 4, 5, 7, bets=[10, 0, 10])
+
+    table.deal()
+
+    assert list(table.hand_seats) == [0, 2]
+
+
+def test_dealer_blackjack_settles_every_seat(setup_table):
+    table = setup_table(2, 11, 5, 11, 10, 6, 10)
+
+    table.deal()
+
+    assert table.current_phase == GameState.ROUND_OVER
+    assert table.hand_phase(0) == GameState.DRAW
+    assert table.hand_phase(1) == GameState.DEALER_BLACKJACK
+    assert table.player_credits == 990
+
+
+def test_player_blackjack_is_paid_and_skipped(setup_table):
+    table = setup_table(2, 11, 5, 10, 10, 6, 7)
+
+    table.deal()
+
+    assert table.hand_phase(0) == GameState.BLACKJACK
+    assert table.player_credits == 1015
+    assert table.active_hand == 1
+
+
+def test_one_dealer_pass_settles_all_seats(setup_table):
+    table = setup_table(3, 10, 10, 10, 6, 9, 8, 7, 6, 9)
+    table.deal()
+
+    table.stand()
+    table.stand()
+    table.stand()
+
+    assert table.dealer_score == 21
+    assert [table.hand_phase(hand) for hand in range(3)] == [
+        GameState.DEALER_WON,
+        GameState.DEALER_WON,
+        GameState.DEALER_WON,
+    ]
+    assert table.player_credits == 970
+
+
+def test_busted_seats_lose_without_the_dealer_drawing(setup_table):
+    table = setup_table(1, 10, 10, 6, 7, 9, bets=[10])
+    table.deal()
+
+    table.hit()
+
+    assert table.current_phase == GameState.BUSTED
+    assert table.dealer_cards == [card_for_value(10), card_for_value(7)]
+    assert not table.dealer_card_hidden
+
+
+def test_split_plays_both_hands_in_order(setup_table):
+    table = setup_table(1, 8, 10, 8, 7, 3, 10, 10, bets=[10])
+    table.deal()
+
+    assert table.can_split()
+    assert table.split()
+
+    assert table.hand_count == 2
+    assert hand_values(table, 0) == [8, 3]
+    assert hand_values(table, 1) == [8, 10]
+    assert table.active_hand == 0
+    table.hit()
+    table.stand()
+    assert table.active_hand == 1
+    table.stand()
+    assert table.current_phase == GameState.ROUND_OVER
+    assert table.hand_phase(0) == GameState.PLAYER_WON
+    assert table.hand_phase(1) == GameState.PLAYER_WON
+    assert table.player_credits == 1020
+
+
+def test_split_aces_get_one_card_and_no_blackjack(setup_table):
+    table = setup_table(1, 11, 9, 11, 8, 10, 10, bets=[10])
+    table.deal()
+
+    table.split()
+
+    assert table.current_phase == GameState.ROUND_OVER
+    assert [table.hand_phase(hand) for hand in range(2)] == [
+        GameState.PLAYER_WON,
+        GameState.PLAYER_WON,
+    ]
+    assert table.player_credits == 1020
+
+
+def test_split_needs_a_pair_and_credits(setup_table):
+    table = setup_table(1, 8, 10, 9, 7, bets=[10])
+    table.deal()
+    assert not table.can_split()
+
+    table = TableEngine(1, player_credits=10, cards=stacked_cards([8, 10, 8, 7]))
+    table.place_bet(10)
+    table.deal()
+    assert not table.can_split()
+
+
+def test_listeners_get_one_result_per_hand(setup_table):
+    table = setup_table(2, 10, 10, 10, 9, 7, 7)
+    results = []
+    table.round_listeners.append(results.append)
+    table.deal()
+
+    table.stand()
+    table.stand()
+
+    assert [result.phase for result in results] == [
+        GameState.PLAYER_WON,
+        GameState.DRAW,
+    ]
+    assert results[-1].player_credits == table.player_credits
+    assert results[0].actions == ["deal", "stand"]
+
+
+def test_changed_seats_follow_the_active_hand(setup_table):
+    table = setup_table(3, 10, 10, 10, 6, 9, 8, 7, 6)
+    table.deal()
+    table.changed_seats = set()
+
+    table.stand()
+
+    assert table.changed_seats == {0, 1}
+
+
+def test_single_seat_api_follows_the_active_hand(setup_table):
+    table = setup_table(2, 2, 3, 10, 4, 5, 7)
+    table.deal()
+    table.stand()
+
+    assert table.player_cards == [card_for_value(3), card_for_value(5)]
+    assert table.player_score == 8
+    assert table.player_hand.score == 8
+
+
+def test_game_plays_several_seats():
+    pygame.init()
+    game = Game(seats=3)
+    game.render()
+
+    game.handle_event(
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(600, 600))
+    )
+    game.betting_logic.place_bet(10)
+    game.game_controller.deal_cards()
+
+    assert isinstance(game.game_controller, TableController)
+    assert list(game.engine.seat_bets) == [0, 10, 0]
+    assert game.game_controller.player_cards == []
+    assert game.game_ui.player_card_boxes == []
+
+
+def test_only_changed_seats_are_repainted():
+    pygame.init()
+    game = Game(seats=3)
+    for seat in range(3):
+        game.engine.place_bet(10, seat=seat)
+    game.engine.cards = stacked_cards([2, 3, 4, 10, 2, 3, 4, 7, 2, 2, 2, 2])
+    game.game_controller.deal_cards()
+    game.render()
+    game.animator.finish()
+    game.render()
+
+    game.game_controller.handle_hit()
+    dirty_rects = game.render()
+
+    seat_rect = game.layout.rect(game.game_controller.seat_rect(0))
+    other_seat = game.layout.rect(game.game_controller.seat_rect(2))
+    assert any(rect.colliderect(seat_rect) for rect in dirty_rects)
+    assert not any(rect.colliderect(other_seat) for rect in dirty_rects)
+
+
+@pytest.mark.parametrize("hand_sizes", [[6], [11], [2, 2, 2, 2], [5, 3, 7, 2]])
+def test_seat_cards_stay_inside_the_seat_region(hand_sizes):
+    pygame.init()
+    game = Game(seats=7)
+    controller = game.game_controller
+
+    for seat in [0, 6]:
+        region = pygame.Rect(controller.seat_rect(seat))
+        hands = [[0] * size for size in hand_sizes]
+        for positions in controller.hand_positions(seat, hands):
+            for left, top in positions:
+                card = pygame.Rect(round(left), round(top), 73, 102)
+                assert region.contains(card)
@@ -0,0 +1,55 @@
+import sys
+import os
+import pytest
+import pygame
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from text_cache import TextCache
+
+
+@pytest.fixture
+def setup_text_cache():
+    pygame.init()
+
+    font = pygame.font.SysFont("Arial", 40, bold=True)
+    text_cache = TextCache(max_size=2)
+
+    return font, text_cache
+
+
+def test_same_text_is_rendered_once(setup_text_cache):
+    font, text_cache = setup_text_cache
+
+    first = text_cache.render(font, "Deal", True, (0, 0, 0))
+    second = text_cache.render(font, "Deal", True, (0, 0, 0))
+
+    assert first is second
+    assert text_cache.misses == 1
+    assert text_cache.hits == 1
+
+
+def test_colour_and_antialias_are_part_of_the_key(setup_text_cache):
+    font, text_cache = setup_text_cache
+
+    text_cache.render(font, "Hit", True, "white")
+    text_cache.render(font, "Hit", True, "red")
+    text_cache.render(font, "Hit", False, "red")
+
+    assert text_cache.misses == 3
+    assert text_cache.hits == 0
+
+
+def test_least_recently_used_text_is_evicted(setup_text_cache):
+    font, text_cache = setup_text_cache
+
+    text_cache.render(font, "Credits: 5000", True, "white")
+    text_cache.render(font, "Current Bet: 0", True, "white")
+    text_cache.render(font, "Credits: 5000", True, "white")
+    text_cache.render(font, "Current Bet: 5", True, "white")
+
+    assert text_cache.stats()["size"] == 2
+    text_cache.render(font, "Credits: 5000", True, "white")
+    assert text_cache.hits == 2
+    text_cache.render(font, "Current Bet: 0", True, "white")
+    assert text_cache.misses == 4